@@ -7,10 +7,17 @@
 
 # Python program to automatically test and assess the performance of CRC
 from generators import get_generators
-from crc_otr import crc_check
-import numpy as np
+from crc_otr import crc_check, crc_encode, crc_decode, crc_decode_many, crc_bytes, Crc, RollingCrc, crc_boundaries
+from crc_otr import crc_parallel
+from crc_otr.aio import crc_stream
+from crc_otr.bench import measure
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
 import logging
+import os
 import random
+import subprocess
+import sys
 import time
 
 
@@ -19,14 +26,8 @@ def get_random_sequence(n):
     return bin(random.randint(0, 2 ** n - 1))
 
 
-# Driver code
-if __name__ == "__main__":
-    # Logging configuration
-    logging.basicConfig(filename='benchmark.log',
-                        filemode='w',
-                        level=logging.DEBUG,
-                        format='%(asctime)s:(levelname)s:%(message)s')
-
+# Function to benchmark CRC for all commonly used generators
+def benchmark_generators():
     # Iterate over all commonly used generators
     for gen in get_generators():
         # Get current generator polynomial and algorithm name
@@ -35,22 +36,187 @@ if __name__ == "__main__":
 
         # Generate information sequences of variable length
         for sequence_length in (1 << s for s in range(0, 16)):  # range(1, 10001)
-            # Measure execution times
-            execution_time = []
-            # Generate 10 random information sequences with current length
-            for iteration in range(0, 10):
-                sequence = int(get_random_sequence(sequence_length), 2)
-                # Initiate cyclic redundancy check
-                # logging.debug("CRC check started...")
-                # logging.debug("\t* encoded sequence:     {:b}".format(int(sequence)))
-                # logging.debug("\t* generator polynomial: {:b}".format(int(generator)))
-                start_time = time.time()
-                # Perform cyclic redundancy check
-                crc_remainder = crc_check(sequence=sequence, generator=generator)
-                # End cyclic redundancy check
-                end_time = time.time()
-                time_diff = 1000 * (end_time - start_time)  # [ms]
-                execution_time.append(time_diff)
-                # logging.debug("CRC check took {} ms (RESULT = {:b}).".format(time_diff, crc_remainder))
-            # Calculate mean execution time for this pair
-            print("{},{},{},{}".format(algorithm, generator.bit_length()-1, sequence_length, np.mean(execution_time)))
+            sequence = int(get_random_sequence(sequence_length), 2)
+            # Measure execution times (warm-up, then repeated samples - see crc_otr.bench) of the bit-serial
+            # engine, so the results stay comparable with benchmark.csv
+            statistics = measure(lambda: crc_check(sequence=sequence, generator=generator, engine='bitwise'),
+                                 min_time=0.05)
+            # Median execution time for this pair [ms]
+            print("{},{},{},{}".format(algorithm, generator.bit_length()-1, sequence_length,
+                                       statistics['median'] / 1e6))
+
+
+# Function to compare the CRC engines against the bit-serial CRC
+def benchmark_engines():
+    # Generators used by most of the traffic (wide polynomials)
+    names = ['CRC-32', 'CRC-32C', 'CRC-64-ECMA']
+    print("Name,PolynomialDegree,SequenceLength,Engine,ExecutionTime")
+    for gen in get_generators():
+        if gen[1] not in names:
+            continue
+        generator = int(gen[0], 2)
+        algorithm = gen[1]
+
+        # Same sequence lengths as above, and beyond (up to 1 Mbit)
+        for sequence_length in (1 << s for s in range(0, 21)):
+            sequence = int(get_random_sequence(sequence_length), 2)
+            for engine in ['bitwise', 'bulk', 'barrett', 'table', 'slicing4', 'slicing8', 'slicing16']:
+                # The bit-serial CRC is too slow for the longest sequences
+                if engine == 'bitwise' and sequence_length > 32768:
+                    continue
+                statistics = measure(lambda: crc_check(sequence=sequence, generator=generator, engine=engine),
+                                     min_time=0.05)
+                print("{},{},{},{},{}".format(algorithm, generator.bit_length()-1, sequence_length,
+                                              engine, statistics['median'] / 1e6))  # [ms]
+
+
+# Function to compare the batch API against a Python loop over crc_decode
+def benchmark_batch():
+    print("Name,PolynomialDegree,FrameLength,Frames,Loop,Batch")
+    for gen in get_generators():
+        generator = int(gen[0], 2)
+        algorithm = gen[1]
+        # Short frames (up to 64 bytes), as validated by a gateway
+        for frame_length in (8, 16, 32, 64):
+            payload_length = 8 * frame_length - (generator.bit_length() - 1)
+            frames = [crc_encode(int(get_random_sequence(payload_length), 2), generator) for _ in range(0, 100000)]
+            # Python loop over crc_decode
+            start_time = time.perf_counter()
+            [crc_decode(frame, generator) for frame in frames]
+            loop_time = 1000 * (time.perf_counter() - start_time)  # [ms]
+            # Batch API
+            start_time = time.perf_counter()
+            crc_decode_many(frames, generator)
+            batch_time = 1000 * (time.perf_counter() - start_time)  # [ms]
+            print("{},{},{},{},{},{}".format(algorithm, generator.bit_length()-1, frame_length,
+                                             len(frames), loop_time, batch_time))
+
+
+# Function to measure the time to import crc_otr and run the first CRC, in a fresh interpreter
+def benchmark_import():
+    # The first CRC with a standard generator uses the stored tables, unless the store is disabled
+    first_crc = "crc_check(1 << 4096, 0x142F0E1EBA9EA3693, engine='slicing8')"
+    statements = [("Interpreter", "pass"),
+                  ("Import", "import crc_otr"),
+                  ("FirstCrcStored", "from crc_otr import crc_check; " + first_crc),
+                  ("FirstCrcComputed", "import crc_otr.store; crc_otr.store._index = {}; "
+                                       "from crc_otr import crc_check; " + first_crc)]
+    print("Statement,ExecutionTime")
+    for name, statement in statements:
+        execution_time = []
+        for iteration in range(0, 20):
+            start_time = time.perf_counter()
+            subprocess.run([sys.executable, "-c", statement], check=True)
+            execution_time.append(1000 * (time.perf_counter() - start_time))  # [ms]
+        # The fastest run is the least disturbed by other processes
+        print("{},{}".format(name, min(execution_time)))
+
+
+# Function to measure how long a CRC over a large payload stalls the asyncio event loop
+def benchmark_async():
+    # Coroutine measuring the largest delay of a 1 ms periodic task while the CRC runs
+    async def measure_stall(crc_task):
+        loop = asyncio.get_running_loop()
+        stall = 0
+        task = asyncio.ensure_future(crc_task)
+        while not task.done():
+            start_time = loop.time()
+            await asyncio.sleep(0.001)
+            stall = max(stall, loop.time() - start_time - 0.001)
+        await task
+        return 1000 * stall  # [ms]
+
+    # CRC of a stream reader holding the whole payload (after)
+    async def crc_reader(payload, executor=None):
+        reader = asyncio.StreamReader(limit=len(payload) + 1)
+        reader.feed_data(payload)
+        reader.feed_eof()
+        return await crc_stream(reader, executor=executor)
+
+    # CRC computed inside the event loop (before)
+    async def crc_inline(payload):
+        await asyncio.sleep(0)
+        return Crc(data=payload).crc
+
+    print("Name,PayloadSize,Mode,MaxStall,ExecutionTime")
+    with ProcessPoolExecutor(max_workers=1) as processes:
+        processes.submit(int).result()  # start the worker process before measuring
+        for payload_size in (1 << 20, 1 << 22, 1 << 24):
+            payload = random.randbytes(payload_size)
+            modes = [("inline", lambda: crc_inline(payload)),
+                     ("threads", lambda: crc_reader(payload)),
+                     ("processes", lambda: crc_reader(payload, processes))]
+            for mode, crc_task in modes:
+                start_time = time.perf_counter()
+                stall = asyncio.run(measure_stall(crc_task()))
+                execution_time = 1000 * (time.perf_counter() - start_time)  # [ms]
+                print("{},{},{},{},{}".format('CRC-32', payload_size, mode, stall, execution_time))
+
+
+# Function to measure the throughput of the rolling CRC against recomputing the CRC of each window
+def benchmark_rolling():
+    # Recompute the CRC of the window at each byte (before)
+    def recompute(data, window):
+        for end in range(window, len(data) + 1):
+            crc_bytes(data[end - window:end])
+
+    # Slide the window one byte at a time (after)
+    def roll(data, window):
+        rolling = RollingCrc(window)
+        for out_byte, in_byte in zip(data, data[window:]):
+            rolling.roll(out_byte, in_byte)
+
+    print("Name,Window,Method,DataSize,Throughput")
+    for window in (16, 48, 256):
+        # Recomputing is O(window) per byte, so it is measured on less data
+        modes = [("recompute", recompute, 1 << 16),
+                 ("roll", roll, 1 << 22),
+                 ("chunker", lambda data, window: list(crc_boundaries(data, window)), 1 << 22)]
+        for mode, function, data_size in modes:
+            data = memoryview(random.randbytes(data_size))
+            statistics = measure(lambda: function(data, window), min_time=0, min_samples=3)
+            throughput = data_size / statistics['median'] * 1000  # bytes/ns -> MB/s
+            print("{},{},{},{},{}".format('CRC-32', window, mode, data_size, throughput))
+
+
+# Function to measure the scaling of the parallel CRC with the number of worker processes
+def benchmark_parallel():
+    data = random.randbytes(1 << 26)
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print("Name,Workers,DataSize,Throughput,Speedup")
+    baseline = None
+    for workers in counts:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            crc_parallel(data, workers=workers, executor=executor)  # start the worker processes
+            statistics = measure(lambda: crc_parallel(data, workers=workers, executor=executor),
+                                 min_time=0, min_samples=3)
+        baseline = baseline or statistics['median']
+        throughput = len(data) / statistics['median'] * 1000  # bytes/ns -> MB/s
+        print("{},{},{},{},{:.2f}".format('CRC-32', workers, len(data), throughput, baseline / statistics['median']))
+
+
+# Driver code
+if __name__ == "__main__":
+    # Logging configuration
+    logging.basicConfig(filename='benchmark.log',
+                        filemode='w',
+                        level=logging.DEBUG,
+                        format='%(asctime)s:(levelname)s:%(message)s')
+
+    # Run the selected benchmark (`engines` compares CRC engines, `batch` the batch API,
+    # `import` the startup time, `async` the event loop stall, `rolling` the rolling CRC,
+    # `parallel` the scaling of the parallel CRC)
+    if len(sys.argv) > 1 and sys.argv[1] == 'engines':
+        benchmark_engines()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'batch':
+        benchmark_batch()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'import':
+        benchmark_import()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'async':
+        benchmark_async()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'rolling':
+        benchmark_rolling()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'parallel':
+        benchmark_parallel()
+    else:
+        benchmark_generators()
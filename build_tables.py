@@ -0,0 +1,16 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/15
+# ---------------------------------------------------------------------------
+
+# Python program to regenerate the store of precomputed lookup tables (crc_otr/tables.bin)
+from crc_otr.store import build_store, store_path, stored_generators
+
+
+# Driver code
+if __name__ == "__main__":
+    # Commonly used generator polynomials, and the generators of the standard CRC algorithms
+    count = build_store(store_path, stored_generators())
+    print("{}: {} generator polynomials".format(store_path, count))
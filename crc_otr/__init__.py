@@ -6,6 +6,39 @@
 # ---------------------------------------------------------------------------
 
 # __init__.py
+from .crc_otr import crc_bitwise
+from .crc_otr import crc_bulk
+from .barrett import crc_barrett
 from .crc_otr import crc_check
+from .crc_otr import set_engine
+from .dispatch import last_engine
 from .crc_otr import crc_encode
 from .crc_otr import crc_decode
+from .bitseq import BitSeq
+from .buffer import crc_bytes_update
+from .buffer import crc_bytes
+from .buffer import crc_bytes_check
+from .buffer import crc_bytes_decode
+from .buffer import crc_bytes_encode
+from .buffer import crc_iov
+from .stream import Crc
+from .rolling import RollingCrc
+from .rolling import crc_boundaries
+from .file import crc_file
+from .filecache import FileCrcCache
+from .combine import crc_combine
+from .combine import crc_parallel
+from .combine import crc_patch
+from .batch import crc_check_many
+from .batch import crc_decode_many
+from .correct import crc_correct
+from .spec import CrcSpec
+from .spec import get_spec
+from .spec import crc_spec
+from .cache import cache_info
+from .cache import cache_resize
+from .cache import cache_clear
+from .instrument import stats_enable
+from .instrument import stats_disable
+from .instrument import stats_snapshot
+from .instrument import stats_reset
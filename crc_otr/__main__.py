@@ -0,0 +1,125 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to print or check the CRC of files (`python -m crc_otr`)
+from .generators import get_generator, get_generators
+from .spec import CrcSpec, aliases, catalogue, get_spec
+from .file import crc_file
+from .filecache import FileCrcCache, default_cache_path
+from .crc_otr import engines
+import argparse
+import os
+import sys
+
+
+# Function to return the CRC of a file (`-` for standard input) as hexadecimal digits
+def file_hexdigest(path, generator, chunk_size, engine, cache=None):
+    if path == '-':
+        crc = crc_file(sys.stdin.buffer, generator, chunk_size, engine)
+    else:
+        crc = crc_file(path, generator, chunk_size, engine, cache)
+    if isinstance(generator, CrcSpec):
+        return "{:0{}x}".format(crc, 2 * generator.digest_size)
+    return "{:0{}x}".format(crc, 2 * ((generator.bit_length() + 6) // 8))
+
+
+# Function to verify the checksums listed in a file (output of this program)
+def check_files(checksum_path, generator, chunk_size, engine, cache=None):
+    failed = 0
+    with (sys.stdin if checksum_path == '-' else open(checksum_path, 'r', encoding='utf-8')) as checksums:
+        for line in checksums:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+            expected, _, path = line.partition('  ')
+            try:
+                ok = file_hexdigest(path, generator, chunk_size, engine, cache) == expected.lower()
+            except OSError as exc:
+                print("{}: FAILED open or read ({})".format(path, exc.strerror), file=sys.stderr)
+                failed += 1
+                continue
+            print("{}: {}".format(path, "OK" if ok else "FAILED"))
+            failed += not ok
+    if failed:
+        print("WARNING: {} computed checksum(s) did NOT match".format(failed), file=sys.stderr)
+    return 1 if failed else 0
+
+
+# Function to return the standard CRC algorithm, or the generator polynomial, given its name
+def resolve_generator(name):
+    names = {generator_name.upper() for _, generator_name in get_generators()}
+    key = name.upper()
+    # Names of generator polynomials (ex. CRC-8, CRC-32) keep the plain polynomial division, so only full names
+    # from the catalogue (ex. CRC-32/ISO-HDLC) and aliases that are not names of generators select an algorithm
+    if key in catalogue:
+        if key in names:
+            raise ValueError('Ambiguous generator name.')
+        return get_spec(key)
+    if key in aliases and key not in names:
+        return get_spec(key)
+    return get_generator(name)
+
+
+# Driver code
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m crc_otr',
+                                     description='Print or check CRC checksums of files.')
+    parser.add_argument('files', nargs='*', default=['-'],
+                        help='files to checksum (`-` or none for standard input)')
+    parser.add_argument('-c', '--check', action='store_true',
+                        help='read checksums from the files and check them')
+    parser.add_argument('-g', '--generator', default='CRC-32/ISO-HDLC',
+                        help='standard CRC algorithm from the catalogue (ex. CRC-32/ISO-HDLC as in zlib, or '
+                             'CRC-32/ISCSI), or generator polynomial: a name (ex. CRC-32) or a binary/hex number '
+                             'for the plain polynomial division (no initial value, reflection or final XOR) '
+                             '(default: CRC-32/ISO-HDLC)')
+    parser.add_argument('-e', '--engine', choices=list(engines),
+                        help='CRC engine (default: picked by the dispatcher from the generator and the chunk size)')
+    parser.add_argument('--chunk-size', type=int, default=1 << 20,
+                        help='number of bytes fed to the CRC engine at a time (default: 1 MiB)')
+    parser.add_argument('--cache', nargs='?', const=default_cache_path, default=os.environ.get('CRC_OTR_CACHE'),
+                        metavar='PATH',
+                        help='skip reading files unchanged since their CRC was stored in the verification cache '
+                             '(default path: {}; enabled by the CRC_OTR_CACHE environment variable)'
+                             .format(default_cache_path))
+    parser.add_argument('--no-cache', action='store_true',
+                        help='do not use the verification cache')
+    parser.add_argument('--rebuild', action='store_true',
+                        help='read all files, and replace their entries in the verification cache')
+    args = parser.parse_args(argv)
+
+    try:
+        generator = resolve_generator(args.generator)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    cache = None
+    if (args.cache or args.rebuild) and not args.no_cache:
+        try:
+            cache = FileCrcCache(args.cache, rebuild=args.rebuild)
+        except Exception as exc:  # OSError or sqlite3.Error: the files are read without the cache
+            print("crc_otr: verification cache not available ({})".format(exc), file=sys.stderr)
+
+    status = 0
+    try:
+        for path in args.files:
+            if args.check:
+                status |= check_files(path, generator, args.chunk_size, args.engine, cache)
+                continue
+            try:
+                print("{}  {}".format(file_hexdigest(path, generator, args.chunk_size, args.engine, cache), path))
+            except OSError as exc:
+                print("{}: {}".format(path, exc.strerror), file=sys.stderr)
+                status = 1
+    finally:
+        if cache is not None:
+            cache.close()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides asyncio-friendly cyclic redundancy check tooling
+under the `crc_otr` package. The payload is read from an
+`asyncio.StreamReader` one chunk at a time, and long chunks are processed
+in a thread or process pool (see `Crc.update_async`) - so a CRC over a
+large payload does not stall the other tasks of the event loop.
+
+Functions:
+----------
+    crc_stream(StreamReader, int, int, Executor, str) : int
+        Calculates the CRC check sequence of the data read from a stream reader.
+"""
+
+# Import libraries
+import asyncio
+from .stream import Crc
+
+
+# Function to calculate CRC of the data read from a stream reader
+async def crc_stream(reader, generator=0b100000100110000010001110110110111, chunk_size=1 << 20,
+                     executor=None, engine=None):
+    """Calculates the CRC check sequence of the data read from the given
+    stream reader (`reader`, ex. `asyncio.StreamReader`) until the end of
+    the stream, using the provided generator polynomial (`generator`). The
+    data is read `chunk_size` bytes at a time; chunks of at least
+    `async_inline_limit` bytes are processed in the executor (`executor`,
+    the default thread pool of the event loop if None), shorter ones inline.
+    If generator is not passed as an argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        reader : StreamReader
+            stream reader supporting `readexactly` (ex. asyncio.StreamReader)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC,
+            or the parameters of a standard CRC algorithm (CrcSpec)
+        chunk_size : int
+            number of bytes read and fed to the CRC engine at a time
+        executor : Executor
+            thread or process pool used for long chunks (optional)
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_stream(StreamReader, int, int, Executor, str) : int
+            CRC check sequence (a binary number) of the data read from the stream
+
+    Raises:
+    -------
+        ValueError : if `chunk_size` is not a positive number
+
+    Examples:
+    ---------
+        >>> async def main():
+        ...     reader = asyncio.StreamReader()
+        ...     reader.feed_data(b'\\x6d')
+        ...     reader.feed_eof()
+        ...     return await crc_stream(reader, 0b10101)
+        >>> asyncio.run(main())
+        0b1011
+    """
+    if not chunk_size > 0:
+        raise ValueError('Invalid chunk size.')
+    crc = Crc(generator, engine=engine)
+    while True:
+        try:
+            chunk = await reader.readexactly(chunk_size)
+        except asyncio.IncompleteReadError as exc:
+            chunk = exc.partial  # last chunk (end of the stream)
+        if not chunk:
+            break
+        await crc.update_async(chunk, executor)
+        if len(chunk) < chunk_size:
+            break
+    return crc.crc
@@ -0,0 +1,342 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides tooling to evaluate generator polynomials of the
+cyclic redundancy check tool (`crc_otr`). An error pattern goes undetected
+when it is itself a codeword - a multiple of the generator polynomial - so
+the error detection capability of a generator follows from the weights of
+its codewords: the minimum Hamming distance (HD) for a codeword length is
+the weight of the lightest codeword that fits in it, and the weight
+distribution counts the undetected error patterns of each weight.
+
+Since the generator has a nonzero constant term, every codeword shifted
+down to bit 0 is still a codeword - so only the codewords with bit 0 set
+are enumerated, indexed by their highest bit (span). The positions of all
+but the last one or two bits are enumerated, and the last ones are looked
+up by their syndrome (x^i mod g(x)) in an index built once. The spans are
+split between worker processes.
+
+Functions:
+----------
+    hamming_distance(int, int, int, int) : int
+        Returns the minimum Hamming distance of the given generator polynomial for a codeword length.
+    hamming_distance_table(int, int, int, int) : list
+        Returns the minimum Hamming distance of the given generator polynomial as a function of codeword length.
+    hamming_weights(int, int, int, int) : dict
+        Returns the number of undetected error patterns of each weight for a codeword length.
+"""
+
+# Import libraries
+from array import array
+from bisect import bisect_left
+
+# Number of spans counted per task given to a worker process
+_block_size = 64
+# Index of syndromes of the worker process (set by `_init_worker`)
+_index = None
+
+
+# Class to index the syndromes of single bits and pairs of bits of a generator polynomial
+class _SyndromeIndex:
+    __slots__ = ('syndromes', 'singles', 'shift', 'pairs', 'pairs_limit')
+
+    def __init__(self, generator, length):
+        width = generator.bit_length() - 1
+        # Syndromes of single bits: x^i mod g(x)
+        self.syndromes = []
+        syndrome = 1
+        for _ in range(length):
+            self.syndromes.append(syndrome)
+            syndrome <<= 1
+            if syndrome >> width:
+                syndrome ^= generator
+        # Syndrome -> positions i >= 1 (ascending)
+        self.singles = {}
+        for i in range(1, length):
+            self.singles.setdefault(self.syndromes[i], []).append(i)
+        # Pairs 1 <= a < b are kept as sorted keys (syndrome << shift | b), built on first use
+        self.shift = max(length, 2).bit_length()
+        self.pairs = None
+        self.pairs_limit = 0
+
+    # Method to count the codewords of the given weight with bits 0 and `top` set (and none above)
+    def count(self, weight, top):
+        syndromes = self.syndromes
+        target = 1 ^ syndromes[top]  # syndrome the middle bits must cancel
+        if weight == 2:
+            return 1 if target == 0 else 0
+        if weight == 3:
+            return self._count_singles(target, top)
+        if weight == 4:
+            # Middle bits a < b < top: enumerate b, look up a
+            return sum(self._count_singles(target ^ syndromes[b], b) for b in range(2, top))
+        return self._count_pairs(weight - 2, target, top)
+
+    # Method to count the positions 1 <= a < limit with the given syndrome
+    def _count_singles(self, syndrome, limit):
+        positions = self.singles.get(syndrome)
+        return bisect_left(positions, limit) if positions else 0
+
+    # Method to count the sets of `bits` positions 1 <= ... < limit with the given syndrome
+    def _count_pairs(self, bits, syndrome, limit):
+        if bits == 2:
+            if limit > self.pairs_limit:
+                self._extend_pairs(limit)
+            key = syndrome << self.shift
+            return bisect_left(self.pairs, key | limit) - bisect_left(self.pairs, key)
+        # Enumerate the highest position, the rest lie below it
+        syndromes = self.syndromes
+        return sum(self._count_pairs(bits - 1, syndrome ^ syndromes[c], c) for c in range(bits - 1, limit))
+
+    # Method to index the pairs below the given limit (at least doubling the indexed span)
+    def _extend_pairs(self, limit):
+        limit = min(max(limit, 2 * self.pairs_limit, 256), len(self.syndromes))
+        shifted = [syndrome << self.shift for syndrome in self.syndromes[:limit]]
+        keys = []
+        for b in range(2, limit):
+            key_b = shifted[b] | b
+            keys.extend([key_a ^ key_b for key_a in shifted[1:b]])
+        keys.sort()
+        # Compact 64-bit keys where they fit (the index grows with the square of the span)
+        width = max(self.syndromes).bit_length()
+        self.pairs = array('Q', keys) if width + self.shift <= 64 else keys
+        self.pairs_limit = limit
+
+
+# Function to initialize a worker process
+def _init_worker(generator, length):
+    global _index
+    _index = _SyndromeIndex(generator, length)
+
+
+# Function to count the codewords of the given weight for a block of spans (in a worker process)
+def _count_block(weight, start, stop):
+    return [_index.count(weight, top) for top in range(start, stop)]
+
+
+# Class to run the counting tasks inline or in worker processes
+class _Counter:
+    __slots__ = ('generator', 'length', 'workers', 'executor')
+
+    def __init__(self, generator, length, workers):
+        # Import libraries (only needed for parallel processing)
+        from concurrent.futures import ProcessPoolExecutor
+        import os
+
+        # The codewords are normalized to bit 0, which needs a nonzero constant term
+        if generator.bit_length() < 2 or not generator & 1:
+            raise ValueError('Invalid generator polynomial.')
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if not workers > 0:
+            raise ValueError('Invalid number of workers.')
+        self.generator = generator
+        self.length = length
+        self.workers = workers
+        if workers == 1:
+            _init_worker(generator, length)
+            self.executor = None
+        else:
+            self.executor = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(generator, length))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+
+    # Method to yield the number of codewords of the given weight for each span, in order
+    def counts(self, weight, start=1):
+        blocks = range(start, self.length, _block_size)
+        if self.executor is None:
+            for block in blocks:
+                yield from _count_block(weight, block, min(block + _block_size, self.length))
+            return
+        # Keep a few blocks per worker in flight, and collect the results in order
+        pending = []
+        blocks = iter(blocks)
+        for block in blocks:
+            pending.append(self.executor.submit(_count_block, weight, block, min(block + _block_size, self.length)))
+            if len(pending) >= 4 * self.workers:
+                break
+        while pending:
+            counts = pending.pop(0).result()
+            block = next(blocks, None)
+            if block is not None:
+                pending.append(self.executor.submit(_count_block, weight, block,
+                                                    min(block + _block_size, self.length)))
+            yield from counts
+
+
+# Function to check if a generator polynomial is divisible by (x + 1) - it has no codewords of odd weight
+def _even_terms(generator):
+    return bin(generator).count('1') % 2 == 0
+
+
+# Function to return the shortest spans of codewords of each weight
+def _shortest_spans(counter, max_weight):
+    spans = {}
+    for weight in range(2, max_weight + 1):
+        if weight % 2 and _even_terms(counter.generator):
+            continue
+        for top, count in enumerate(counter.counts(weight, weight - 1), weight - 1):
+            if count:
+                spans[weight] = top + 1
+                break
+    return spans
+
+
+# Function to return the minimum Hamming distance for a codeword length
+def hamming_distance(generator, length, max_weight=6, workers=None):
+    """Returns the minimum Hamming distance (HD) of the codewords of the
+    given length (`length`, in bits, including the check sequence) for the
+    generator polynomial (`generator`) - all error patterns of fewer bits
+    are detected. Codeword weights up to `max_weight` are searched; if there
+    is no such codeword, `max_weight + 1` is returned (a lower bound). The
+    search runs in worker processes (`workers`, the number of processors by
+    default).
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        length : int
+            length of the codewords (in bits)
+        max_weight : int
+            maximum weight of the codewords searched (2 to 6)
+        workers : int
+            number of worker processes (defaults to the number of processors)
+
+    Returns:
+    --------
+        hamming_distance(int, int, int, int) : int
+            minimum Hamming distance
+
+    Raises:
+    -------
+        ValueError : if `generator` has no constant term, `max_weight` is not between 2 and 6,
+                     or `workers` is not a positive number
+
+    Examples:
+    ---------
+        >>> hamming_distance(0b1011, 7, workers=1)
+        3
+        >>> hamming_distance(0b1011, 8, workers=1)
+        2
+    """
+    table = hamming_distance_table(generator, length, max_weight, workers)
+    return table[-1][0]
+
+
+# Function to return the minimum Hamming distance as a function of codeword length
+def hamming_distance_table(generator, max_length, max_weight=6, workers=None):
+    """Returns the minimum Hamming distance (HD) of the generator polynomial
+    (`generator`) as a function of codeword length (in bits, including the
+    check sequence), up to `max_length` bits - as a list of (HD, length)
+    pairs, where the HD holds for all codewords up to that length. Codeword
+    weights up to `max_weight` are searched, so the HD of the first pair
+    may be a lower bound (`max_weight + 1`). The search runs in worker
+    processes (`workers`, the number of processors by default).
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        max_length : int
+            maximum length of the codewords (in bits)
+        max_weight : int
+            maximum weight of the codewords searched (2 to 6)
+        workers : int
+            number of worker processes (defaults to the number of processors)
+
+    Returns:
+    --------
+        hamming_distance_table(int, int, int, int) : list
+            list of (HD, maximum codeword length) pairs, by decreasing HD
+
+    Raises:
+    -------
+        ValueError : if `generator` has no constant term, `max_weight` is not between 2 and 6,
+                     or `workers` is not a positive number
+
+    Examples:
+    ---------
+        >>> hamming_distance_table(0b1011, 20, workers=1)
+        [(3, 7), (2, 20)]
+    """
+    if not 2 <= max_weight <= 6:
+        raise ValueError('Invalid codeword weight.')
+    if not max_length > 0:
+        raise ValueError('Invalid codeword length.')
+    with _Counter(generator, max_length, workers) as counter:
+        spans = _shortest_spans(counter, max_weight)
+    # HD for a length is the lightest weight whose shortest codeword fits in it
+    # (codewords shorter than the generator polynomial have no check sequence)
+    table = []
+    hd, length = max_weight + 1, generator.bit_length() - 1
+    for weight, span in sorted(spans.items(), key=lambda item: (item[1], item[0])):
+        if weight < hd:
+            if span - 1 > length:
+                table.append((hd, span - 1))
+            hd, length = weight, span - 1
+    table.append((hd, max_length))
+    return table
+
+
+# Function to return the weight distribution of undetected error patterns
+def hamming_weights(generator, length, max_weight=4, workers=None):
+    """Returns the number of undetected error patterns of each weight (from
+    2 to `max_weight`) in codewords of the given length (`length`, in bits,
+    including the check sequence) for the generator polynomial
+    (`generator`) - the number of codewords of each weight. The counting
+    runs in worker processes (`workers`, the number of processors by
+    default).
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        length : int
+            length of the codewords (in bits)
+        max_weight : int
+            maximum weight of the error patterns (2 to 6)
+        workers : int
+            number of worker processes (defaults to the number of processors)
+
+    Returns:
+    --------
+        hamming_weights(int, int, int, int) : dict
+            weight -> number of undetected error patterns
+
+    Raises:
+    -------
+        ValueError : if `generator` has no constant term, `max_weight` is not between 2 and 6,
+                     or `workers` is not a positive number
+
+    Examples:
+    ---------
+        >>> hamming_weights(0b1011, 7, workers=1)
+        {2: 0, 3: 7, 4: 7}
+    """
+    if not 2 <= max_weight <= 6:
+        raise ValueError('Invalid codeword weight.')
+    if not length > 0:
+        raise ValueError('Invalid codeword length.')
+    weights = {}
+    with _Counter(generator, length, workers) as counter:
+        for weight in range(2, max_weight + 1):
+            weights[weight] = 0
+            if weight % 2 and _even_terms(generator):
+                continue
+            # A codeword spanning `top + 1` bits fits in `length - top` positions
+            for top, count in enumerate(counter.counts(weight, weight - 1), weight - 1):
+                weights[weight] += count * (length - top)
+    return weights
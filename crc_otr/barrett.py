@@ -0,0 +1,106 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides the Barrett reduction engine of the cyclic
+redundancy check tool (`crc_otr`), aimed at information sequences that
+are already very large ints (millions of bits). The sequence is folded
+in halves with carry-less multiplications by x^k mod g(x), and the final
+remainder is obtained with Barrett reduction - two carry-less
+multiplications by the precomputed quotient of x^2n divided by g(x),
+instead of a per-bit or per-byte loop.
+
+Functions:
+----------
+    crc_barrett(int, int) : int
+        Performs a cyclic redundancy check (CRC) using carry-less multiplication and Barrett reduction.
+"""
+
+# Import libraries
+import threading
+from .bitseq import BitSeq
+from .cache import precomputed
+from .gf2 import gf2_clmul, gf2_multiply
+
+# Lock held while the cached remainders of x^k are extended (shared between threads)
+_folds_lock = threading.Lock()
+
+
+# Function to compute the constants of Barrett reduction for a generator polynomial
+def _barrett_constants(generator):
+    width = generator.bit_length() - 1
+    # Barrett constant: quotient of x^2n divided by the generator
+    quotient, remainder = 0, 1 << 2 * width
+    while remainder.bit_length() > width:
+        shift = remainder.bit_length() - generator.bit_length()
+        quotient |= 1 << shift
+        remainder ^= generator << shift
+    # Remainders of x^k divided by the generator, for k = 2n, 4n, 8n... (extended on demand)
+    folds = [gf2_multiply(generator ^ (1 << width), generator ^ (1 << width), generator)]
+    return quotient, folds
+
+
+# Function to perform cyclic redundancy check (CRC) using Barrett reduction
+def crc_barrett(sequence, generator):
+    """Performs a cyclic redundancy check (CRC) on the given information
+    sequence (`sequence`) using polynomial long division with the generator
+    polynomial (`generator`), and returns the same remainder as
+    `crc_bitwise`. The upper half of the sequence is repeatedly folded onto
+    the lower half with a carry-less multiplication by x^k mod g(x) (see
+    `gf2_clmul`), and the remaining 2n bits are reduced with Barrett
+    reduction. The constants of each generator are kept in the
+    precomputation cache (see the `cache` module).
+
+    Parameters:
+    -----------
+        sequence : int
+            the information sequence (a binary number) on which CRC will be performed
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_barrett(int, int) : int
+            terminal remainder of the polynomial long division of sequence by generator
+
+    Raises:
+    -------
+        ValueError : if `generator` is not a polynomial of degree 1 or higher
+
+    Examples:
+    ---------
+        >>> crc_barrett(0b11011010000, 0b10101)
+        0b1011
+        >>> crc_barrett(0b11011011011, 0b10101)
+        0b0
+    """
+    if isinstance(sequence, BitSeq):
+        sequence = int(sequence)
+    width = generator.bit_length() - 1  # degree of generator polynomial
+    if width < 1:
+        raise ValueError('Invalid generator polynomial.')
+    quotient, folds = precomputed.get(('barrett', generator), lambda: _barrett_constants(generator))
+
+    # Fold M(x) = H(x) * x^k + L(x) into H(x) * (x^k mod g(x)) + L(x), for k = ... 4n, 2n
+    levels = (max(sequence.bit_length() - 1, 0) // (2 * width)).bit_length()  # number of k below the length
+    if len(folds) < levels:
+        with _folds_lock:
+            while len(folds) < levels:
+                folds.append(gf2_multiply(folds[-1], folds[-1], generator))
+    for level in range(levels - 1, -1, -1):
+        k = 2 * width << level
+        while sequence.bit_length() > k + width:
+            sequence = (sequence & ((1 << k) - 1)) ^ gf2_clmul(sequence >> k, folds[level])
+    # At most 3n bits are left: fold the top n bits once more, down to 2n bits
+    if sequence.bit_length() > 2 * width:
+        sequence = (sequence & ((1 << 2 * width) - 1)) ^ gf2_clmul(sequence >> 2 * width, folds[0])
+
+    # Barrett reduction: the quotient of M(x) divided by g(x) is (M(x) / x^n) * (x^2n / g(x)) / x^n
+    estimate = gf2_clmul(sequence >> width, quotient) >> width
+    return (sequence ^ gf2_clmul(estimate, generator)) & ((1 << width) - 1)
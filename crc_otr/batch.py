@@ -0,0 +1,118 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides cyclic redundancy check tooling for batches of
+short messages under the `crc_otr` package. The slicing-by-8 tables of
+the generator polynomial are fetched once per batch and the CRC loop runs
+inline, so the per-message overhead of `crc_check` (function calls,
+engine selection, argument validation) is paid only once.
+
+Functions:
+----------
+    crc_check_many(list, int) : list
+        Performs a cyclic redundancy check (CRC) on each of the given information sequences.
+    crc_decode_many(list, int) : list
+        Decodes each of the given information sequences using the provided generator polynomial.
+"""
+
+# Import libraries
+import struct
+from .bitseq import BitSeq
+from .crc_otr import crc_bitwise
+from .engine import crc_slicing_tables, crc_table_check
+
+
+# Function to return the binary number of a sequence (int, BitSeq or bytes-like object)
+def _as_int(sequence):
+    if isinstance(sequence, int):
+        return sequence
+    if isinstance(sequence, BitSeq):
+        return int(sequence)
+    return int.from_bytes(sequence, 'big')
+
+
+# Function to perform cyclic redundancy check (CRC) on many sequences
+def crc_check_many(sequences, generator):
+    """Performs a cyclic redundancy check (CRC) on each of the given
+    information sequences (`sequences`) using polynomial long division with
+    the generator polynomial (`generator`), and returns the list of terminal
+    remainders - the same results as calling `crc_check` on each sequence.
+    Sequences can be binary numbers (ints), bit sequences (BitSeq) or byte
+    sequences (big-endian).
+
+    Parameters:
+    -----------
+        sequences : list
+            any iterable of information sequences (ints, BitSeqs or bytes-like objects)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_check_many(list, int) : list
+            terminal remainders of the polynomial long division of each sequence by generator
+
+    Examples:
+    ---------
+        >>> crc_check_many([0b11011010000, 0b11011011011, b'\\x06\\xd0'], 0b10101)
+        [0b1011, 0b0, 0b1011]
+    """
+    width = generator.bit_length() - 1
+    # Degenerate (degree 0) and wide (degree above 64) generators use the regular engines
+    if not 1 <= width <= 64:
+        check = crc_bitwise if width < 1 else crc_table_check
+        return [check(_as_int(s), generator) for s in sequences]
+    t7, t6, t5, t4, t3, t2, t1, t0 = crc_slicing_tables(generator, 8)[::-1]
+    shift = 64 - width
+    mask = (1 << width) - 1
+    unpack = struct.iter_unpack
+    remainders = []
+    append = remainders.append
+    # Split each sequence as M(x) = H(x) * x^n + L(x) (see `crc_table_check`), with
+    # H(x) padded by leading zeros to whole 64-bit blocks for the slicing-by-8 engine
+    for sequence in sequences:
+        if not isinstance(sequence, int):
+            sequence = _as_int(sequence)
+        head = sequence >> width
+        register = 0
+        for (block,) in unpack('>Q', head.to_bytes((head.bit_length() + 63) // 64 * 8, 'big')):
+            x = (register << shift) ^ block
+            register = (t7[x >> 56] ^ t6[x >> 48 & 255] ^ t5[x >> 40 & 255] ^ t4[x >> 32 & 255] ^
+                        t3[x >> 24 & 255] ^ t2[x >> 16 & 255] ^ t1[x >> 8 & 255] ^ t0[x & 255])
+        append(register ^ (sequence & mask))
+    return remainders
+
+
+# Function to decode many sequences
+def crc_decode_many(sequences, generator=0b100000100110000010001110110110111):
+    """Decodes each of the given information sequences (`sequences`) using
+    the provided generator polynomial (`generator`), and returns the list of
+    boolean values indicating whether there are errors in each sequence or
+    not - the same results as calling `crc_decode` on each sequence. If
+    generator is not passed as an argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        sequences : list
+            any iterable of information sequences (ints, BitSeqs or bytes-like objects)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_decode_many(list, int) : list
+            True for each sequence in which no errors are detected, False otherwise
+
+    Examples:
+    ---------
+        >>> crc_decode_many([0b11011010000, 0b11011011011], 0b10101)
+        [False, True]
+    """
+    return [remainder == 0 for remainder in crc_check_many(sequences, generator)]
@@ -0,0 +1,353 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides a reproducible benchmark suite for the cyclic
+redundancy check tool (`crc_otr`), run with `python -m crc_otr.bench`.
+Each function is warmed up, then timed with `time.perf_counter_ns` in
+samples of enough calls to be well above the timer resolution, repeated
+until a time budget is spent. The median, p95 and p99 of the time per call
+and the throughput (MB/s) are reported for each engine, generator
+polynomial, input size and input type, and stored in a JSON file with the
+host metadata - two such files can be compared to flag regressions.
+
+Functions:
+----------
+    measure(function, float, int) : dict
+        Returns the statistics of the execution time of the given function.
+    run_suite(list, list, list, list, float) : list
+        Measures the throughput of each engine, generator polynomial, input size and input type.
+    host_metadata() : dict
+        Returns the description of the host machine and interpreter.
+    compare(dict, dict, float) : list
+        Compares two benchmark runs and flags the regressions.
+"""
+
+# Import libraries
+from .crc_otr import crc_check, engines as known_engines
+from .buffer import crc_bytes_update
+from .generators import get_generator
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# Input types: binary numbers (`crc_check`) and byte sequences (`crc_bytes_update`)
+input_types = ['int', 'bytes', 'bytearray', 'memoryview']
+# Default suite (input sizes in bytes)
+default_engines = ['bitwise', 'bulk', 'barrett', 'table', 'slicing4', 'slicing8', 'slicing16']
+default_generators = ['CRC-8', 'CRC-16-CCITT', 'CRC-32', 'CRC-64-ECMA']
+default_sizes = [16, 256, 4096, 65536]
+default_kinds = ['int', 'bytes']
+# Longest input measured with the bit-serial engine (in bytes)
+bitwise_max_size = 4096
+# Shortest sample (enough calls per sample to be well above the timer resolution) [ns]
+_min_sample_time = 1000000
+
+
+# Function to return a percentile of sorted samples (linear interpolation)
+def _percentile(samples, q):
+    position = (len(samples) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(samples) - 1)
+    return samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+
+
+# Function to return the statistics of the execution time of a function
+def measure(function, min_time=0.2, min_samples=5):
+    """Returns the statistics of the execution time of the given function
+    (`function`, called without arguments). The function is first warmed up
+    (precomputation, caches), and the number of calls per sample is doubled
+    until a sample takes at least 1 ms. Samples are then taken until at
+    least `min_time` seconds and `min_samples` samples are spent. Times are
+    per call, in nanoseconds.
+
+    Parameters:
+    -----------
+        function : callable
+            function to measure
+        min_time : float
+            time budget for the samples (in seconds)
+        min_samples : int
+            minimum number of samples
+
+    Returns:
+    --------
+        measure(function, float, int) : dict
+            samples, calls per sample, and minimum, median, p95, p99 and mean time per call [ns]
+
+    Raises:
+    -------
+        ValueError : if `min_samples` is not a positive number
+
+    Examples:
+    ---------
+        >>> measure(lambda: crc_check(1 << 1024, 0b10011), 0.01)['median'] > 0
+        True
+    """
+    if not min_samples > 0:
+        raise ValueError('Invalid number of samples.')
+    timer = time.perf_counter_ns
+    # Warm-up, and number of calls per sample
+    calls = 1
+    while True:
+        start_time = timer()
+        for _ in range(calls):
+            function()
+        elapsed = timer() - start_time
+        if elapsed >= _min_sample_time:
+            break
+        calls *= 2
+    # Adaptive number of samples: until the time budget is spent
+    samples = []
+    deadline = timer() + int(min_time * 1e9)
+    while len(samples) < min_samples or timer() < deadline:
+        start_time = timer()
+        for _ in range(calls):
+            function()
+        samples.append((timer() - start_time) / calls)
+    samples.sort()
+    return {
+        'samples': len(samples),
+        'calls': calls,
+        'min': samples[0],
+        'median': _percentile(samples, 0.5),
+        'p95': _percentile(samples, 0.95),
+        'p99': _percentile(samples, 0.99),
+        'mean': sum(samples) / len(samples)
+    }
+
+
+# Function to return the function measured for an input type
+def _crc_function(kind, size, generator, engine):
+    data = random.getrandbits(8 * size).to_bytes(size, 'big')
+    if kind == 'int':
+        sequence = int.from_bytes(data, 'big') | 1 << (8 * size - 1)
+        return lambda: crc_check(sequence, generator, engine)
+    if kind == 'bytearray':
+        data = bytearray(data)
+    elif kind == 'memoryview':
+        data = memoryview(data)
+    return lambda: crc_bytes_update(0, data, generator, engine)
+
+
+# Function to measure the throughput of each engine, generator polynomial, input size and input type
+def run_suite(engines=None, generators=None, sizes=None, kinds=None, min_time=0.2, log=None):
+    """Measures the CRC of each engine (`engines`), generator polynomial
+    (`generators`, names of commonly used generators), input size (`sizes`,
+    in bytes) and input type (`kinds`: `int`, `bytes`, `bytearray` or
+    `memoryview`), and returns the results - one dictionary per combination
+    with the statistics of `measure` and the throughput (MB/s, at the
+    median). The default suite is used for any argument not passed. The
+    bit-serial engine is not measured above `bitwise_max_size` bytes. Each
+    result is also passed to `log` (if not None) as it is measured.
+
+    Parameters:
+    -----------
+        engines : list
+            names of the engines (optional)
+        generators : list
+            names of the generator polynomials (optional)
+        sizes : list
+            input sizes (in bytes, optional)
+        kinds : list
+            input types (optional)
+        min_time : float
+            time budget for each combination (in seconds)
+        log : callable
+            function called with each result (optional)
+
+    Returns:
+    --------
+        run_suite(list, list, list, list, float) : list
+            results of the benchmark
+
+    Raises:
+    -------
+        ValueError : if an engine, generator polynomial, input size or input type is not valid
+
+    Examples:
+    ---------
+        >>> run_suite(['table'], ['CRC-32'], [64], ['bytes'], 0.01)[0]['throughput'] > 0
+        True
+    """
+    engines = engines or default_engines
+    generators = generators or default_generators
+    sizes = sizes or default_sizes
+    kinds = kinds or default_kinds
+    for engine in engines:
+        if engine not in known_engines:
+            raise ValueError('Invalid CRC engine.')
+    for kind in kinds:
+        if kind not in input_types:
+            raise ValueError('Invalid type of input.')
+    for size in sizes:
+        if not size > 0:
+            raise ValueError('Invalid input size.')
+    polynomials = [(name, get_generator(name)) for name in generators]
+
+    results = []
+    for name, generator in polynomials:
+        for kind in kinds:
+            for size in sizes:
+                for engine in engines:
+                    if engine == 'bitwise' and size > bitwise_max_size:
+                        continue
+                    result = {'engine': engine, 'generator': name, 'degree': generator.bit_length() - 1,
+                              'size': size, 'kind': kind}
+                    result.update(measure(_crc_function(kind, size, generator, engine), min_time))
+                    result['throughput'] = 1000 * size / result['median']  # bytes/ns -> MB/s
+                    results.append(result)
+                    if log is not None:
+                        log(result)
+    return results
+
+
+# Function to return the description of the host machine and interpreter
+def host_metadata():
+    """Returns the description of the host machine and interpreter
+    (platform, processor, number of processors, Python implementation and
+    version, `crc_otr` version, timer resolution), stored with the results
+    so that runs on different hosts are not compared by mistake.
+
+    Returns:
+    --------
+        host_metadata() : dict
+            description of the host machine and interpreter
+
+    Examples:
+    ---------
+        >>> sorted(host_metadata())[:3]
+        ['cpu_count', 'crc_otr', 'date']
+    """
+    return {
+        'cpu_count': os.cpu_count(),
+        'crc_otr': __version__,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'machine': platform.machine(),
+        'node': platform.node(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'python': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'timer_resolution': time.get_clock_info('perf_counter').resolution
+    }
+
+
+# Function to compare two benchmark runs
+def compare(baseline, current, threshold=0.1):
+    """Compares the results of two benchmark runs (`baseline` and `current`,
+    as stored by `python -m crc_otr.bench run`), and returns one row per
+    combination measured in both: (engine, generator, size, kind, baseline
+    throughput, current throughput, ratio, regression). A combination
+    regressed if its throughput dropped by more than `threshold` (a
+    fraction) and its median time is above the p95 of the baseline (beyond
+    the noise of the baseline run).
+
+    Parameters:
+    -----------
+        baseline : dict
+            results of the baseline run
+        current : dict
+            results of the current run
+        threshold : float
+            largest drop of throughput tolerated (a fraction)
+
+    Returns:
+    --------
+        compare(dict, dict, float) : list
+            comparison of each combination measured in both runs
+
+    Raises:
+    -------
+        ValueError : if `threshold` is not between 0 and 1
+
+    Examples:
+    ---------
+        >>> run = {'results': [{'engine': 'table', 'generator': 'CRC-32', 'size': 64, 'kind': 'bytes',
+        ...                     'median': 1000.0, 'p95': 1100.0, 'throughput': 64.0}]}
+        >>> compare(run, run)[0][-2:]
+        (1.0, False)
+    """
+    if not 0 <= threshold < 1:
+        raise ValueError('Invalid threshold.')
+    key = lambda result: (result['engine'], result['generator'], result['size'], result['kind'])
+    baseline_results = {key(result): result for result in baseline['results']}
+    rows = []
+    for result in current['results']:
+        base = baseline_results.get(key(result))
+        if base is None:
+            continue
+        ratio = result['throughput'] / base['throughput']
+        regression = ratio < 1 - threshold and result['median'] > base['p95']
+        rows.append(key(result) + (base['throughput'], result['throughput'], ratio, regression))
+    return rows
+
+
+# Driver code
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m crc_otr.bench',
+                                     description='Measure the throughput of the CRC engines, '
+                                                 'or compare two benchmark runs.')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run_parser = commands.add_parser('run', help='run the benchmark suite')
+    run_parser.add_argument('-o', '--output', default='benchmark.json',
+                            help='results file (default: benchmark.json)')
+    run_parser.add_argument('--engines', nargs='+', default=default_engines, metavar='ENGINE',
+                            help='engines measured (default: all)')
+    run_parser.add_argument('--generators', nargs='+', default=default_generators, metavar='NAME',
+                            help='generator polynomials measured (default: {})'.format(' '.join(default_generators)))
+    run_parser.add_argument('--sizes', nargs='+', type=int, default=default_sizes, metavar='BYTES',
+                            help='input sizes in bytes (default: {})'.format(' '.join(map(str, default_sizes))))
+    run_parser.add_argument('--kinds', nargs='+', default=default_kinds, choices=input_types,
+                            help='input types (default: {})'.format(' '.join(default_kinds)))
+    run_parser.add_argument('--min-time', type=float, default=0.2,
+                            help='time budget per combination in seconds (default: 0.2)')
+    compare_parser = commands.add_parser('compare', help='compare two benchmark runs')
+    compare_parser.add_argument('baseline', help='results file of the baseline run')
+    compare_parser.add_argument('current', help='results file of the current run')
+    compare_parser.add_argument('--threshold', type=float, default=0.1,
+                                help='largest drop of throughput tolerated (default: 0.1, i.e. 10%%)')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'run':
+            print("Engine,Name,PolynomialDegree,Size,Kind,Median,P95,P99,Throughput")
+            log = lambda result: print("{},{},{},{},{},{:.0f},{:.0f},{:.0f},{:.2f}".format(
+                result['engine'], result['generator'], result['degree'], result['size'], result['kind'],
+                result['median'], result['p95'], result['p99'], result['throughput']), flush=True)
+            results = run_suite(args.engines, args.generators, args.sizes, args.kinds, args.min_time, log)
+            with open(args.output, 'w', encoding='utf-8') as file:
+                json.dump({'host': host_metadata(), 'results': results}, file, indent=2)
+            print("Results written to {}".format(args.output), file=sys.stderr)
+            return 0
+
+        runs = []
+        for path in (args.baseline, args.current):
+            with open(path, 'r', encoding='utf-8') as file:
+                runs.append(json.load(file))
+        if runs[0]['host'].get('node') != runs[1]['host'].get('node'):
+            print("Warning: the runs were measured on different hosts", file=sys.stderr)
+        rows = compare(runs[0], runs[1], args.threshold)
+    except (OSError, ValueError, KeyError) as exc:
+        print("crc_otr.bench: error: {}".format(exc), file=sys.stderr)
+        return 2
+    print("Engine,Name,Size,Kind,Baseline,Current,Ratio,Regression")
+    for row in rows:
+        print("{},{},{},{},{:.2f},{:.2f},{:.3f},{}".format(*row))
+    regressions = sum(row[-1] for row in rows)
+    print("{} of {} combinations regressed".format(regressions, len(rows)), file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
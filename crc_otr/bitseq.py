@@ -0,0 +1,149 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides the bit sequence type of the cyclic redundancy
+check tool (`crc_otr`). A binary number does not store its leading zeros
+(`0b0110` and `0b110` are the same int), so a bit sequence keeps an
+explicit length next to its bits - backed either by an int, or by a byte
+sequence read in place (MSB-first, the bits past the length are ignored).
+The CRC functions working with binary numbers accept bit sequences, and
+`crc_encode` returns a bit sequence of the exact encoded length.
+
+Classes:
+--------
+    BitSeq(int, int)
+        Sequence of bits of an explicit length (leading zeros preserved).
+"""
+
+
+# Class to store a sequence of bits of an explicit length
+class BitSeq:
+    """Sequence of bits of an explicit length (`length`, the number of
+    significant bits of `value` if not passed), so that leading zeros are
+    preserved. The bits are given as a binary number (`value`) or a string
+    of binary digits (ex. '0110'); `BitSeq.from_bytes` wraps a byte sequence
+    without copying it. Bits are indexed from the first (most significant)
+    one; slicing (step 1) returns a bit sequence, `+` concatenates two bit
+    sequences, and `int()` returns the binary number.
+
+    Parameters:
+    -----------
+        value : int
+            bits of the sequence (a binary number or a string of binary digits)
+        length : int
+            number of bits (optional)
+
+    Raises:
+    -------
+        ValueError : if `value` is negative or does not fit in `length` bits
+
+    Examples:
+    ---------
+        >>> seq = BitSeq(0b0110, 4)
+        >>> seq
+        BitSeq('0110')
+        >>> len(seq), int(seq), seq[1:]
+        (4, 6, BitSeq('110'))
+        >>> crc_encode(BitSeq('0001101101'), 0b10101)
+        BitSeq('00011011011011')
+    """
+    __slots__ = ('_value', '_data', 'length')
+
+    def __init__(self, value=0, length=None):
+        if isinstance(value, str):
+            digits = value[2:] if value[:2].lower() == '0b' else value
+            if length is None:
+                length = len(digits)
+            value = int(digits, 2) if digits else 0
+        if value < 0:
+            raise ValueError('Invalid bit sequence.')
+        if length is None:
+            length = value.bit_length()
+        if not length >= value.bit_length():
+            raise ValueError('Invalid bit length.')
+        self._value = value
+        self._data = None
+        self.length = length
+
+    # Method to wrap a byte sequence
+    @classmethod
+    def from_bytes(cls, data, length=None):
+        """Returns the bit sequence of the first `length` bits (all bits if
+        not passed) of the given byte sequence (`data`, any object supporting
+        the buffer protocol), read in place - the data is not copied, so
+        changes to a mutable buffer are visible in the bit sequence."""
+        view = memoryview(data).cast('B')
+        if length is None:
+            length = 8 * len(view)
+        if not 0 <= length <= 8 * len(view):
+            raise ValueError('Invalid bit length.')
+        seq = cls.__new__(cls)
+        seq._value = None
+        seq._data = view[:(length + 7) // 8]
+        seq.length = length
+        return seq
+
+    # Method to return the bits as a byte sequence
+    def to_bytes(self):
+        """Returns the bits as a byte sequence (MSB-first, with zero bits
+        after the last one up to the byte boundary). A byte-aligned bit
+        sequence wrapping a whole bytes object returns that object."""
+        data = self._data
+        if data is not None:
+            if self.length % 8 == 0:
+                if isinstance(data.obj, bytes) and data.nbytes == len(data.obj):
+                    return data.obj
+                return data.tobytes()
+        pad = -self.length % 8
+        return (int(self) << pad).to_bytes((self.length + pad) // 8, 'big')
+
+    def __int__(self):
+        if self._value is not None:
+            return self._value
+        data = self._data
+        return int.from_bytes(data, 'big') >> (8 * len(data) - self.length)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        length = self.length
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step != 1:
+                raise ValueError('Invalid slice.')
+            stop = max(start, stop)
+            # Slices starting at a byte boundary of the byte sequence are views of it
+            if self._data is not None and start % 8 == 0:
+                return BitSeq.from_bytes(self._data[start // 8:], stop - start)
+            return BitSeq(int(self) >> (length - stop) & ((1 << (stop - start)) - 1), stop - start)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('Bit index out of range.')
+        if self._data is not None:
+            return self._data[index >> 3] >> (7 - (index & 7)) & 1
+        return self._value >> (length - 1 - index) & 1
+
+    def __add__(self, other):
+        if not isinstance(other, BitSeq):
+            return NotImplemented
+        return BitSeq(int(self) << other.length | int(other), self.length + other.length)
+
+    def __eq__(self, other):
+        if not isinstance(other, BitSeq):
+            return NotImplemented
+        return self.length == other.length and int(self) == int(other)
+
+    def __hash__(self):
+        return hash((self.length, int(self)))
+
+    def __repr__(self):
+        return "BitSeq('{}')".format(format(int(self), 'b').zfill(self.length) if self.length else '')
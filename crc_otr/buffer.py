@@ -0,0 +1,296 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides cyclic redundancy check tooling for byte sequences
+under the `crc_otr` package. The functions accept any object supporting the
+buffer protocol (bytes, bytearray, memoryview, mmap, array...) and read it
+in place; the engines working with ints (bit-serial, bulk and Barrett)
+convert at most `iov_chunk_size` bytes into a Python int at a time. Unlike
+the functions working with ints, leading zero bits of the data are
+preserved.
+
+Functions:
+----------
+    crc_bytes_update(int, bytes, int, str) : int
+        Feeds a byte sequence into the CRC register using the selected engine.
+    crc_bytes(bytes, int, str) : int
+        Calculates the CRC check sequence (suffix) of the given byte sequence.
+    crc_bytes_check(bytes, int, str) : int
+        Performs a cyclic redundancy check (CRC) on the given byte sequence.
+    crc_bytes_decode(bytes, int, str) : bool
+        Decodes a byte sequence using the provided generator polynomial.
+    crc_bytes_encode(bytes, int, str) : bytes
+        Encodes a byte sequence using the provided generator polynomial.
+    crc_iov(list, int, str) : int
+        Calculates the CRC check sequence of a message held in several buffers.
+"""
+
+# Import libraries
+from .bitseq import BitSeq
+from .crc_otr import crc_bitwise, crc_bulk, crc_barrett, crc_check, engines, generator_engines, get_engine
+from .dispatch import select_engine, _record
+from .engine import crc_update, crc_shift, crc_table_check
+
+# Largest part of a buffer converted into an int at once by the engines working with ints (in bytes)
+iov_chunk_size = 1 << 16
+
+
+# Function to feed a byte sequence into the CRC register
+def crc_bytes_update(register, data, generator, engine=None):
+    """Feeds a byte sequence (`data`) into the CRC register (`register`) of
+    the generator polynomial (`generator`) using the selected engine, and
+    returns the new value of the register. The register holds the CRC check
+    sequence of the data consumed so far, so a message can be fed in chunks.
+    The engines working with ints are fed `iov_chunk_size` bytes at a time,
+    so that long buffers are not converted into an int at once. A bit
+    sequence (`BitSeq`) of any length can be fed as well.
+
+    Parameters:
+    -----------
+        register : int
+            current value of the CRC register (0 for an empty message)
+        data : bytes
+            any object supporting the buffer protocol (bytes, bytearray, memoryview...) or BitSeq
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_bytes_update(int, bytes, int, str) : int
+            new value of the CRC register
+
+    Examples:
+    ---------
+        >>> crc_bytes_update(0, b'\\x6d', 0b10101)
+        0b1011
+        >>> crc_bytes_update(0b1011, b'\\x00', 0b10101)
+        0b110
+        >>> crc_bytes_update(0, BitSeq('1011'), 0b10011)
+        0b1110
+    """
+    if isinstance(data, BitSeq):
+        width = generator.bit_length() - 1
+        if data._data is None:
+            # Bits not backed by bytes: R(x) * x^k + F(x) * x^n, divided by the generator
+            return crc_check((register << len(data)) ^ (int(data) << width), generator, engine)
+        # Whole bytes are read in place, and the bits after the last byte boundary are fed as a number
+        whole_bytes, bits = divmod(len(data), 8)
+        register = crc_bytes_update(register, data._data[:whole_bytes], generator, engine)
+        if bits:
+            tail = data._data[whole_bytes] >> (8 - bits)
+            register = crc_check((register << bits) ^ (tail << width), generator, engine)
+        return register
+    view = memoryview(data).cast('B')
+    if engine is None and generator not in generator_engines:
+        engine = select_engine(generator, 8 * len(view), 'bytes')
+    engine = get_engine(generator, engine)
+    slices = engines[engine]
+    # Degenerate generators (degree 0) have no lookup table, as in `crc_check`
+    if slices <= 0 or generator.bit_length() < 2:
+        # The bit-serial, bulk and Barrett engines only work with ints
+        width = generator.bit_length() - 1
+        check = crc_bitwise if slices == 0 or width < 1 else crc_bulk if slices == -1 else crc_barrett
+        _record('bitwise' if check is crc_bitwise else engine)
+        for start in range(0, len(view), iov_chunk_size):
+            chunk = view[start:start + iov_chunk_size]
+            register = check((register << 8 * len(chunk)) ^ (int.from_bytes(chunk, 'big') << width), generator)
+        return register
+    _record(engine)
+    return crc_update(register, view, generator, slices)
+
+
+# Function to calculate the CRC check sequence of a byte sequence
+def crc_bytes(data, generator=0b100000100110000010001110110110111, engine=None):
+    """Calculates the CRC check sequence of the given byte sequence (`data`)
+    using the provided generator polynomial (`generator`) - the remainder of
+    the padded data divided by the generator, i.e. the suffix `crc_encode`
+    would append to the data. If generator is not passed as an argument,
+    CRC32 is used by default.
+
+    Parameters:
+    -----------
+        data : bytes
+            any object supporting the buffer protocol (bytes, bytearray, memoryview...) or BitSeq
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_bytes(bytes, int, str) : int
+            CRC check sequence (a binary number) of the byte sequence
+
+    Examples:
+    ---------
+        >>> crc_bytes(b'\\x6d', 0b10101)
+        0b1011
+        >>> crc_bytes(b'\\x67', 0b11001)
+        0b10
+    """
+    return crc_bytes_update(0, data, generator, engine)
+
+
+# Function to perform cyclic redundancy check (CRC) on a byte sequence
+def crc_bytes_check(data, generator, engine=None):
+    """Performs a cyclic redundancy check (CRC) on the given byte sequence
+    (`data`) using polynomial long division with the generator polynomial
+    (`generator`), and returns the terminal remainder - the same result as
+    `crc_check` on the binary number represented by the bytes (big-endian).
+
+    Parameters:
+    -----------
+        data : bytes
+            any object supporting the buffer protocol (bytes, bytearray, memoryview...)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_bytes_check(bytes, int, str) : int
+            terminal remainder of the polynomial long division of data by generator
+
+    Examples:
+    ---------
+        >>> crc_bytes_check(b'\\x06\\xd0', 0b10101)
+        0b1011
+        >>> crc_bytes_check(b'\\x06\\xdb', 0b10101)
+        0b0
+    """
+    view = memoryview(data).cast('B')
+    width = generator.bit_length() - 1
+    if width < 1:
+        # Degenerate generators (degree 0) have no lookup table (and no check sequence to split off)
+        return crc_bytes_update(0, view, generator, engine)
+    # Split the data into a head and a tail of at least `width` bits, so that
+    # the remainder equals (H(x) * x^8k mod g(x)) + (T(x) mod g(x))
+    tail_bytes = (width + 7) // 8
+    if len(view) <= tail_bytes:
+        return crc_table_check(int.from_bytes(view, 'big'), generator)
+    register = crc_bytes_update(0, view[:-tail_bytes], generator, engine)
+    register = crc_shift(register, 8 * tail_bytes - width, generator)
+    return register ^ crc_table_check(int.from_bytes(view[-tail_bytes:], 'big'), generator)
+
+
+# Function to decode a byte sequence
+def crc_bytes_decode(data, generator=0b100000100110000010001110110110111, engine=None):
+    """Decodes a byte sequence (`data`) using the provided generator
+    polynomial (`generator`), and returns a boolean value indicating
+    whether there are errors in the byte sequence or not, based on the
+    result of a cyclic redundancy check. If generator is not passed as
+    an argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        data : bytes
+            any object supporting the buffer protocol (bytes, bytearray, memoryview...)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_bytes_decode(bytes, int, str) : bool
+            True if no errors are detected in the byte sequence, False otherwise
+
+    Examples:
+    ---------
+        >>> crc_bytes_decode(b'\\x06\\xd0', 0b10101)
+        False
+        >>> crc_bytes_decode(b'\\x06\\xdb', 0b10101)
+        True
+    """
+    # Check if the CRC remainder is equal to 0
+    return crc_bytes_check(data, generator, engine) == 0
+
+
+# Function to encode a byte sequence
+def crc_bytes_encode(data, generator=0b100000100110000010001110110110111, engine=None):
+    """Encodes a byte sequence (`data`) using the provided generator
+    polynomial (`generator`), and returns the resulting (encoded) message.
+    The check sequence is appended to the data as a whole number of bytes:
+    when the degree of the generator is not a multiple of 8, the padding is
+    extended to the next byte boundary, so that the encoded message still
+    passes `crc_bytes_decode`. If generator is not passed as an argument,
+    CRC32 is used by default.
+
+    Parameters:
+    -----------
+        data : bytes
+            any object supporting the buffer protocol (bytes, bytearray, memoryview...)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_bytes_encode(bytes, int, str) : bytes
+            encoded byte sequence - the data followed by the check sequence
+
+    Examples:
+    ---------
+        >>> crc_bytes_encode(b'\\x67', 0b11001)
+        b'g\\x0b'
+        >>> crc_bytes_encode(b'\\x00\\x67', 0b11001)
+        b'\\x00g\\x0b'
+    """
+    view = memoryview(data).cast('B')
+    width = generator.bit_length() - 1
+    tail_bytes = (width + 7) // 8
+    register = crc_shift(crc_bytes_update(0, view, generator, engine), 8 * tail_bytes - width, generator)
+    return b''.join((view, register.to_bytes(tail_bytes, 'big')))
+
+
+# Function to calculate the CRC check sequence of a message held in several buffers
+def crc_iov(buffers, generator=0b100000100110000010001110110110111, engine=None):
+    """Calculates the CRC check sequence of the message formed by the given
+    buffers (`buffers`, ex. a header, a payload and a trailer) one after
+    another, using the provided generator polynomial (`generator`) - the
+    same result as `crc_bytes` on the concatenated buffers, without
+    concatenating them: the CRC register is carried from one buffer to the
+    next. Each buffer is any object supporting the buffer protocol, read in
+    place, or a bit sequence (`BitSeq`) of any length, not only whole bytes.
+    The engine of each buffer is picked by the dispatcher (unless passed or
+    selected with `set_engine`), and the engines working with ints are fed
+    `iov_chunk_size` bytes at a time (see `crc_bytes_update`), so the
+    buffers are never converted into an int at once. If generator is not
+    passed as an argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        buffers : list
+            any iterable of buffers (bytes, bytearray, memoryview... or BitSeq)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_iov(list, int, str) : int
+            CRC check sequence (a binary number) of the message
+
+    Examples:
+    ---------
+        >>> crc_iov([b'\\x6d'], 0b10101)
+        0b1011
+        >>> crc_iov([BitSeq('110'), BitSeq('1101')], 0b10101) == crc_encode(0b1101101, 0b10101) & 0b1111
+        True
+    """
+    register = 0
+    for buffer in buffers:
+        register = crc_bytes_update(register, buffer, generator, engine)
+    return register
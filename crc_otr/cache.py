@@ -0,0 +1,199 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides the cache of per-generator precomputation (lookup
+tables, slicing tables...) used by the engines of the cyclic redundancy
+check tool (`crc_otr`). Entries are keyed by the kind of precomputation,
+the generator polynomial and its parameters, and the least recently used
+entries are evicted once the cache is full - so frequently used generators
+pay the setup cost once, while memory stays bounded when many one-off
+generators are used.
+
+Classes:
+--------
+    LruCache(int)
+        Bounded mapping with least recently used (LRU) eviction and counters.
+
+Functions:
+----------
+    cache_info() : CacheInfo
+        Returns the statistics of the precomputation cache.
+    cache_resize(int) : None
+        Changes the maximum number of entries in the precomputation cache.
+    cache_clear() : None
+        Removes all entries from the precomputation cache and resets its statistics.
+"""
+
+# Import libraries
+from collections import OrderedDict, namedtuple
+import threading
+
+# Statistics of the cache (same fields as `functools.lru_cache`, plus evictions)
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+# Class to store precomputed values with LRU eviction
+class LruCache:
+    """Bounded mapping with least recently used (LRU) eviction. Values are
+    computed on a miss by the function passed to `get`, and the number of
+    hits, misses and evictions is counted. If maxsize is None, the cache
+    can grow without bound.
+
+    Parameters:
+    -----------
+        maxsize : int
+            maximum number of entries (None for no limit)
+
+    Raises:
+    -------
+        ValueError : if `maxsize` is not a positive number
+
+    Examples:
+    ---------
+        >>> cache = LruCache(2)
+        >>> cache.get(('square', 3), lambda: 3 * 3)
+        9
+        >>> cache.info()
+        CacheInfo(hits=0, misses=1, evictions=0, maxsize=2, currsize=1)
+    """
+    __slots__ = ('maxsize', 'hits', 'misses', 'evictions', '_entries', '_lock')
+
+    def __init__(self, maxsize=128):
+        if maxsize is not None and not maxsize > 0:
+            raise ValueError('Invalid cache size.')
+        self.maxsize = maxsize
+        self.hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __repr__(self):
+        return "LruCache(maxsize={}, currsize={})".format(self.maxsize, len(self._entries))
+
+    # Method to return the cached value, computing it on a miss
+    def get(self, key, compute):
+        """Returns the value stored under the given key (`key`). On a miss,
+        the value is computed by calling `compute()` and stored, evicting
+        the least recently used entry if the cache is full."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                pass
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        # Computed outside the lock, since precomputation may use the cache itself
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+        return value
+
+    # Method to change the maximum number of entries
+    def resize(self, maxsize):
+        """Changes the maximum number of entries (`maxsize`, None for no
+        limit), evicting the least recently used entries if needed."""
+        if maxsize is not None and not maxsize > 0:
+            raise ValueError('Invalid cache size.')
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    # Method to remove all entries
+    def clear(self):
+        """Removes all entries and resets the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    # Method to return the statistics
+    def info(self):
+        """Returns the statistics of the cache (hits, misses, evictions,
+        maximum and current number of entries)."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    # Method to evict the least recently used entries (the lock must be held)
+    def _evict(self):
+        if self.maxsize is None:
+            return
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Cache of per-generator precomputation shared by all engines
+precomputed = LruCache(maxsize=64)
+
+
+# Function to return the statistics of the precomputation cache
+def cache_info():
+    """Returns the statistics of the precomputation cache shared by the CRC
+    engines: the number of hits, misses and evictions, and the maximum and
+    current number of entries (lookup tables, sets of slicing tables...).
+
+    Returns:
+    --------
+        cache_info() : CacheInfo
+            statistics of the precomputation cache
+
+    Examples:
+    ---------
+        >>> cache_info()
+        CacheInfo(hits=0, misses=0, evictions=0, maxsize=64, currsize=0)
+    """
+    return precomputed.info()
+
+
+# Function to change the maximum size of the precomputation cache
+def cache_resize(maxsize):
+    """Changes the maximum number of entries (`maxsize`) in the
+    precomputation cache shared by the CRC engines. The least recently used
+    entries are evicted if needed. If maxsize is None, the cache can grow
+    without bound.
+
+    Parameters:
+    -----------
+        maxsize : int
+            maximum number of entries (None for no limit)
+
+    Raises:
+    -------
+        ValueError : if `maxsize` is not a positive number
+
+    Examples:
+    ---------
+        >>> cache_resize(256)
+        >>> cache_info().maxsize
+        256
+    """
+    precomputed.resize(maxsize)
+
+
+# Function to clear the precomputation cache
+def cache_clear():
+    """Removes all entries from the precomputation cache shared by the CRC
+    engines, and resets its statistics.
+
+    Examples:
+    ---------
+        >>> cache_clear()
+        >>> cache_info().currsize
+        0
+    """
+    precomputed.clear()
@@ -0,0 +1,89 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to calibrate the engine dispatcher on the host machine (`python -m crc_otr.calibrate`)
+from .generators import get_generator
+from .crc_otr import crc_check
+from .buffer import crc_bytes_update
+from .dispatch import config_path, load_config
+import argparse
+import json
+import random
+import sys
+import time
+
+# Generator polynomial measured for each class of degrees (maximum degree, None for no limit)
+degree_classes = [(8, 'CRC-8'), (16, 'CRC-16-CCITT'), (32, 'CRC-32'), (64, 'CRC-64-ECMA'), (None, None)]
+# Engines compared for each type of input (the bit-serial engine is never the fastest)
+candidate_engines = ['bulk', 'barrett', 'table', 'slicing4', 'slicing8', 'slicing16']
+
+
+# Function to return the shortest execution time of a function [s]
+def measure(function, repeat):
+    execution_time = []
+    for iteration in range(0, repeat):
+        start_time = time.perf_counter()
+        function()
+        execution_time.append(time.perf_counter() - start_time)
+    return min(execution_time)
+
+
+# Function to return the fastest engine for each input length, as dispatcher rules
+def calibrate(generator, kind, lengths, repeat):
+    rules = []
+    for length in lengths:
+        sequence = random.getrandbits(length) | 1 << (length - 1)
+        data = sequence.to_bytes(length // 8, 'big')
+        timings = {}
+        for engine in candidate_engines:
+            if kind == 'int':
+                function = lambda: crc_check(sequence, generator, engine)
+            else:
+                function = lambda: crc_bytes_update(0, data, generator, engine)
+            function()  # precomputation (lookup tables...) is not measured
+            timings[engine] = measure(function, repeat)
+        fastest = min(timings, key=timings.get)
+        print("{},{},{},{},{}".format(kind, generator.bit_length() - 1, length, fastest,
+                                      1000 * timings[fastest]), file=sys.stderr)
+        # A new rule starts wherever the fastest engine changes
+        if not rules or rules[-1][1] != fastest:
+            rules.append([length, fastest])
+    rules[0][0] = 0  # the first rule covers all shorter inputs
+    return rules
+
+
+# Driver code
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m crc_otr.calibrate',
+                                     description='Measure the CRC engines and store the crossover thresholds '
+                                                 'used by the engine dispatcher.')
+    parser.add_argument('-o', '--output', default=config_path,
+                        help='config file (default: {})'.format(config_path))
+    parser.add_argument('--max-length', type=int, default=20,
+                        help='longest input measured, as a power of 2 bits (default: 20, i.e. 1 Mbit)')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of runs per engine and length (default: 5)')
+    args = parser.parse_args(argv)
+
+    lengths = [1 << s for s in range(6, args.max_length + 1)]
+    config = {'int': [], 'bytes': []}
+    print("Type,PolynomialDegree,SequenceLength,Engine,ExecutionTime", file=sys.stderr)
+    for max_degree, name in degree_classes:
+        # Generators above 64 bits: a random polynomial of degree 128
+        generator = get_generator(name) if name else (1 << 128) | random.getrandbits(128) | 1
+        for kind in config:
+            config[kind].append([max_degree, calibrate(generator, kind, lengths, args.repeat)])
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(config, file, indent=2)
+    load_config(args.output)
+    print("Dispatcher thresholds written to {}".format(args.output))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
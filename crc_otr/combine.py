@@ -0,0 +1,263 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides tooling to combine cyclic redundancy checks of
+adjacent blocks under the `crc_otr` package. Since CRC is linear in GF(2),
+the CRC of two concatenated blocks can be derived from the CRCs of the
+blocks and the length of the second block - which allows a large buffer
+to be split into chunks processed in parallel, or the CRC of a large
+buffer to be updated after a few of its bytes change.
+
+Functions:
+----------
+    crc_combine(int, int, int, int) : int
+        Combines the CRCs of two adjacent blocks into the CRC of their concatenation.
+    crc_parallel(bytes, int, int, str, Executor) : int
+        Calculates the CRC check sequence of a byte sequence using multiple processes.
+    crc_patch(int, int, bytes, bytes, int, int, str) : int
+        Updates the CRC of a byte sequence after some of its bytes are replaced.
+"""
+
+# Import libraries
+from .buffer import crc_bytes
+from .crc_otr import crc_check
+from .gf2 import gf2_multiply, gf2_power
+import threading
+
+# Process pool shared by calls to `crc_parallel` (started on first use, with one process per processor)
+_executor = None
+_executor_lock = threading.Lock()
+
+
+# Function to combine the CRCs of two adjacent blocks
+def crc_combine(crc_a, crc_b, len_b, generator=0b100000100110000010001110110110111):
+    """Combines the CRC check sequences of two adjacent blocks of bytes
+    (`crc_a` of the first block and `crc_b` of the second block, `len_b`
+    bytes long) calculated with the generator polynomial (`generator`) into
+    the CRC check sequence of the concatenation of the blocks, without
+    processing the data. If generator is not passed as an argument, CRC32
+    is used by default.
+
+    Parameters:
+    -----------
+        crc_a : int
+            CRC check sequence of the first block
+        crc_b : int
+            CRC check sequence of the second block
+        len_b : int
+            length of the second block (in bytes)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_combine(int, int, int, int) : int
+            CRC check sequence of the concatenation of the blocks
+
+    Examples:
+    ---------
+        >>> crc_combine(crc_bytes(b'1234'), crc_bytes(b'56789'), 5) == crc_bytes(b'123456789')
+        True
+    """
+    # CRC(A || B) = CRC(A) * x^(8 * len(B)) + CRC(B) (mod generator)
+    return gf2_multiply(crc_a, gf2_power(8 * len_b, generator), generator) ^ crc_b
+
+
+# Function to calculate the CRC of a chunk of a shared memory block (runs in a worker process)
+def _crc_shared(name, offset, length, generator, engine):
+    # Import libraries (only needed for parallel processing)
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        with block.buf[offset:offset + length] as chunk:
+            return crc_bytes(chunk, generator, engine)
+    finally:
+        block.close()
+
+
+# Function to calculate the CRC of a chunk of a file (runs in a worker process)
+def _crc_mapped(path, offset, length, generator, engine):
+    # Import libraries (only needed for parallel processing)
+    import mmap
+
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view, view[offset:offset + length] as chunk:
+            return crc_bytes(chunk, generator, engine)
+
+
+# Function to return the process pool shared by calls to `crc_parallel`
+def _parallel_executor():
+    # Import libraries (only needed for parallel processing)
+    from concurrent.futures import ProcessPoolExecutor
+    import os
+
+    global _executor
+    # Sized once and never shut down, since other threads may be using it: the chunks of calls asking for more
+    # workers than there are processors wait in its queue
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _executor
+
+
+# Function to calculate CRC of a byte sequence using multiple processes
+def crc_parallel(data, generator=0b100000100110000010001110110110111, workers=None, engine=None, executor=None):
+    """Calculates the CRC check sequence of the given byte sequence (`data`)
+    using the provided generator polynomial (`generator`). The data is split
+    into one chunk per worker process (`workers`), the CRCs of the chunks are
+    calculated in parallel, and then combined into the CRC of the data. The
+    result is the same as the one returned by `crc_bytes`. If generator is
+    not passed as an argument, CRC32 is used by default.
+
+    The chunks are not pickled: workers read them by offset from a shared
+    memory block - the data itself if it is a `SharedMemory` block, or a
+    single copy of it otherwise - or map them from the file if `data` is a
+    path. The worker processes are kept between calls (in a pool of one
+    process per processor shared by all calls and threads, unless an
+    executor is passed - `executor`, ex. a `ProcessPoolExecutor`), so only
+    the first call pays for starting them.
+
+    Parameters:
+    -----------
+        data : bytes
+            any object supporting the buffer protocol (bytes, bytearray, memoryview...),
+            a shared memory block (SharedMemory) or the path to a file
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        workers : int
+            number of chunks calculated in parallel (defaults to the number of processors)
+        engine : str
+            name of the engine used to perform CRC (optional)
+        executor : Executor
+            executor running the worker processes (optional)
+
+    Returns:
+    --------
+        crc_parallel(bytes, int, int, str, Executor) : int
+            CRC check sequence (a binary number) of the byte sequence
+
+    Raises:
+    -------
+        ValueError : if `workers` is not a positive number
+
+    Examples:
+    ---------
+        >>> crc_parallel(b'123456789', workers=2) == crc_bytes(b'123456789')
+        True
+    """
+    # Import libraries (only needed for parallel processing)
+    from multiprocessing import shared_memory
+    import os
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not workers > 0:
+        raise ValueError('Invalid number of workers.')
+    block = created = None
+    if isinstance(data, (str, os.PathLike)):
+        length = os.stat(data).st_size
+    elif isinstance(data, shared_memory.SharedMemory):
+        block = data
+        length = block.size
+    else:
+        view = memoryview(data).cast('B')
+        length = len(view)
+    if length == 0:
+        return 0
+    if workers == 1:
+        # A single chunk: calculated in this process
+        if isinstance(data, (str, os.PathLike)):
+            return _crc_mapped(os.fspath(data), 0, length, generator, engine)
+        return crc_bytes(block.buf if block is not None else view, generator, engine)
+    size = -(-length // workers)  # chunk size, rounded up
+
+    try:
+        if isinstance(data, (str, os.PathLike)):
+            task, source = _crc_mapped, os.fspath(data)
+        else:
+            if block is None:
+                # A single copy of the data into shared memory (instead of pickling each chunk)
+                block = created = shared_memory.SharedMemory(create=True, size=length)
+                block.buf[:length] = view
+            task, source = _crc_shared, block.name
+        # Calculate the CRC of each chunk in a separate process
+        executor = executor or _parallel_executor()
+        offsets = range(0, length, size)
+        futures = [executor.submit(task, source, offset, min(size, length - offset), generator, engine)
+                   for offset in offsets]
+        registers = [future.result() for future in futures]
+    finally:
+        if created is not None:
+            created.close()
+            created.unlink()
+
+    # Combine the CRCs of the chunks in order
+    crc = 0
+    for offset, register in zip(offsets, registers):
+        crc = crc_combine(crc, register, min(size, length - offset), generator)
+    return crc
+
+
+# Function to update the CRC of a byte sequence after some of its bytes are replaced
+def crc_patch(old_crc, offset, old_bytes, new_bytes, total_len, generator=0b100000100110000010001110110110111,
+              engine=None):
+    """Returns the CRC check sequence of a byte sequence of `total_len`
+    bytes, calculated with the generator polynomial (`generator`), after
+    the bytes at `offset` (`old_bytes`) are replaced by the same number of
+    new bytes (`new_bytes`) - given the CRC check sequence before the
+    change (`old_crc`), without processing the rest of the data. Since CRC
+    is linear in GF(2), the change adds the CRC of the XOR delta of the
+    bytes, multiplied by x^(8 * number of bytes after the change) - so the
+    cost grows with the length of the change and the logarithm of the
+    distance to the end. If generator is not passed as an argument, CRC32
+    is used by default.
+
+    Parameters:
+    -----------
+        old_crc : int
+            CRC check sequence of the byte sequence before the change
+        offset : int
+            position of the first byte changed (in bytes)
+        old_bytes : bytes
+            bytes before the change (any object supporting the buffer protocol)
+        new_bytes : bytes
+            bytes after the change (same length as `old_bytes`)
+        total_len : int
+            length of the byte sequence (in bytes)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_patch(int, int, bytes, bytes, int, int, str) : int
+            CRC check sequence of the byte sequence after the change
+
+    Raises:
+    -------
+        ValueError : if `old_bytes` and `new_bytes` differ in length, or do not fit in the sequence at `offset`
+
+    Examples:
+    ---------
+        >>> crc_patch(crc_bytes(b'123456789'), 3, b'45', b'xy', 9) == crc_bytes(b'123xy6789')
+        True
+    """
+    old_view = memoryview(old_bytes).cast('B')
+    new_view = memoryview(new_bytes).cast('B')
+    if len(old_view) != len(new_view):
+        raise ValueError('Invalid patch length.')
+    if not 0 <= offset <= total_len - len(new_view):
+        raise ValueError('Invalid patch offset.')
+    # CRC(M + D * x^8t) = CRC(M) + CRC(D) * x^8t (mod generator), for D followed by t bytes
+    delta = int.from_bytes(old_view, 'big') ^ int.from_bytes(new_view, 'big')
+    delta_crc = crc_check(delta << generator.bit_length() - 1, generator, engine)
+    return old_crc ^ crc_combine(delta_crc, 0, total_len - offset - len(new_view), generator)
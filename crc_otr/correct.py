@@ -0,0 +1,165 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides error correction with cyclic redundancy checks
+under the `crc_otr` package. The remainder of a received frame (the
+syndrome) depends only on the error pattern: an error in bit `i` (counting
+from the least significant bit) gives the remainder of x^i divided by the
+generator polynomial. For short frames, the syndromes of all single-bit
+(and double-bit) errors are distinct, so a precomputed syndrome index
+locates the erroneous bits with a single lookup.
+
+Functions:
+----------
+    crc_syndromes(int, int, int) : dict
+        Returns the index of syndromes of correctable errors for the given frame length.
+    crc_correct(int, int, int, int) : int
+        Corrects single-bit (or double-bit) errors in the given information sequence.
+"""
+
+# Import libraries
+from .bitseq import BitSeq
+from .cache import precomputed
+from .crc_otr import crc_check
+
+
+# Function to return the syndrome index for a frame length
+def crc_syndromes(generator, length, max_errors=1):
+    """Returns the index of syndromes of all error patterns of up to
+    `max_errors` bits (1 or 2) in a frame of the given length (`length`, in
+    bits) for the generator polynomial (`generator`). Each syndrome maps to
+    the tuple of bit positions of its error pattern (counting from the least
+    significant bit), or to None if several error patterns share it (such
+    errors cannot be corrected). Indexes are kept in the precomputation
+    cache (see the `cache` module).
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        length : int
+            length of the frame (in bits)
+        max_errors : int
+            maximum number of erroneous bits (1 or 2)
+
+    Returns:
+    --------
+        crc_syndromes(int, int, int) : dict
+            syndrome -> bit positions of the error pattern (or None)
+
+    Raises:
+    -------
+        ValueError : if `generator` is not a polynomial of degree 1 or higher,
+                     `length` is negative or `max_errors` is not 1 or 2
+
+    Examples:
+    ---------
+        >>> crc_syndromes(0b1011, 7)
+        {1: (0,), 2: (1,), 4: (2,), 3: (3,), 6: (4,), 7: (5,), 5: (6,)}
+    """
+    if generator.bit_length() < 2:
+        raise ValueError('Invalid generator polynomial.')
+    if not length >= 0:
+        raise ValueError('Invalid frame length.')
+    if max_errors not in (1, 2):
+        raise ValueError('Invalid number of errors.')
+    return precomputed.get(('syndromes', generator, length, max_errors),
+                           lambda: _crc_syndromes(generator, length, max_errors))
+
+
+# Function to compute the syndrome index for a frame length
+def _crc_syndromes(generator, length, max_errors):
+    width = generator.bit_length() - 1
+    # Syndromes of single-bit errors: x^i mod g(x), one shift (and reduction) per bit
+    singles = []
+    syndrome = 1
+    for _ in range(length):
+        singles.append(syndrome)
+        syndrome <<= 1
+        if syndrome >> width:
+            syndrome ^= generator
+
+    index = {}
+    for i, syndrome in enumerate(singles):
+        index[syndrome] = None if syndrome in index else (i,)
+    if max_errors == 2:
+        # Syndromes of double-bit errors are sums of two single-bit syndromes
+        for j in range(1, length):
+            syndrome_j = singles[j]
+            for i in range(j):
+                syndrome = singles[i] ^ syndrome_j
+                index[syndrome] = None if syndrome in index else (i, j)
+    return index
+
+
+# Function to correct errors in an information sequence
+def crc_correct(sequence, generator=0b100000100110000010001110110110111, max_errors=1, length=None):
+    """Corrects up to `max_errors` erroneous bits (1 or 2) in the given
+    information sequence (`sequence`, a frame encoded with `crc_encode`)
+    using the provided generator polynomial (`generator`), and returns the
+    corrected sequence. The remainder of the sequence is looked up in the
+    syndrome index for the frame length (`length`, in bits). The length is
+    taken from the sequence for a BitSeq; for a binary number, it defaults
+    to the number of significant bits of the sequence - so an error in the
+    top bit of the frame, which leaves a leading zero a binary number does
+    not store, can only be corrected if the length is passed.
+    If the errors cannot be located, None is returned. If generator is not
+    passed as an argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        sequence : int
+            the received information sequence (a binary number or BitSeq)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        max_errors : int
+            maximum number of erroneous bits corrected (1 or 2)
+        length : int
+            length of the frame (in bits, optional)
+
+    Returns:
+    --------
+        crc_correct(int, int, int, int) : int
+            corrected sequence (a binary number), or None if it cannot be corrected
+
+    Raises:
+    -------
+        ValueError : if `max_errors` is not 1 or 2, or `length` is shorter than `sequence`
+
+    Examples:
+    ---------
+        >>> crc_correct(0b11011011001, 0b10011)
+        0b11011011001
+        >>> crc_correct(0b11010011001, 0b10011)
+        0b11011011001
+        >>> crc_correct(0b01011011001, 0b10011, length=11)
+        0b11011011001
+        >>> crc_correct(0b11010011000, 0b10011) is None
+        True
+    """
+    if isinstance(sequence, BitSeq):
+        # Bit sequences carry their length, and are corrected into a bit sequence
+        if length is None:
+            length = len(sequence)
+        corrected = crc_correct(int(sequence), generator, max_errors, length)
+        return None if corrected is None else BitSeq(corrected, len(sequence))
+    if length is None:
+        length = sequence.bit_length()
+    if sequence.bit_length() > length:
+        raise ValueError('Invalid frame length.')
+    remainder = crc_check(sequence, generator)
+    if remainder == 0:
+        return sequence
+    positions = crc_syndromes(generator, length, max_errors).get(remainder)
+    if positions is None:
+        return None
+    for position in positions:
+        sequence ^= 1 << position
+    return sequence
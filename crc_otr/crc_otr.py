@@ -14,28 +14,56 @@ check (CRC) using polynomial long division in GF(2).
 
 Functions:
 ----------
-    crc_check(int, int) : int
+    crc_bitwise(int, int) : int
+        Performs a bit-serial cyclic redundancy check (CRC) on the given information sequence.
+    crc_bulk(int, int) : int
+        Performs a table-free cyclic redundancy check (CRC), many bits at a time.
+    set_engine(int, str) : None
+        Selects the engine used by CRC functions for the given generator polynomial.
+    get_engine(int, str) : str
+        Returns the engine used by CRC functions for the given generator polynomial.
+    crc_check(int, int, str) : int
         Performs a cyclic redundancy check (CRC) on the given information sequence.
     crc_padding(int, int) : int
         Adds padding (trailing zeros) to the given information sequence.
-    crc_decode(int, int) : bool
+    crc_decode(int, int, str) : bool
         Decodes an information sequence using the provided generator polynomial.
-    crc_encode(int, int) : int
+    crc_encode(int, int, str) : int
         Encodes an information sequence using the provided generator polynomial.
 """
 
 # Import libraries
 from .helper import xor_operation, shl_operation, clear_bit
+from .engine import crc_table_check
+from .barrett import crc_barrett
+from .dispatch import select_engine, _record
+from .gf2 import gf2_multiply
+from .bitseq import BitSeq
+from . import instrument
 
+# CRC engines (engine name -> number of bytes consumed per step, 0 for bit-serial, -1 for bulk, -2 for Barrett)
+engines = {
+    'bitwise': 0,
+    'bulk': -1,
+    'barrett': -2,
+    'table': 1,
+    'slicing4': 4,
+    'slicing8': 8,
+    'slicing16': 16
+}
+# Engine selected for each generator polynomial (picked by the dispatcher if not selected)
+generator_engines = {}
 
-# Function to perform cyclic redundancy check (CRC)
-def crc_check(sequence, generator):
+
+# Function to perform bit-serial cyclic redundancy check (CRC)
+def crc_bitwise(sequence, generator):
     """Performs a cyclic redundancy check (CRC) on the given information
     sequence (`sequence`) using polynomial long division with the generator
-    polynomial (`generator`). Taking the sequence as the dividend and the
-    generator as the divisor, the quotient is discarded and the remainder
-    becomes the result of the CR check (if this remainder is equal to 0,
-    there are no errors in the sequence - otherwise, errors are detected).
+    polynomial (`generator`), one bit at a time. Taking the sequence as the
+    dividend and the generator as the divisor, the quotient is discarded and
+    the remainder becomes the result of the CR check (if this remainder is
+    equal to 0, there are no errors in the sequence - otherwise, errors are
+    detected).
 
     Parameters:
     -----------
@@ -46,23 +74,25 @@ def crc_check(sequence, generator):
 
     Returns:
     --------
-        crc_check(int, int) : int
+        crc_bitwise(int, int) : int
             terminal remainder of the polynomial long division of sequence by generator
 
     Examples:
     ---------
-        >>> crc_check(0b11011010000, 0b10101)
+        >>> crc_bitwise(0b11011010000, 0b10101)
         0b1011
-        >>> crc_check(0b11011011011, 0b10101)
+        >>> crc_bitwise(0b11011011011, 0b10101)
         0b0
     """
+    if isinstance(sequence, BitSeq):
+        sequence = int(sequence)  # leading zeros do not change the remainder
     # Calculate length of generator & sequence bit-vectors
     generator_length = generator.bit_length()  # generator polynomial (binary representation)
     sequence_length = sequence.bit_length()  # encoded sequence (padded)
 
     # Calculate remainder of encoded sequence division by the generator polynomial
     next_bit = sequence_length - generator_length - 1
-    temp = sequence >> next_bit + 1 if next_bit > 0 else sequence
+    temp = sequence >> next_bit + 1 if next_bit >= 0 else sequence
     while next_bit >= 0:  # iterate over the entire encoded sequence
         temp = xor_operation(temp, generator_length - 1, generator)  # calculate XOR result in each iteration
         temp = shl_operation(temp, next_bit, sequence)  # use long-division method to find remainder
@@ -74,6 +104,204 @@ def crc_check(sequence, generator):
     return crc_remainder
 
 
+# Function to perform table-free cyclic redundancy check (CRC), many bits at a time
+def crc_bulk(sequence, generator):
+    """Performs a cyclic redundancy check (CRC) on the given information
+    sequence (`sequence`) using polynomial long division with the generator
+    polynomial (`generator`), and returns the same remainder as
+    `crc_bitwise`. Instead of one step per bit, the division XORs shifted
+    copies of whole parts of the sequence at once: the upper part of the
+    sequence is folded onto the lower part using the remainder of x^k
+    divided by the generator, halving the length of the sequence each time,
+    and the last few bits are eliminated by XOR-ing shifted copies of the
+    generator. No lookup tables are needed, so this is the cheapest engine
+    for generators used only once.
+
+    Parameters:
+    -----------
+        sequence : int
+            the information sequence (a binary number) on which CRC will be performed
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_bulk(int, int) : int
+            terminal remainder of the polynomial long division of sequence by generator
+
+    Raises:
+    -------
+        ValueError : if `generator` is not a polynomial of degree 1 or higher
+
+    Examples:
+    ---------
+        >>> crc_bulk(0b11011010000, 0b10101)
+        0b1011
+        >>> crc_bulk(0b11011011011, 0b10101)
+        0b0
+    """
+    if isinstance(sequence, BitSeq):
+        sequence = int(sequence)
+    generator_length = generator.bit_length()
+    width = generator_length - 1  # degree of generator polynomial
+    if width < 1:
+        raise ValueError('Invalid generator polynomial.')
+
+    # Remainders of x^k divided by the generator, for k = 2n, 4n, 8n... below the length of the sequence
+    folds = []
+    k, remainder = 2 * width, generator ^ (1 << width)  # x^n = generator without the leading term
+    while k < sequence.bit_length():
+        remainder = gf2_multiply(remainder, remainder, generator)
+        folds.append((k, remainder))
+        k *= 2
+    # M(x) = H(x) * x^k + L(x) = H(x) * (x^k mod g(x)) + L(x), starting from the largest k
+    for k, remainder in reversed(folds):
+        while sequence.bit_length() > k + width:
+            high = sequence >> k
+            sequence &= (1 << k) - 1
+            for bit in range(remainder.bit_length()):
+                if remainder >> bit & 1:
+                    sequence ^= high << bit
+
+    # Eliminate the remaining bits above the degree of the generator, one shifted copy at a time
+    shift = sequence.bit_length() - generator_length
+    while shift >= 0:
+        sequence ^= generator << shift
+        shift = sequence.bit_length() - generator_length
+    return sequence
+
+
+# Function to select the CRC engine for a generator polynomial
+def set_engine(generator, engine):
+    """Selects the engine (`engine`) used by `crc_check`, `crc_decode` and
+    `crc_encode` whenever the given generator polynomial (`generator`) is
+    used and no engine is passed explicitly. Passing None restores the
+    default: the engine picked by the dispatcher from the degree of the
+    generator and the length and type of the input (see the `dispatch`
+    module). `last_engine()` returns the engine actually used by the last
+    CRC.
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine (`bitwise`, `bulk`, `barrett`, `table`, `slicing4`, `slicing8` or `slicing16`)
+
+    Raises:
+    -------
+        ValueError : if `engine` is not a known engine name
+
+    Examples:
+    ---------
+        >>> set_engine(0b100000100110000010001110110110111, 'slicing8')
+        >>> set_engine(0b100000100110000010001110110110111, None)
+    """
+    if engine is None:
+        generator_engines.pop(generator, None)
+    elif engine in engines:
+        generator_engines[generator] = engine
+    else:
+        raise ValueError('Invalid CRC engine.')
+
+
+# Function to return the CRC engine for a generator polynomial
+def get_engine(generator, engine=None):
+    """Returns the name of the engine used by CRC functions for the given
+    generator polynomial (`generator`) - the engine passed explicitly
+    (`engine`) if any, otherwise the one selected with `set_engine`, or
+    `table`. When neither is given, the CRC functions ask the dispatcher
+    first (see `select_engine`), so the engine actually used depends on the
+    input - `last_engine()` returns it after the CRC.
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine passed explicitly (optional)
+
+    Returns:
+    --------
+        get_engine(int, str) : str
+            name of the engine used to perform CRC
+
+    Raises:
+    -------
+        ValueError : if `engine` is not a known engine name
+
+    Examples:
+    ---------
+        >>> get_engine(0b10101)
+        'table'
+        >>> get_engine(0b10101, 'slicing4')
+        'slicing4'
+    """
+    if engine is None:
+        engine = generator_engines.get(generator, 'table')
+    if engine not in engines:
+        raise ValueError('Invalid CRC engine.')
+    return engine
+
+
+# Function to perform cyclic redundancy check (CRC)
+def crc_check(sequence, generator, engine=None):
+    """Performs a cyclic redundancy check (CRC) on the given information
+    sequence (`sequence`) using polynomial long division with the generator
+    polynomial (`generator`). Taking the sequence as the dividend and the
+    generator as the divisor, the quotient is discarded and the remainder
+    becomes the result of the CR check (if this remainder is equal to 0,
+    there are no errors in the sequence - otherwise, errors are detected).
+    The division is performed by the engine passed (`engine`) or selected
+    with `set_engine` - for example `table`, 8 bits per step, or `bulk`,
+    which needs no lookup tables (see `crc_bulk`). If no engine is passed
+    or selected, the dispatcher picks one based on the degree of the
+    generator and the length of the sequence (see the `dispatch` module) -
+    for example Barrett reduction (see `crc_barrett`) for very long
+    sequences. `last_engine()` returns the engine used.
+
+    Parameters:
+    -----------
+        sequence : int
+            the information sequence (a binary number or BitSeq) on which CRC will be performed
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_check(int, int, str) : int
+            terminal remainder of the polynomial long division of sequence by generator
+
+    Examples:
+    ---------
+        >>> crc_check(0b11011010000, 0b10101)
+        0b1011
+        >>> crc_check(0b11011011011, 0b10101)
+        0b0
+    """
+    start_time = instrument.clock() if instrument.enabled else None
+    if isinstance(sequence, BitSeq):
+        sequence = int(sequence)  # leading zeros do not change the remainder
+    if engine is None and generator not in generator_engines:
+        engine = select_engine(generator, sequence.bit_length(), 'int')
+    engine = get_engine(generator, engine)
+    slices = engines[engine]
+    # Degenerate generators (degree 0) have no lookup table
+    if slices == 0 or generator.bit_length() < 2:
+        engine = 'bitwise'
+        remainder = crc_bitwise(sequence, generator)
+    elif slices < 0:
+        remainder = crc_bulk(sequence, generator) if slices == -1 else crc_barrett(sequence, generator)
+    else:
+        remainder = crc_table_check(sequence, generator, slices)
+    _record(engine)
+    if start_time is not None:
+        instrument._count(generator, engine, (sequence.bit_length() + 7) // 8, instrument.clock() - start_time)
+    return remainder
+
+
 # Function to add padding to an information sequence
 def crc_padding(sequence, generator):
     """Adds padding (trailing zeros in the binary representation) to the
@@ -84,14 +312,14 @@ def crc_padding(sequence, generator):
     Parameters:
     -----------
         sequence : int
-            the original information sequence (a binary number) which will be padded
+            the original information sequence (a binary number or BitSeq) which will be padded
         generator : int
             generator polynomial (binary representation) used as the divisor in CRC
 
     Returns:
     --------
         crc_padding(int, int) : int
-            padded sequence (a binary number) - as the result of adding trailing zeros
+            padded sequence (a binary number, or a BitSeq for a BitSeq) - as the result of adding trailing zeros
 
     Examples:
     ---------
@@ -101,11 +329,13 @@ def crc_padding(sequence, generator):
         0b100100000
     """
     # Add padding (length one less than generator sequence)
+    if isinstance(sequence, BitSeq):
+        return BitSeq(int(sequence) << generator.bit_length() - 1, len(sequence) + generator.bit_length() - 1)
     return sequence << generator.bit_length() - 1
 
 
 # Function to decode an information sequence
-def crc_decode(sequence, generator=0b100000100110000010001110110110111):
+def crc_decode(sequence, generator=0b100000100110000010001110110110111, engine=None):
     """Decodes a binary number (`sequence`) using the provided generator
     polynomial (`generator`), and returns a boolean value indicating
     whether there are errors in the original information sequence or not,
@@ -115,13 +345,15 @@ def crc_decode(sequence, generator=0b100000100110000010001110110110111):
     Parameters:
     -----------
         sequence : int
-            the original information sequence (a binary number) which will be decoded
+            the original information sequence (a binary number or BitSeq) which will be decoded
         generator : int
             generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
 
     Returns:
     --------
-        crc_decode(int, int) : bool
+        crc_decode(int, int, str) : bool
             True if no errors are detected in the information sequence, False otherwise
 
     Examples:
@@ -134,11 +366,11 @@ def crc_decode(sequence, generator=0b100000100110000010001110110110111):
         True
     """
     # Check if the CRC remainder is equal to 0
-    return crc_check(sequence, generator) == 0
+    return crc_check(sequence, generator, engine) == 0
 
 
 # Function to encode an information sequence
-def crc_encode(sequence, generator=0b100000100110000010001110110110111):
+def crc_encode(sequence, generator=0b100000100110000010001110110110111, engine=None):
     """Encodes a binary number (`sequence`) using the provided generator
     polynomial (`generator`), and returns the resulting (encoded) message.
     The original binary sequence is expanded (padding is added), and the
@@ -148,14 +380,16 @@ def crc_encode(sequence, generator=0b100000100110000010001110110110111):
     Parameters:
     -----------
         sequence : int
-            the original information sequence (a binary number) which will be encoded
+            the original information sequence (a binary number or BitSeq) which will be encoded
         generator : int
             generator polynomial (binary representation) used as the divisor in CRC
+        engine : str
+            name of the engine used to perform CRC (optional)
 
     Returns:
     --------
-        crc_encode(int, int) : int
-            encoded sequence (a binary number) - as the result of CRC
+        crc_encode(int, int, str) : int
+            encoded sequence (a binary number, or a BitSeq for a BitSeq) - as the result of CRC
 
     Examples:
     ---------
@@ -168,5 +402,7 @@ def crc_encode(sequence, generator=0b100000100110000010001110110110111):
     """
     # Add padding for given sequence-generator pair
     sequence = crc_padding(sequence, generator)
-    # Add the CRC remainder for given sequence-generator pair
-    return sequence + crc_check(sequence, generator)
+    # Add the CRC remainder for given sequence-generator pair (bit sequences keep their length)
+    if isinstance(sequence, BitSeq):
+        return BitSeq(int(sequence) + crc_check(sequence, generator, engine), len(sequence))
+    return sequence + crc_check(sequence, generator, engine)
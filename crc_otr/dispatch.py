@@ -0,0 +1,177 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides the engine dispatcher of the cyclic redundancy
+check tool (`crc_otr`). When no engine is passed or selected for a
+generator polynomial, the engine is picked from the degree of the
+generator, the length of the input and its type (a binary number or a
+byte sequence), using the crossover thresholds stored in a config file
+(`dispatch.json`) - regenerated on the host machine with
+`python -m crc_otr.calibrate`. The name of the engine that ran last is
+recorded for each thread.
+
+Config file format (JSON):
+--------------------------
+    {"int": [[max_degree, [[min_length, engine], ...]], ...], "bytes": [...]}
+
+    For each type of input, the first entry whose maximum degree is at
+    least the degree of the generator (null for no limit) is used, and the
+    last rule whose minimum length (in bits) is at most the length of the
+    input selects the engine.
+
+Functions:
+----------
+    select_engine(int, int, str) : str
+        Returns the engine for the given generator polynomial, input length and type.
+    last_engine() : str
+        Returns the name of the engine used by the last CRC in the current thread.
+    load_config(str) : dict
+        Loads the crossover thresholds from the given config file.
+"""
+
+# Import libraries
+import os
+import threading
+
+# Path to the config file (can be overridden with the CRC_OTR_DISPATCH environment variable)
+config_path = os.environ.get('CRC_OTR_DISPATCH') or \
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dispatch.json')
+
+# Thresholds used when there is no config file (table engine for short inputs, Barrett for long ones)
+default_config = {
+    'int': [[32, [[0, 'table'], [4096, 'barrett']]],
+            [64, [[0, 'table'], [8192, 'barrett']]],
+            [None, [[0, 'table'], [32768, 'barrett']]]],
+    'bytes': [[32, [[0, 'table'], [4096, 'barrett']]],
+              [64, [[0, 'table'], [8192, 'barrett']]],
+              [None, [[0, 'table'], [32768, 'barrett']]]]
+}
+
+# Crossover thresholds (loaded on first use)
+_config = None
+# Engine used by the last CRC, per thread
+_last = threading.local()
+
+
+# Function to load the crossover thresholds from a config file
+def load_config(path=None):
+    """Loads the crossover thresholds used by the dispatcher from the given
+    config file (`path`, the default config file if not passed), and
+    returns them. If the file does not exist or cannot be read, the
+    built-in thresholds are used.
+
+    Parameters:
+    -----------
+        path : str
+            path to the config file (optional)
+
+    Returns:
+    --------
+        load_config(str) : dict
+            crossover thresholds for each type of input
+
+    Examples:
+    ---------
+        >>> load_config('/nonexistent.json') == default_config
+        True
+    """
+    # Import libraries (only needed once the dispatcher is used)
+    import json
+    from .crc_otr import engines
+
+    global _config
+    try:
+        with open(path or config_path, 'r', encoding='utf-8') as file:
+            config = json.load(file)
+        # Every rule must name a known engine
+        for kind in ('int', 'bytes'):
+            for _, rules in config[kind]:
+                for _, engine in rules:
+                    if engine not in engines:
+                        raise ValueError('Invalid CRC engine.')
+    except (OSError, ValueError, KeyError, TypeError):
+        config = default_config
+    _config = config
+    return config
+
+
+# Function to select the engine for a generator polynomial and an input
+def select_engine(generator, length, kind='int'):
+    """Returns the name of the engine used for the given generator
+    polynomial (`generator`) and input of the given length (`length`, in
+    bits) and type (`kind`, `int` for binary numbers or `bytes` for byte
+    sequences), according to the crossover thresholds.
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        length : int
+            length of the input (in bits)
+        kind : str
+            type of the input (`int` or `bytes`)
+
+    Returns:
+    --------
+        select_engine(int, int, str) : str
+            name of the engine
+
+    Raises:
+    -------
+        ValueError : if `kind` is not a known type of input
+
+    Examples:
+    ---------
+        >>> select_engine(0b100000100110000010001110110110111, 32)
+        'table'
+        >>> select_engine(0b100000100110000010001110110110111, 1 << 20)
+        'barrett'
+    """
+    if _config is None:
+        load_config()
+    if kind not in _config:
+        raise ValueError('Invalid type of input.')
+    width = generator.bit_length() - 1
+    if width < 1:
+        return 'bitwise'  # degenerate generators (degree 0) have no lookup table
+    engine = 'table'
+    for max_width, rules in _config[kind]:
+        if max_width is None or width <= max_width:
+            for min_length, rule_engine in rules:
+                if length >= min_length:
+                    engine = rule_engine
+            break
+    return engine
+
+
+# Function to record the engine used by a CRC
+def _record(engine):
+    _last.engine = engine
+
+
+# Function to return the engine used by the last CRC
+def last_engine():
+    """Returns the name of the engine used by the last CRC performed in the
+    current thread by `crc_check`, `crc_encode`, `crc_decode`, the byte
+    sequence functions or `Crc` - whether it was passed, selected with `set_engine`
+    or picked by the dispatcher (None if no CRC was performed yet).
+
+    Returns:
+    --------
+        last_engine() : str
+            name of the engine (or None)
+
+    Examples:
+    ---------
+        >>> remainder = crc_check(1 << 20000, 0b100000100110000010001110110110111)
+        >>> last_engine()
+        'barrett'
+    """
+    return getattr(_last, 'engine', None)
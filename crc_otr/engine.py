@@ -0,0 +1,441 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides the table-driven engines used by the cyclic
+redundancy check tool (`crc_otr`). Instead of walking the dividend one
+bit at a time, the table engine consumes 8 bits per step using a 256-entry
+table precomputed once per generator polynomial, and the slicing-by-N
+engine consumes N bytes per step using N such tables.
+
+The engine keeps a CRC register equal to `M(x) * x^n mod g(x)`, where
+`M(x)` is the message consumed so far and `n` is the degree of the
+generator polynomial `g(x)` (the "direct" table algorithm). Both engines
+also work natively in the reflected (LSB-first) bit order used by many
+standard CRCs, in which case the register holds the reflected remainder
+and every byte is consumed starting from its least significant bit.
+
+Functions:
+----------
+    crc_table(int, bool) : list
+        Returns the 256-entry lookup table for the given generator polynomial.
+    crc_table_update(int, bytes, int, bool) : int
+        Feeds a sequence of bytes into the CRC register using the lookup table.
+    crc_slicing_tables(int, int, bool) : list
+        Returns the lookup tables used by the slicing-by-N engine.
+    crc_slicing_update(int, bytes, int, int, bool) : int
+        Feeds a sequence of bytes into the CRC register, N bytes at a time.
+    crc_update(int, bytes, int, int, bool) : int
+        Feeds a sequence of bytes into the CRC register using the selected engine.
+    crc_shift(int, int, int) : int
+        Feeds a number of zero bits into the CRC register.
+    crc_table_check(int, int, int) : int
+        Performs a table-driven cyclic redundancy check on the given information sequence.
+"""
+
+# Import libraries
+import struct
+from .cache import precomputed
+from .helper import reflect
+from .store import load_tables
+
+# Block formats for the slicing-by-N engine (slices -> struct format, MSB-first)
+_slicing_formats = {4: '>I', 8: '>Q', 16: '>QQ'}
+
+
+# Function to return the lookup table for a generator polynomial
+def crc_table(generator, reflected=False):
+    """Returns the 256-entry lookup table for the given generator polynomial
+    (`generator`). Entry `t` of the table holds the remainder of the
+    polynomial `t(x) * x^n` divided by the generator, where `n` is the degree
+    of the generator polynomial - or the same remainder for the reflected
+    byte `t`, with its bits reflected, if `reflected` is True. Tables are
+    kept in the precomputation cache (see the `cache` module).
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        reflected : bool
+            True for the reflected (LSB-first) bit order
+
+    Returns:
+    --------
+        crc_table(int, bool) : list
+            list of 256 remainders, indexed by the byte being reduced
+
+    Raises:
+    -------
+        ValueError : if `generator` is not a polynomial of degree 1 or higher
+
+    Examples:
+    ---------
+        >>> crc_table(0b10101)[:4]
+        [0b0, 0b101, 0b1010, 0b1111]
+        >>> crc_table(0b10011, True)[:4]
+        [0b0, 0b111, 0b1110, 0b1001]
+    """
+    return precomputed.get(('table', generator, reflected),
+                           lambda: (load_tables(generator, reflected, 1) or [_crc_table(generator, reflected)])[0])
+
+
+# Function to compute the lookup table for a generator polynomial
+def _crc_table(generator, reflected):
+    width = generator.bit_length() - 1  # degree of generator polynomial
+    if width < 1:
+        raise ValueError('Invalid generator polynomial.')
+    table = []
+    if reflected:
+        polynomial = reflect(generator ^ (1 << width), width)
+        for t in range(256):
+            # Long division of the reflected byte, one bit at a time (LSB-first)
+            remainder = t
+            for _ in range(8):
+                remainder = (remainder >> 1) ^ polynomial if remainder & 1 else remainder >> 1
+            table.append(remainder)
+    else:
+        for t in range(256):
+            # Long division of t(x) * x^n, one bit at a time
+            remainder = t << width
+            for bit in range(7, -1, -1):
+                if remainder >> (width + bit) & 1:
+                    remainder ^= generator << bit
+            table.append(remainder)
+    return table
+
+
+# Function to feed a sequence of bytes into the CRC register
+def crc_table_update(register, data, generator, reflected=False):
+    """Feeds a sequence of bytes (`data`) into the CRC register (`register`)
+    using the lookup table of the generator polynomial (`generator`), and
+    returns the new value of the register. The register holds the remainder
+    of `M(x) * x^n` divided by the generator, where `M(x)` is the message
+    consumed so far - so it can be updated across multiple calls. If
+    `reflected` is True, bytes are consumed LSB-first and the register
+    holds the reflected remainder.
+
+    Parameters:
+    -----------
+        register : int
+            current value of the CRC register (0 for an empty message)
+        data : bytes
+            any iterable of byte values (bytes, bytearray, memoryview...)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        reflected : bool
+            True for the reflected (LSB-first) bit order
+
+    Returns:
+    --------
+        crc_table_update(int, bytes, int, bool) : int
+            new value of the CRC register
+
+    Examples:
+    ---------
+        >>> crc_table_update(0, b'\\x6d', 0b10101)
+        0b1011
+        >>> crc_table_update(0, b'123456789', 0b100000100110000010001110110110111)
+        0b10001001101000011000100101111111
+        >>> crc_table_update(0, b'123456789', 0b100000100110000010001110110110111, True)
+        0b101101111111010010110110001000
+    """
+    table = crc_table(generator, reflected)
+    width = generator.bit_length() - 1
+    if reflected:
+        for byte in data:
+            register = table[(register ^ byte) & 255] ^ (register >> 8)
+    elif width >= 8:
+        shift = width - 8
+        mask = (1 << width) - 1
+        for byte in data:
+            register = table[(register >> shift) ^ byte] ^ ((register << 8) & mask)
+    else:
+        shift = 8 - width
+        for byte in data:
+            register = table[(register << shift) ^ byte]
+    return register
+
+
+# Function to return the lookup tables for the slicing-by-N engine
+def crc_slicing_tables(generator, slices, reflected=False):
+    """Returns the lookup tables used by the slicing-by-N engine for the
+    given generator polynomial (`generator`) and number of bytes consumed
+    per step (`slices`). Entry `t` of table `k` holds the remainder of the
+    polynomial `t(x) * x^(n + 8k)` divided by the generator (reflected if
+    `reflected` is True), so table 0 is the regular 256-entry lookup table.
+    Tables are kept in the precomputation cache (see the `cache` module).
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        slices : int
+            number of bytes consumed per step (4, 8 or 16)
+        reflected : bool
+            True for the reflected (LSB-first) bit order
+
+    Returns:
+    --------
+        crc_slicing_tables(int, int, bool) : list
+            list of `slices` lookup tables with 256 remainders each
+
+    Raises:
+    -------
+        ValueError : if `slices` is not one of 4, 8 or 16
+
+    Examples:
+    ---------
+        >>> crc_slicing_tables(0b10101, 4)[1][:4]
+        [0b0, 0b1, 0b10, 0b11]
+    """
+    if slices not in _slicing_formats:
+        raise ValueError('Invalid number of slices.')
+    return precomputed.get(('slicing', generator, slices, reflected),
+                           lambda: _crc_slicing_tables(generator, slices, reflected))
+
+
+# Function to compute the lookup tables for the slicing-by-N engine
+def _crc_slicing_tables(generator, slices, reflected):
+    # The first tables of the standard generators are precomputed (see the `store` module)
+    tables = load_tables(generator, reflected, slices) or [crc_table(generator, reflected)]
+    return _extend_tables(tables, generator, slices, reflected)
+
+
+# Function to extend the list of slicing tables up to the given number of tables
+def _extend_tables(tables, generator, slices, reflected):
+    table = tables[0]
+    shift = generator.bit_length() - 9  # degree of generator polynomial - 8
+    mask = (1 << (shift + 8)) - 1
+    for k in range(len(tables), slices):
+        # Each table is the previous one multiplied by x^8 (mod generator)
+        if reflected:
+            tables.append([table[value & 255] ^ (value >> 8) for value in tables[-1]])
+        elif shift >= 0:
+            tables.append([table[value >> shift] ^ ((value << 8) & mask) for value in tables[-1]])
+        else:
+            tables.append([table[value << -shift] for value in tables[-1]])
+    return tables
+
+
+# Function to feed a sequence of bytes into the CRC register, N bytes at a time
+def crc_slicing_update(register, data, generator, slices=8, reflected=False):
+    """Feeds a sequence of bytes (`data`) into the CRC register (`register`)
+    using the slicing-by-N engine of the generator polynomial (`generator`),
+    and returns the new value of the register. Each step consumes `slices`
+    bytes with one lookup per byte in a separate table; the trailing bytes
+    that do not fill a whole step go through the regular lookup table. If
+    `reflected` is True, bytes are consumed LSB-first and the register
+    holds the reflected remainder.
+
+    Parameters:
+    -----------
+        register : int
+            current value of the CRC register (0 for an empty message)
+        data : bytes
+            any bytes-like object (bytes, bytearray, memoryview...)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        slices : int
+            number of bytes consumed per step (4, 8 or 16)
+        reflected : bool
+            True for the reflected (LSB-first) bit order
+
+    Returns:
+    --------
+        crc_slicing_update(int, bytes, int, int, bool) : int
+            new value of the CRC register
+
+    Examples:
+    ---------
+        >>> crc_slicing_update(0, b'123456789', 0b100000100110000010001110110110111, 4)
+        0b10001001101000011000100101111111
+    """
+    if reflected:
+        return _crc_reflected_slicing_update(register, data, generator, slices)
+    tables = crc_slicing_tables(generator, slices)
+    width = generator.bit_length() - 1
+    bits = 8 * slices
+    mask = (1 << width) - 1
+    # Align the register with the top byte of each block (only one shift is non-zero)
+    shl = max(bits - width, 0)
+    shr = max(width - bits, 0)
+    data = memoryview(data).cast('B')
+    end = len(data) - len(data) % slices
+    blocks = struct.iter_unpack(_slicing_formats[slices], data[:end])
+    if slices == 4:
+        t3, t2, t1, t0 = tables[::-1]
+        for (block,) in blocks:
+            x = (register << shl >> shr) ^ block
+            register = ((register << 32) & mask) ^ (
+                t3[x >> 24] ^ t2[x >> 16 & 255] ^ t1[x >> 8 & 255] ^ t0[x & 255])
+    elif slices == 8:
+        t7, t6, t5, t4, t3, t2, t1, t0 = tables[::-1]
+        for (block,) in blocks:
+            x = (register << shl >> shr) ^ block
+            register = ((register << 64) & mask) ^ (
+                t7[x >> 56] ^ t6[x >> 48 & 255] ^ t5[x >> 40 & 255] ^ t4[x >> 32 & 255] ^
+                t3[x >> 24 & 255] ^ t2[x >> 16 & 255] ^ t1[x >> 8 & 255] ^ t0[x & 255])
+    else:
+        t15, t14, t13, t12, t11, t10, t9, t8, t7, t6, t5, t4, t3, t2, t1, t0 = tables[::-1]
+        for (high, low) in blocks:
+            x = (register << shl >> shr) ^ (high << 64 | low)
+            high = x >> 64
+            low = x & 0xFFFFFFFFFFFFFFFF
+            register = ((register << 128) & mask) ^ (
+                t15[high >> 56] ^ t14[high >> 48 & 255] ^ t13[high >> 40 & 255] ^ t12[high >> 32 & 255] ^
+                t11[high >> 24 & 255] ^ t10[high >> 16 & 255] ^ t9[high >> 8 & 255] ^ t8[high & 255] ^
+                t7[low >> 56] ^ t6[low >> 48 & 255] ^ t5[low >> 40 & 255] ^ t4[low >> 32 & 255] ^
+                t3[low >> 24 & 255] ^ t2[low >> 16 & 255] ^ t1[low >> 8 & 255] ^ t0[low & 255])
+    return crc_table_update(register, data[end:], generator)
+
+
+# Function to feed a sequence of bytes into the reflected CRC register, N bytes at a time
+def _crc_reflected_slicing_update(register, data, generator, slices):
+    tables = crc_slicing_tables(generator, slices, True)
+    data = memoryview(data).cast('B')
+    end = len(data) - len(data) % slices
+    # Blocks are read LSB-first (little-endian), so the first byte is the lowest one
+    blocks = struct.iter_unpack('<' + _slicing_formats[slices][1:], data[:end])
+    if slices == 4:
+        t3, t2, t1, t0 = tables[::-1]
+        for (block,) in blocks:
+            x = (register ^ block) & 0xFFFFFFFF
+            register = (register >> 32) ^ (
+                t3[x & 255] ^ t2[x >> 8 & 255] ^ t1[x >> 16 & 255] ^ t0[x >> 24])
+    elif slices == 8:
+        t7, t6, t5, t4, t3, t2, t1, t0 = tables[::-1]
+        for (block,) in blocks:
+            x = (register ^ block) & 0xFFFFFFFFFFFFFFFF
+            register = (register >> 64) ^ (
+                t7[x & 255] ^ t6[x >> 8 & 255] ^ t5[x >> 16 & 255] ^ t4[x >> 24 & 255] ^
+                t3[x >> 32 & 255] ^ t2[x >> 40 & 255] ^ t1[x >> 48 & 255] ^ t0[x >> 56])
+    else:
+        t15, t14, t13, t12, t11, t10, t9, t8, t7, t6, t5, t4, t3, t2, t1, t0 = tables[::-1]
+        for (low, high) in blocks:
+            x = register ^ (high << 64 | low)
+            low = x & 0xFFFFFFFFFFFFFFFF
+            high = x >> 64 & 0xFFFFFFFFFFFFFFFF
+            register = (register >> 128) ^ (
+                t15[low & 255] ^ t14[low >> 8 & 255] ^ t13[low >> 16 & 255] ^ t12[low >> 24 & 255] ^
+                t11[low >> 32 & 255] ^ t10[low >> 40 & 255] ^ t9[low >> 48 & 255] ^ t8[low >> 56] ^
+                t7[high & 255] ^ t6[high >> 8 & 255] ^ t5[high >> 16 & 255] ^ t4[high >> 24 & 255] ^
+                t3[high >> 32 & 255] ^ t2[high >> 40 & 255] ^ t1[high >> 48 & 255] ^ t0[high >> 56])
+    return crc_table_update(register, data[end:], generator, True)
+
+
+# Function to feed a sequence of bytes into the CRC register using the selected engine
+def crc_update(register, data, generator, slices=1, reflected=False):
+    """Feeds a sequence of bytes (`data`) into the CRC register (`register`)
+    using the table engine (`slices` equal to 1) or the slicing-by-N engine
+    (`slices` equal to 4, 8 or 16), and returns the new value of the register.
+    If `reflected` is True, bytes are consumed LSB-first.
+
+    Parameters:
+    -----------
+        register : int
+            current value of the CRC register (0 for an empty message)
+        data : bytes
+            any bytes-like object (bytes, bytearray, memoryview...)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        slices : int
+            number of bytes consumed per step (1 for the regular table engine)
+        reflected : bool
+            True for the reflected (LSB-first) bit order
+
+    Returns:
+    --------
+        crc_update(int, bytes, int, int, bool) : int
+            new value of the CRC register
+
+    Examples:
+    ---------
+        >>> crc_update(0, b'\\x6d', 0b10101)
+        0b1011
+        >>> crc_update(0, b'\\x6d', 0b10101, 8)
+        0b1011
+    """
+    if slices > 1:
+        return crc_slicing_update(register, data, generator, slices, reflected)
+    return crc_table_update(register, data, generator, reflected)
+
+
+# Function to feed zero bits into the CRC register
+def crc_shift(register, bits, generator):
+    """Feeds a number (`bits`) of zero bits into the CRC register (`register`)
+    of the generator polynomial (`generator`) one bit at a time, and returns
+    the new value of the register - i.e. the remainder of `register * x^bits`
+    divided by the generator. Used to handle sequences whose length is not a
+    multiple of 8 bits.
+
+    Parameters:
+    -----------
+        register : int
+            current value of the CRC register
+        bits : int
+            number of zero bits fed into the register
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_shift(int, int, int) : int
+            new value of the CRC register
+
+    Examples:
+    ---------
+        >>> crc_shift(0b1011, 1, 0b10101)
+        0b11
+        >>> crc_shift(0b1011, 2, 0b10101)
+        0b110
+    """
+    width = generator.bit_length() - 1
+    for _ in range(bits):
+        register <<= 1
+        if register >> width:
+            register ^= generator
+    return register
+
+
+# Function to perform a table-driven cyclic redundancy check
+def crc_table_check(sequence, generator, slices=1):
+    """Performs a cyclic redundancy check (CRC) on the given information
+    sequence (`sequence`) using the generator polynomial (`generator`),
+    8 bits at a time - or 8 * `slices` bits at a time if the slicing-by-N
+    engine is selected. Returns the same remainder as the bit-serial
+    polynomial long division.
+
+    Parameters:
+    -----------
+        sequence : int
+            the information sequence (a binary number) on which CRC will be performed
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        slices : int
+            number of bytes consumed per step (1 for the regular table engine)
+
+    Returns:
+    --------
+        crc_table_check(int, int, int) : int
+            terminal remainder of the polynomial long division of sequence by generator
+
+    Examples:
+    ---------
+        >>> crc_table_check(0b11011010000, 0b10101)
+        0b1011
+        >>> crc_table_check(0b11011011011, 0b10101)
+        0b0
+    """
+    width = generator.bit_length() - 1
+    # Split the sequence as M(x) = H(x) * x^n + L(x), so that the remainder
+    # equals (H(x) * x^n mod g(x)) + L(x) - the register value for H(x)
+    head = sequence >> width
+    head = head.to_bytes((head.bit_length() + 7) // 8, 'big')
+    register = crc_update(0, head, generator, slices)
+    return register ^ (sequence & ((1 << width) - 1))
@@ -0,0 +1,99 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides cyclic redundancy check tooling for files under the
+`crc_otr` package. Regular files are memory-mapped and fed to the CRC
+engine in chunks, so the memory used does not depend on the size of the
+file; other files (pipes, character devices...) are read in chunks into a
+single reusable buffer. The CRCs of files can be kept in a persistent
+verification cache (see the `filecache` module), so that unchanged files
+are not read again.
+
+Functions:
+----------
+    crc_file(str, int, int, str, FileCrcCache) : int
+        Calculates the CRC check sequence of the given file.
+"""
+
+# Import libraries
+import mmap
+import os
+import stat
+from .stream import Crc
+
+
+# Function to calculate the CRC check sequence of a file
+def crc_file(path, generator=0b100000100110000010001110110110111, chunk_size=1 << 20, engine=None, cache=None):
+    """Calculates the CRC check sequence of the contents of the given file
+    (`path`) using the provided generator polynomial (`generator`). The file
+    is memory-mapped and fed to the CRC engine `chunk_size` bytes at a time,
+    so the memory used does not depend on the size of the file. With a
+    verification cache (`cache`, a `FileCrcCache`), the file is only read if
+    it changed since its CRC was stored. If generator is not passed as an
+    argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        path : str
+            path to the file (or an open binary file object)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC,
+            or the parameters of a standard CRC algorithm (CrcSpec)
+        chunk_size : int
+            number of bytes fed to the CRC engine at a time
+        engine : str
+            name of the engine used to perform CRC (optional)
+        cache : FileCrcCache
+            persistent verification cache (optional, not used for open file objects)
+
+    Returns:
+    --------
+        crc_file(str, int, int, str, FileCrcCache) : int
+            CRC check sequence (a binary number) of the contents of the file
+
+    Raises:
+    -------
+        ValueError : if `chunk_size` is not a positive number
+
+    Examples:
+    ---------
+        >>> crc_file('firmware.bin')
+        0b10001001101000011000100101111111
+    """
+    if not chunk_size > 0:
+        raise ValueError('Invalid chunk size.')
+    if cache is not None and not hasattr(path, 'fileno'):
+        return cache.crc_file(path, generator, chunk_size, engine)
+    crc = Crc(generator, engine=engine)
+    if hasattr(path, 'fileno'):
+        _crc_fileobj(crc, path, chunk_size)
+    else:
+        with open(path, 'rb') as file:
+            _crc_fileobj(crc, file, chunk_size)
+    return crc.crc
+
+
+# Function to feed the contents of an open file into the CRC object
+def _crc_fileobj(crc, file, chunk_size):
+    info = os.fstat(file.fileno())
+    if stat.S_ISREG(info.st_mode):
+        # Empty files cannot be memory-mapped (and have nothing to feed)
+        if info.st_size > 0:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                for offset in range(file.tell(), len(view), chunk_size):
+                    crc.update(view[offset:offset + chunk_size])
+    else:
+        # Read other files (pipes, terminals...) into a single reusable buffer
+        buffer = bytearray(chunk_size)
+        with memoryview(buffer) as view:
+            count = file.readinto(buffer)
+            while count:
+                crc.update(view[:count])
+                count = file.readinto(buffer)
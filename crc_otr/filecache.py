@@ -0,0 +1,194 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides the persistent verification cache of the cyclic
+redundancy check tool (`crc_otr`). The CRCs of files are stored in an
+SQLite database keyed by the identity of the file (device, inode, size,
+modification time in nanoseconds) and the generator polynomial - so
+sweeping a mostly unchanged tree only reads the files that changed since
+the last sweep. Each new entry is committed in its own transaction, and the
+least recently used entries are evicted once the cache holds
+`max_entries` entries.
+
+Classes:
+--------
+    FileCrcCache(str, int, bool)
+        On-disk cache of the CRCs of files, keyed by file identity.
+"""
+
+# Import libraries
+import os
+import time
+from .cache import CacheInfo
+
+# Default location of the cache (can be overridden with the CRC_OTR_CACHE environment variable)
+default_cache_path = os.environ.get('CRC_OTR_CACHE') or \
+    os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                 'crc_otr', 'files.sqlite3')
+# Files modified less than this long before they are read are not stored [ns] - a later change
+# within the same tick of the file system clock would keep the same modification time
+racy_interval = 2000000000
+
+
+# Function to return the key of a generator polynomial (or standard CRC algorithm) in the cache
+def _generator_key(generator):
+    if isinstance(generator, int):
+        return '{:#x}'.format(generator)
+    return repr(tuple(generator))  # all parameters of a standard CRC algorithm (CrcSpec)
+
+
+# Class to store the CRCs of files on disk
+class FileCrcCache:
+    """On-disk cache of the CRCs of files (an SQLite database at `path`,
+    `default_cache_path` if not passed), keyed by the identity of the file
+    - device, inode, size and modification time (in nanoseconds) - and the
+    generator polynomial. A hit skips reading the file; a miss reads it and
+    stores its CRC, unless the file changed while it was read or was
+    modified less than `racy_interval` before. At most `max_entries`
+    entries are kept, the least recently used ones being evicted first. If
+    `rebuild` is True, stored entries are ignored (and replaced). Use the
+    cache as a context manager, or call `close` once done.
+
+    Parameters:
+    -----------
+        path : str
+            path to the cache database (optional)
+        max_entries : int
+            maximum number of entries
+        rebuild : bool
+            True to ignore (and replace) the stored entries
+
+    Raises:
+    -------
+        ValueError : if `max_entries` is not a positive number
+
+    Examples:
+    ---------
+        >>> with FileCrcCache() as cache:
+        ...     crc = crc_file('firmware.bin', cache=cache)
+        >>> cache.info()
+        CacheInfo(hits=1, misses=0, evictions=0, maxsize=1000000, currsize=1)
+    """
+    __slots__ = ('path', 'max_entries', 'rebuild', 'hits', 'misses', 'evictions', '_connection', '_count', '_used')
+
+    def __init__(self, path=None, max_entries=1000000, rebuild=False):
+        # Import libraries (only needed once the cache is used)
+        import sqlite3
+
+        if not max_entries > 0:
+            raise ValueError('Invalid cache size.')
+        self.path = path or default_cache_path
+        self.max_entries = max_entries
+        self.rebuild = rebuild
+        self.hits = self.misses = self.evictions = 0
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._connection.execute('CREATE TABLE IF NOT EXISTS files (device INTEGER, inode INTEGER, '
+                                 'size INTEGER, mtime_ns INTEGER, generator TEXT, crc TEXT, used INTEGER, '
+                                 'PRIMARY KEY (device, inode, size, mtime_ns, generator))')
+        self._connection.execute('CREATE INDEX IF NOT EXISTS files_used ON files (used)')
+        self._count = self._connection.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+        self._used = []  # keys of the hits, whose time of use is stored on `close`
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        return "FileCrcCache(path={!r}, max_entries={})".format(self.path, self.max_entries)
+
+    # Method to return the stored CRC of a file
+    def lookup(self, info, generator):
+        """Returns the CRC stored for the file of the given status
+        (`info`, from `os.stat`) and generator polynomial (`generator`), or
+        None on a miss."""
+        if self.rebuild:
+            self.misses += 1
+            return None
+        key = (info.st_dev, info.st_ino, info.st_size, info.st_mtime_ns, _generator_key(generator))
+        row = self._connection.execute('SELECT crc FROM files WHERE device = ? AND inode = ? AND size = ? '
+                                       'AND mtime_ns = ? AND generator = ?', key).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used.append(key)
+        return int(row[0], 16)
+
+    # Method to store the CRC of a file
+    def store(self, info, generator, crc):
+        """Stores the CRC (`crc`) of the file of the given status (`info`,
+        from `os.stat`) and generator polynomial (`generator`), in a single
+        transaction, evicting the least recently used entries if the cache
+        is full."""
+        key = (info.st_dev, info.st_ino, info.st_size, info.st_mtime_ns, _generator_key(generator))
+        with self._connection:
+            self._connection.execute('BEGIN IMMEDIATE')
+            cursor = self._connection.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                              key + ('{:x}'.format(crc), time.time_ns()))
+            self._count += cursor.rowcount
+            if self._count > self.max_entries:
+                # Replaced entries (and other processes) make the running count approximate
+                self._count = self._connection.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+            if self._count > self.max_entries:
+                # Evict a tenth of the entries at once, so that eviction does not run on every miss
+                excess = self._count - self.max_entries + self.max_entries // 10
+                cursor = self._connection.execute('DELETE FROM files WHERE rowid IN '
+                                                  '(SELECT rowid FROM files ORDER BY used LIMIT ?)', (excess,))
+                self._count -= cursor.rowcount
+                self.evictions += cursor.rowcount
+
+    # Method to return the CRC of a file, reading it only on a miss
+    def crc_file(self, path, generator=0b100000100110000010001110110110111, chunk_size=1 << 20, engine=None):
+        """Returns the CRC check sequence of the contents of the given file
+        (`path`), like `crc_file` - from the cache if the file did not
+        change since its CRC was stored, otherwise by reading the file (and
+        storing its CRC)."""
+        # Import libraries (the file module uses this one)
+        from .file import crc_file
+
+        info = os.stat(path)
+        crc = self.lookup(info, generator)
+        if crc is not None:
+            return crc
+        with open(path, 'rb') as file:
+            info = os.fstat(file.fileno())
+            crc = crc_file(file, generator, chunk_size, engine)
+            after = os.fstat(file.fileno())
+        # Only complete reads of settled files are stored
+        unchanged = (info.st_size, info.st_mtime_ns) == (after.st_size, after.st_mtime_ns)
+        if unchanged and time.time_ns() - info.st_mtime_ns >= racy_interval:
+            self.store(info, generator, crc)
+        return crc
+
+    # Method to return the statistics
+    def info(self):
+        """Returns the statistics of the cache (hits, misses, evictions,
+        maximum and current number of entries)."""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.max_entries, self._count)
+
+    # Method to close the cache
+    def close(self):
+        """Stores the time of use of the entries hit (for eviction), and
+        closes the database."""
+        if self._connection is None:
+            return
+        if self._used:
+            with self._connection:
+                self._connection.execute('BEGIN')
+                self._connection.executemany('UPDATE files SET used = ? WHERE device = ? AND inode = ? AND size = ? '
+                                             'AND mtime_ns = ? AND generator = ?',
+                                             [(time.time_ns(),) + key for key in self._used])
+            self._used = []
+        self._connection.close()
+        self._connection = None
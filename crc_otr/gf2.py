@@ -0,0 +1,156 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides polynomial arithmetic in GF(2) modulo a generator
+polynomial, utilized in the cyclic redundancy check tool (`crc_otr`) to
+manipulate CRC registers without processing the data they were computed
+from (ex. to combine the CRCs of two adjacent blocks).
+
+Functions:
+----------
+    gf2_multiply(int, int, int) : int
+        Multiplies two polynomials modulo the generator polynomial.
+    gf2_power(int, int) : int
+        Raises the polynomial x to the given power modulo the generator polynomial.
+    gf2_clmul(int, int) : int
+        Multiplies two polynomials of any degree (carry-less multiplication).
+"""
+
+# Operands up to this many bits are multiplied by XOR-ing shifted copies of the other operand
+_clmul_threshold = 64
+
+
+# Function to multiply two polynomials modulo the generator polynomial
+def gf2_multiply(a, b, generator):
+    """Multiplies two polynomials (`a` and `b`, both of degree lower than
+    the generator) in GF(2), and returns the remainder of the product
+    divided by the generator polynomial (`generator`).
+
+    Parameters:
+    -----------
+        a : int
+            first polynomial (binary representation)
+        b : int
+            second polynomial (binary representation)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        gf2_multiply(int, int, int) : int
+            remainder of the product of the polynomials divided by generator
+
+    Examples:
+    ---------
+        >>> gf2_multiply(0b10, 0b1000, 0b10101)
+        0b101
+        >>> gf2_multiply(0b11, 0b11, 0b10101)
+        0b101
+    """
+    width = generator.bit_length() - 1
+    product = 0
+    # Horner's method over the bits of `b`, starting from the most significant one
+    for bit in range(b.bit_length() - 1, -1, -1):
+        product <<= 1
+        if product >> width:
+            product ^= generator
+        if b >> bit & 1:
+            product ^= a
+    return product
+
+
+# Function to raise x to a power modulo the generator polynomial
+def gf2_power(exponent, generator):
+    """Raises the polynomial `x` to the given power (`exponent`) in GF(2),
+    and returns the remainder divided by the generator polynomial
+    (`generator`). Uses exponentiation by squaring, so the number of
+    multiplications grows with the logarithm of the exponent.
+
+    Parameters:
+    -----------
+        exponent : int
+            power to which the polynomial x is raised (non negative)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        gf2_power(int, int) : int
+            remainder of x^exponent divided by generator
+
+    Raises:
+    -------
+        ValueError : if `exponent` is not a non negative number
+
+    Examples:
+    ---------
+        >>> gf2_power(4, 0b10101)
+        0b101
+        >>> gf2_power(6, 0b10101)
+        0b1
+    """
+    if not exponent >= 0:
+        raise ValueError('Invalid exponent.')
+    width = generator.bit_length() - 1
+    result = 1 if width > 0 else 0
+    square = 0b10 ^ generator if 0b10 >> width else 0b10  # remainder of x divided by generator
+    while exponent:
+        if exponent & 1:
+            result = gf2_multiply(result, square, generator)
+        square = gf2_multiply(square, square, generator)
+        exponent >>= 1
+    return result
+
+
+# Function to multiply two polynomials without reduction (carry-less multiplication)
+def gf2_clmul(a, b):
+    """Multiplies two polynomials (`a` and `b`) of any degree in GF(2),
+    without reducing the product - the carry-less product of two binary
+    numbers. When the shorter operand is at most 64 bits long, shifted
+    copies of the longer operand are XOR-ed together (one big-int XOR per
+    set bit); longer operands are split in halves and multiplied with the
+    Karatsuba method (three half-size products instead of four).
+
+    Parameters:
+    -----------
+        a : int
+            first polynomial (binary representation)
+        b : int
+            second polynomial (binary representation)
+
+    Returns:
+    --------
+        gf2_clmul(int, int) : int
+            carry-less product of the polynomials
+
+    Examples:
+    ---------
+        >>> gf2_clmul(0b11, 0b11)
+        0b101
+        >>> gf2_clmul(0b1011, 0b10101)
+        0b10010111
+    """
+    if a.bit_length() < b.bit_length():
+        a, b = b, a
+    length = b.bit_length()
+    if length <= _clmul_threshold:
+        product = 0
+        for bit in range(length):
+            if b >> bit & 1:
+                product ^= a << bit
+        return product
+    # a(x) * b(x) = z2(x) * x^2m + z1(x) * x^m + z0(x), with z1 = (a0 + a1)(b0 + b1) - z0 - z2
+    m = (length + 1) // 2
+    mask = (1 << m) - 1
+    a0, a1, b0, b1 = a & mask, a >> m, b & mask, b >> m
+    z0 = gf2_clmul(a0, b0)
+    z2 = gf2_clmul(a1, b1)
+    z1 = gf2_clmul(a0 ^ a1, b0 ^ b1) ^ z0 ^ z2
+    return (z2 << 2 * m) ^ (z1 << m) ^ z0
@@ -23,6 +23,8 @@ Functions:
         Shifts given binary number to the left by one under certain conditions.
     xor_operation(int, int, int) : int
         Performs a XOR operation on the given binary numbers under certain conditions.
+    reflect(int, int) : int
+        Reverses the order of the bits in the given binary number.
 """
 
 
@@ -227,3 +229,39 @@ def xor_operation(value, bit, sequence):
         return value ^ sequence if get_bit(value, bit) else value
     except ValueError as exc:
         raise RuntimeError('Failed to execute operation.') from exc
+
+
+# Function to reverse the order of the bits in a number
+def reflect(value, width):
+    """Reverses the order of the lowest `width` bits in the given binary
+    number (`value`) - the most significant bit becomes the least
+    significant one and vice versa - and returns the resulting number.
+
+    Parameters:
+    -----------
+        value : int
+            a binary number (at most `width` bits long) which will be reflected
+        width : int
+            number of bits to be reflected
+
+    Returns:
+    --------
+        reflect(int, int) : int
+            integer value of the new (reflected) binary number
+
+    Raises:
+    -------
+        ValueError : if `width` is not a non negative number
+
+    Examples:
+    ---------
+        >>> reflect(0b1011, 4)
+        0b1101
+        >>> reflect(0b1011, 6)
+        0b110100
+        >>> reflect(0b1011, -1)
+        ValueError
+    """
+    if not width >= 0:
+        raise ValueError('Invalid bit width.')
+    return int(format(value, '0{}b'.format(width))[::-1], 2) if width else 0
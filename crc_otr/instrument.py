@@ -0,0 +1,149 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides opt-in instrumentation of the cyclic redundancy
+check tool (`crc_otr`). Once enabled, every CRC performed by `crc_check`
+(and so `crc_encode` and `crc_decode`) and by `Crc.update` is timed, and
+the number of calls, bytes and nanoseconds and a latency histogram are
+kept for each generator polynomial and engine. An export callback can be
+registered to receive every measurement. While disabled, the CRC functions
+only check a flag.
+
+Functions:
+----------
+    stats_enable(function) : None
+        Enables the instrumentation of CRC functions, with an optional export callback.
+    stats_disable() : None
+        Disables the instrumentation of CRC functions (the statistics are kept).
+    stats_snapshot() : dict
+        Returns the statistics of CRC functions for each generator polynomial and engine.
+    stats_reset() : None
+        Resets the statistics of CRC functions.
+"""
+
+# Import libraries
+from bisect import bisect_left
+import threading
+import time
+
+# Upper bounds of the latency histogram buckets [ns] (1 us to ~1 s, by factors of 4; the last bucket has no bound)
+histogram_bounds = [1000 << 2 * i for i in range(11)]
+
+# Instrumentation state (checked by the CRC functions on every call)
+enabled = False
+# Clock used to time CRC functions [ns]
+clock = time.perf_counter_ns
+# Export callback: function(generator, engine, bytes, nanoseconds), or None
+_callback = None
+# Statistics: (generator, engine) -> [calls, bytes, nanoseconds, histogram]
+_stats = {}
+_lock = threading.Lock()
+
+
+# Function to record a CRC (called by the CRC functions while the instrumentation is enabled)
+def _count(generator, engine, size, elapsed):
+    with _lock:
+        entry = _stats.get((generator, engine))
+        if entry is None:
+            entry = _stats[(generator, engine)] = [0, 0, 0, [0] * (len(histogram_bounds) + 1)]
+        entry[0] += 1
+        entry[1] += size
+        entry[2] += elapsed
+        entry[3][bisect_left(histogram_bounds, elapsed)] += 1
+        callback = _callback
+    if callback is not None:
+        callback(generator, engine, size, elapsed)
+
+
+# Function to enable the instrumentation
+def stats_enable(callback=None):
+    """Enables the instrumentation of CRC functions (`crc_check`,
+    `crc_encode`, `crc_decode` and `Crc.update`), and registers the export
+    callback (`callback`, optional) - a function called after each CRC with
+    the generator polynomial, the name of the engine, the number of bytes
+    and the execution time (in nanoseconds), for example to forward them to
+    a metrics system. The statistics collected so far are kept.
+
+    Parameters:
+    -----------
+        callback : function
+            export callback (optional)
+
+    Raises:
+    -------
+        ValueError : if `callback` is not callable
+
+    Examples:
+    ---------
+        >>> stats_enable()
+        >>> remainder = crc_check(0b11011010000, 0b10101)
+        >>> stats_snapshot()[0b10101]['table']['calls']
+        1
+    """
+    global enabled, _callback
+    if callback is not None and not callable(callback):
+        raise ValueError('Invalid callback.')
+    _callback = callback
+    enabled = True
+
+
+# Function to disable the instrumentation
+def stats_disable():
+    """Disables the instrumentation of CRC functions and unregisters the
+    export callback. The statistics collected so far are kept.
+
+    Examples:
+    ---------
+        >>> stats_disable()
+    """
+    global enabled, _callback
+    enabled = False
+    _callback = None
+
+
+# Function to return the statistics
+def stats_snapshot():
+    """Returns the statistics of CRC functions collected while the
+    instrumentation was enabled: for each generator polynomial and engine,
+    the number of calls, bytes and nanoseconds and the latency histogram
+    (the number of calls in each bucket - up to the corresponding bound of
+    `histogram_bounds`, in nanoseconds, and above the last one). The
+    snapshot is a copy, not updated by later calls.
+
+    Returns:
+    --------
+        stats_snapshot() : dict
+            generator -> engine -> {'calls', 'bytes', 'ns', 'histogram'}
+
+    Examples:
+    ---------
+        >>> stats_reset()
+        >>> stats_snapshot()
+        {}
+    """
+    snapshot = {}
+    with _lock:
+        for (generator, engine), (calls, size, elapsed, histogram) in _stats.items():
+            snapshot.setdefault(generator, {})[engine] = {
+                'calls': calls, 'bytes': size, 'ns': elapsed, 'histogram': list(histogram)}
+    return snapshot
+
+
+# Function to reset the statistics
+def stats_reset():
+    """Resets the statistics of CRC functions (the instrumentation stays
+    enabled or disabled).
+
+    Examples:
+    ---------
+        >>> stats_reset()
+    """
+    with _lock:
+        _stats.clear()
@@ -0,0 +1,193 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides rolling (sliding-window) cyclic redundancy checks
+under the `crc_otr` package, for content-defined chunking. The CRC of a
+window of `window` bytes is updated in constant time as the window slides
+by one byte: the byte entering the window is fed into the CRC register
+(lookup table of the generator), and the contribution of the byte leaving
+it - the remainder of b(x) * x^(8 * window + n) - is removed with a second
+lookup table, precomputed once per generator polynomial and window size.
+
+Classes:
+--------
+    RollingCrc(int, int, bytes)
+        CRC of a fixed-size window sliding over a byte stream.
+
+Functions:
+----------
+    crc_boundaries(bytes, int, int, int, int, int) : generator
+        Yields the chunk boundaries of a byte sequence where the rolling CRC matches a mask.
+"""
+
+# Import libraries
+from itertools import chain, repeat
+from .cache import precomputed
+from .engine import crc_table, crc_table_update
+from .gf2 import gf2_multiply, gf2_power
+
+
+# Function to return the lookup table of the bytes leaving a window
+def _leaving_table(generator, window):
+    return precomputed.get(('rolling', generator, window),
+                           lambda: _crc_leaving_table(generator, window))
+
+
+# Function to compute the lookup table of the bytes leaving a window
+def _crc_leaving_table(generator, window):
+    # Entry b: remainder of b(x) * x^(8 * window + n), i.e. the table entry of b times x^(8 * window)
+    factor = gf2_power(8 * window, generator)
+    return [gf2_multiply(remainder, factor, generator) for remainder in crc_table(generator)]
+
+
+# Class to calculate the CRC of a sliding window
+class RollingCrc:
+    """CRC of a fixed-size window (`window` bytes) sliding over a byte
+    stream, using the provided generator polynomial (`generator`). The
+    window initially holds `data` (exactly `window` bytes), or zero bytes
+    if not passed - the CRC of zero bytes is 0, so a stream can be rolled
+    in from its first byte. `roll(out_byte, in_byte)` slides the window by
+    one byte in constant time, and the `crc` attribute holds the CRC check
+    sequence of the bytes in the window (the same as `crc_bytes` on them).
+    If generator is not passed as an argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        window : int
+            size of the window (in bytes)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        data : bytes
+            initial content of the window (optional)
+
+    Raises:
+    -------
+        ValueError : if `window` is not a positive number, or `data` is not `window` bytes long
+
+    Examples:
+    ---------
+        >>> rolling = RollingCrc(2, 0b10101, b'\\x06\\xd0')
+        >>> rolling.roll(0x06, 0x6d) == crc_bytes(b'\\xd0\\x6d', 0b10101)
+        True
+    """
+    __slots__ = ('window', 'generator', 'crc', '_table', '_leaving', '_shift', '_mask')
+
+    def __init__(self, window, generator=0b100000100110000010001110110110111, data=None):
+        if not window > 0:
+            raise ValueError('Invalid window size.')
+        self.window = window
+        self.generator = generator
+        self._table = crc_table(generator)
+        self._leaving = _leaving_table(generator, window)
+        width = generator.bit_length() - 1
+        self._shift = width - 8
+        self._mask = (1 << width) - 1
+        self.crc = 0
+        if data is not None:
+            if len(memoryview(data).cast('B')) != window:
+                raise ValueError('Invalid window content.')
+            self.crc = crc_table_update(0, memoryview(data).cast('B'), generator)
+
+    def __repr__(self):
+        return "RollingCrc(window={}, generator={:#b}, crc={:#x})".format(self.window, self.generator, self.crc)
+
+    # Method to slide the window by one byte
+    def roll(self, out_byte, in_byte):
+        """Slides the window by one byte - the first byte of the window
+        (`out_byte`) leaves it, and a new byte (`in_byte`) enters it - and
+        returns the CRC check sequence of the new window."""
+        register = self.crc
+        if self._shift >= 0:
+            register = self._table[(register >> self._shift) ^ in_byte] ^ ((register << 8) & self._mask)
+        else:
+            register = self._table[(register << -self._shift) ^ in_byte]
+        self.crc = register ^ self._leaving[out_byte]
+        return self.crc
+
+
+# Function to split a byte sequence at the positions where the rolling CRC matches a mask
+def crc_boundaries(data, window=48, mask=0x1fff, generator=0b100000100110000010001110110110111, min_size=0,
+                   max_size=None):
+    """Yields the chunk boundaries of the given byte sequence (`data`, any
+    object supporting the buffer protocol - ex. `mmap` for large files) for
+    content-defined chunking: a chunk ends after each byte where the CRC of
+    the last `window` bytes (see `RollingCrc`) has all the bits of `mask`
+    set - about one chunk per `mask + 1` bytes for a mask of low bits -
+    unless the chunk would be shorter than `min_size` bytes; chunks are cut
+    at `max_size` bytes anyway (if not None). The boundaries are the
+    offsets of the ends of the chunks, the last one being the length of the
+    data. If generator is not passed as an argument, CRC32 is used by
+    default.
+
+    Parameters:
+    -----------
+        data : bytes
+            any object supporting the buffer protocol (bytes, bytearray, memoryview, mmap...)
+        window : int
+            size of the rolling window (in bytes)
+        mask : int
+            bits of the rolling CRC that must be set at a boundary
+        generator : int
+            generator polynomial (binary representation) of degree 8 or higher
+        min_size : int
+            minimum size of a chunk (in bytes)
+        max_size : int
+            maximum size of a chunk (in bytes, optional)
+
+    Returns:
+    --------
+        crc_boundaries(bytes, int, int, int, int, int) : generator
+            offsets of the ends of the chunks
+
+    Raises:
+    -------
+        ValueError : if `generator` is of degree below 8, `window` is not a positive number,
+                     `mask` does not fit in the CRC, or `max_size` is smaller than `min_size`
+
+    Examples:
+    ---------
+        >>> list(crc_boundaries(bytes(range(256)) * 4, 16, 0x3f))
+        [63, 251, 264, 319, 507, 520, 575, 763, 776, 831, 1019, 1024]
+    """
+    width = generator.bit_length() - 1
+    if width < 8:
+        raise ValueError('Invalid generator polynomial.')
+    if not window > 0:
+        raise ValueError('Invalid window size.')
+    if not 0 <= mask < 1 << width:
+        raise ValueError('Invalid mask.')
+    if not min_size >= 0 or max_size is not None and not max_size >= max(min_size, 1):
+        raise ValueError('Invalid chunk size.')
+    return _crc_boundaries(memoryview(data).cast('B'), window, mask, generator, min_size, max_size)
+
+
+# Function to yield the chunk boundaries (see `crc_boundaries`)
+def _crc_boundaries(view, window, mask, generator, min_size, max_size):
+    table = crc_table(generator)
+    leaving = _leaving_table(generator, window)
+    width = generator.bit_length() - 1
+    shift = width - 8
+    register_mask = (1 << width) - 1
+    register = 0
+    start = 0
+    limit = max_size or -1  # end of the chunk at the maximum size (never reached if there is none)
+    # Bytes entering the window, and bytes leaving it (zero bytes before the data)
+    for end, in_byte, out_byte in zip(range(1, len(view) + 1), view, chain(repeat(0, window), view)):
+        register = table[register >> shift ^ in_byte] ^ (register << 8 & register_mask) ^ leaving[out_byte]
+        if register & mask == mask:
+            if end - start < min_size:
+                continue
+        elif end != limit:
+            continue
+        yield end
+        start = end
+        limit = end + max_size if max_size else -1
+    if start < len(view):
+        yield len(view)
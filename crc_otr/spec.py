@@ -0,0 +1,238 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides the Rocksoft parameter model of standard CRC
+algorithms under the `crc_otr` package. Besides the generator polynomial,
+a standard CRC is defined by the initial value of the register, the bit
+order of the input and output (reflected or not) and the final XOR value;
+the catalogue lists commonly used algorithms along with their published
+check values (the CRC of the ASCII string "123456789").
+
+Classes:
+--------
+    CrcSpec(str, int, int, int, bool, bool, int, int)
+        Parameters of a standard CRC algorithm (Rocksoft model).
+
+Functions:
+----------
+    get_spec(str) : CrcSpec
+        Returns the parameters of a standard CRC algorithm given its name.
+    crc_spec(bytes, CrcSpec, str) : int
+        Calculates the standard CRC of the given byte sequence.
+"""
+
+# Import libraries
+from collections import namedtuple
+from .engine import crc_update
+from .helper import reflect
+
+
+# Class to describe a standard CRC algorithm
+class CrcSpec(namedtuple('CrcSpec', ['name', 'width', 'poly', 'init', 'refin', 'refout', 'xorout', 'check'])):
+    """Parameters of a standard CRC algorithm in the Rocksoft model.
+
+    Parameters:
+    -----------
+        name : str
+            name of the algorithm (as listed in the CRC catalogue)
+        width : int
+            degree of the generator polynomial (number of bits in the CRC)
+        poly : int
+            generator polynomial without the leading term (normal representation)
+        init : int
+            initial value of the register (unreflected)
+        refin : bool
+            True if the bytes are consumed LSB-first (reflected input)
+        refout : bool
+            True if the register is reflected before the final XOR (reflected output)
+        xorout : int
+            value XOR-ed with the register to produce the CRC
+        check : int
+            published CRC of the ASCII string "123456789"
+
+    Examples:
+    ---------
+        >>> spec = get_spec('CRC-32/ISO-HDLC')
+        >>> spec.generator
+        0b100000100110000010001110110110111
+        >>> hex(spec.crc(b'123456789'))
+        '0xcbf43926'
+    """
+    __slots__ = ()
+
+    @property
+    def generator(self):
+        """Generator polynomial (binary representation, with the leading term)."""
+        return (1 << self.width) | self.poly
+
+    @property
+    def digest_size(self):
+        """Number of bytes needed to store the CRC."""
+        return (self.width + 7) // 8
+
+    # Method to return the initial value of the register
+    def register(self):
+        """Returns the initial value of the CRC register (reflected for a
+        reflected input)."""
+        return reflect(self.init, self.width) if self.refin else self.init
+
+    # Method to feed a sequence of bytes into the register
+    def update(self, register, data, slices=1):
+        """Feeds a sequence of bytes (`data`) into the CRC register
+        (`register`) using the table engine or the slicing-by-N engine
+        (`slices`), consuming bytes LSB-first for a reflected input, and
+        returns the new value of the register."""
+        return crc_update(register, data, self.generator, slices, self.refin)
+
+    # Method to return the CRC given the final value of the register
+    def finalize(self, register):
+        """Returns the CRC given the final value of the CRC register -
+        reflected if the output order differs from the input order, and
+        XOR-ed with the final XOR value."""
+        if self.refin != self.refout:
+            register = reflect(register, self.width)
+        return register ^ self.xorout
+
+    # Method to calculate the CRC of a byte sequence
+    def crc(self, data, slices=1):
+        """Calculates the CRC of the given byte sequence (`data`)."""
+        return self.finalize(self.update(self.register(), data, slices))
+
+    # Method to verify the algorithm against its published check value
+    def verify(self):
+        """Returns True if the CRC of the ASCII string "123456789" matches
+        the published check value."""
+        return self.crc(b'123456789') == self.check
+
+
+# Source: https://reveng.sourceforge.io/crc-catalogue/
+catalogue = {spec.name: spec for spec in [
+    CrcSpec('CRC-3/GSM', 3, 0x3, 0x0, False, False, 0x7, 0x4),
+    CrcSpec('CRC-4/G-704', 4, 0x3, 0x0, True, True, 0x0, 0x7),
+    CrcSpec('CRC-5/USB', 5, 0x05, 0x1F, True, True, 0x1F, 0x19),
+    CrcSpec('CRC-7/MMC', 7, 0x09, 0x00, False, False, 0x00, 0x75),
+    CrcSpec('CRC-8/SMBUS', 8, 0x07, 0x00, False, False, 0x00, 0xF4),
+    CrcSpec('CRC-8/MAXIM-DOW', 8, 0x31, 0x00, True, True, 0x00, 0xA1),
+    CrcSpec('CRC-8/AUTOSAR', 8, 0x2F, 0xFF, False, False, 0xFF, 0xDF),
+    CrcSpec('CRC-16/ARC', 16, 0x8005, 0x0000, True, True, 0x0000, 0xBB3D),
+    CrcSpec('CRC-16/CCITT-FALSE', 16, 0x1021, 0xFFFF, False, False, 0x0000, 0x29B1),
+    CrcSpec('CRC-16/KERMIT', 16, 0x1021, 0x0000, True, True, 0x0000, 0x2189),
+    CrcSpec('CRC-16/XMODEM', 16, 0x1021, 0x0000, False, False, 0x0000, 0x31C3),
+    CrcSpec('CRC-16/MODBUS', 16, 0x8005, 0xFFFF, True, True, 0x0000, 0x4B37),
+    CrcSpec('CRC-16/USB', 16, 0x8005, 0xFFFF, True, True, 0xFFFF, 0xB4C8),
+    CrcSpec('CRC-16/IBM-SDLC', 16, 0x1021, 0xFFFF, True, True, 0xFFFF, 0x906E),
+    CrcSpec('CRC-24/OPENPGP', 24, 0x864CFB, 0xB704CE, False, False, 0x000000, 0x21CF02),
+    CrcSpec('CRC-32/ISO-HDLC', 32, 0x04C11DB7, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xCBF43926),
+    CrcSpec('CRC-32/BZIP2', 32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0xFFFFFFFF, 0xFC891918),
+    CrcSpec('CRC-32/MPEG-2', 32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0x00000000, 0x0376E6E7),
+    CrcSpec('CRC-32/CKSUM', 32, 0x04C11DB7, 0x00000000, False, False, 0xFFFFFFFF, 0x765E7680),
+    CrcSpec('CRC-32/ISCSI', 32, 0x1EDC6F41, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xE3069283),
+    CrcSpec('CRC-32/AIXM', 32, 0x814141AB, 0x00000000, False, False, 0x00000000, 0x3010BF7F),
+    CrcSpec('CRC-40/GSM', 40, 0x0004820009, 0x0000000000, False, False, 0xFFFFFFFFFF, 0xD4164FC646),
+    CrcSpec('CRC-64/ECMA-182', 64, 0x42F0E1EBA9EA3693, 0x0000000000000000, False, False,
+            0x0000000000000000, 0x6C40DF5F0B497347),
+    CrcSpec('CRC-64/XZ', 64, 0x42F0E1EBA9EA3693, 0xFFFFFFFFFFFFFFFF, True, True,
+            0xFFFFFFFFFFFFFFFF, 0x995DC9BBDF1939FA),
+    CrcSpec('CRC-64/GO-ISO', 64, 0x000000000000001B, 0xFFFFFFFFFFFFFFFF, True, True,
+            0xFFFFFFFFFFFFFFFF, 0xB90956C775A41001),
+]}
+
+# Other names of the algorithms in the catalogue (alias -> name)
+aliases = {
+    'CRC-32': 'CRC-32/ISO-HDLC',
+    'CRC-32/ADCCP': 'CRC-32/ISO-HDLC',
+    'CRC-32/V-42': 'CRC-32/ISO-HDLC',
+    'CRC-32/XZ': 'CRC-32/ISO-HDLC',
+    'PKZIP': 'CRC-32/ISO-HDLC',
+    'CRC-32C': 'CRC-32/ISCSI',
+    'CRC-32/CASTAGNOLI': 'CRC-32/ISCSI',
+    'CRC-16/IBM-3740': 'CRC-16/CCITT-FALSE',
+    'CRC-16/AUTOSAR': 'CRC-16/CCITT-FALSE',
+    'CRC-16/X-25': 'CRC-16/IBM-SDLC',
+    'CRC-16/ACORN': 'CRC-16/XMODEM',
+    'CRC-16/LTE': 'CRC-16/XMODEM',
+    'CRC-16/CCITT': 'CRC-16/KERMIT',
+    'CRC-16': 'CRC-16/ARC',
+    'CRC-16/LHA': 'CRC-16/ARC',
+    'CRC-8': 'CRC-8/SMBUS',
+    'CRC-8/MAXIM': 'CRC-8/MAXIM-DOW',
+    'CRC-64': 'CRC-64/ECMA-182',
+    'CRC-64/GO-ECMA': 'CRC-64/XZ',
+    'CRC-64/ISO': 'CRC-64/GO-ISO',
+}
+
+
+# Function to return the parameters of a standard CRC algorithm
+def get_spec(name):
+    """Returns the parameters of a standard CRC algorithm given its name
+    (`name`) as listed in the CRC catalogue, or one of its aliases. Names
+    are case-insensitive.
+
+    Parameters:
+    -----------
+        name : str
+            name (or alias) of the standard CRC algorithm
+
+    Returns:
+    --------
+        get_spec(str) : CrcSpec
+            parameters of the standard CRC algorithm
+
+    Raises:
+    -------
+        ValueError : if `name` is not a known algorithm
+
+    Examples:
+    ---------
+        >>> get_spec('crc-32c').name
+        'CRC-32/ISCSI'
+        >>> get_spec('CRC-99')
+        ValueError
+    """
+    name = name.upper()
+    name = aliases.get(name, name)
+    if name not in catalogue:
+        raise ValueError('Unknown CRC algorithm.')
+    return catalogue[name]
+
+
+# Function to calculate the standard CRC of a byte sequence
+def crc_spec(data, spec, engine=None):
+    """Calculates the standard CRC of the given byte sequence (`data`) using
+    the parameters of the standard CRC algorithm (`spec`, a `CrcSpec` or the
+    name of an algorithm from the catalogue).
+
+    Parameters:
+    -----------
+        data : bytes
+            any object supporting the buffer protocol (bytes, bytearray, memoryview...)
+        spec : CrcSpec
+            parameters of the standard CRC algorithm (or its name)
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Returns:
+    --------
+        crc_spec(bytes, CrcSpec, str) : int
+            standard CRC of the byte sequence
+
+    Examples:
+    ---------
+        >>> hex(crc_spec(b'123456789', 'CRC-32/ISO-HDLC'))
+        '0xcbf43926'
+        >>> hex(crc_spec(b'123456789', 'CRC-16/CCITT-FALSE'))
+        '0x29b1'
+    """
+    # Import libraries (the incremental CRC object depends on this module)
+    from .stream import Crc
+
+    if isinstance(spec, str):
+        spec = get_spec(spec)
+    return Crc(spec, data, engine).crc
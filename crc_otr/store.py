@@ -0,0 +1,197 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides the store of precomputed lookup tables shipped with
+the cyclic redundancy check tool (`crc_otr`). The slicing-by-8 tables of
+the commonly used generator polynomials (see the `generators` module) and
+of the standard CRC algorithms (see the `spec` module, in their bit order)
+are packed into a single file (`tables.bin`), which is memory-mapped on
+first use - so neither importing the package nor the first CRC of a
+standard generator pays the cost of computing the tables.
+
+The store is written when the package is built (`setup.py`), and in a
+source checkout with `python build_tables.py`. Without it, the tables are
+computed on first use.
+
+File format (little-endian):
+----------------------------
+    header : magic (4s), version (H), number of entries (H)
+    entry  : generator without the leading term (Q), degree (B),
+             reflected (B), number of tables (B), bytes per value (B),
+             offset of the tables in the file (Q)
+    tables : 256 values per table, 4 or 8 bytes each
+
+Functions:
+----------
+    load_tables(int, bool, int) : list
+        Returns the stored lookup tables for the given generator polynomial.
+    stored_generators() : list
+        Returns the generator polynomials whose lookup tables are stored.
+    build_store(str, list) : int
+        Writes the store of precomputed lookup tables for the given generator polynomials.
+"""
+
+# Import libraries
+import os
+import struct
+import sys
+
+# Path to the store, and layout of its header and entries
+store_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tables.bin')
+_header = struct.Struct('<4sHH')
+_entry = struct.Struct('<QBBBBQ')
+_magic = b'CRCT'
+_version = 1
+# Number of tables stored per generator (slicing-by-8)
+_stored_slices = 8
+
+# Index of the store ((generator polynomial, reflected) -> view of the tables), loaded on first use
+_index = None
+
+
+# Function to open the store and read its index
+def _load_index():
+    index = {}
+    # Values are stored little-endian, and read in the native byte order
+    if sys.byteorder != 'little':
+        return index
+    try:
+        with open(store_path, 'rb') as file:
+            import mmap  # only needed once the store is used
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return index  # no store (or an empty one): tables are computed instead
+    view = memoryview(mapped)
+    magic, version, count = _header.unpack_from(view)
+    if magic != _magic or version != _version:
+        return index
+    for i in range(count):
+        polynomial, width, reflected, slices, size, offset = _entry.unpack_from(view, _header.size + i * _entry.size)
+        values = view[offset:offset + slices * 256 * size].cast('I' if size == 4 else 'Q')
+        index[((1 << width) | polynomial, bool(reflected))] = values
+    return index
+
+
+# Function to return the stored lookup tables for a generator polynomial
+def load_tables(generator, reflected=False, count=None):
+    """Returns the lookup tables stored for the given generator polynomial
+    (`generator`) - the first tables of the slicing-by-N engine, as used by
+    `crc_slicing_tables`, at most `count` of them - or None if the generator
+    is not in the store. The store is opened on the first call.
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+        reflected : bool
+            True for the reflected (LSB-first) bit order
+        count : int
+            maximum number of tables returned (all stored tables by default)
+
+    Returns:
+    --------
+        load_tables(int, bool, int) : list
+            list of lookup tables with 256 remainders each (or None)
+
+    Examples:
+    ---------
+        >>> len(load_tables(0b100000100110000010001110110110111))
+        8
+        >>> len(load_tables(0b100000100110000010001110110110111, count=1))
+        1
+        >>> load_tables(0b10101) is None
+        True
+    """
+    global _index
+    if _index is None:
+        _index = _load_index()
+    values = _index.get((generator, reflected))
+    if values is None:
+        return None
+    end = len(values) if count is None else min(256 * count, len(values))
+    return [values[k:k + 256].tolist() for k in range(0, end, 256)]
+
+
+# Function to return the generator polynomials of the store
+def stored_generators():
+    """Returns the generator polynomials whose lookup tables are written to
+    the store when the package is built - the commonly used generators in
+    the regular (MSB-first) bit order, and the generators of the standard
+    CRC algorithms in their own bit order - as (generator, reflected) pairs.
+
+    Returns:
+    --------
+        stored_generators() : list
+            list of (generator polynomial, reflected) pairs
+
+    Examples:
+    ---------
+        >>> (0b100000100110000010001110110110111, True) in stored_generators()
+        True
+    """
+    # Import libraries (the engine loads tables from this module)
+    from .generators import get_generators
+    from .spec import catalogue
+
+    generators = [(int(generator, 2), False) for generator, _ in get_generators()]
+    generators += [(spec.generator, spec.refin) for spec in catalogue.values()]
+    return list(dict.fromkeys(generators))
+
+
+# Function to write the store of precomputed lookup tables
+def build_store(path, generators):
+    """Computes the slicing-by-8 lookup tables of the given generator
+    polynomials (`generators`, a list of (generator, reflected) pairs) and
+    writes them to the store (`path`). Generators of degree below 8 or above
+    64 are skipped, since their tables are either cheap to compute or do not
+    fit in 64 bits.
+
+    Parameters:
+    -----------
+        path : str
+            path to the store
+        generators : list
+            list of (generator polynomial, reflected) pairs
+
+    Returns:
+    --------
+        build_store(str, list) : int
+            number of generators written to the store
+
+    Examples:
+    ---------
+        >>> build_store('tables.bin', [(0b100000100110000010001110110110111, False)])
+        1
+    """
+    # Import libraries (the engine itself loads tables from the store)
+    from .engine import _crc_table, _extend_tables
+
+    entries = []
+    for generator, reflected in dict.fromkeys(generators):
+        width = generator.bit_length() - 1
+        if not 8 <= width <= 64:
+            continue
+        size = 4 if width <= 32 else 8
+        tables = _extend_tables([_crc_table(generator, reflected)], generator, _stored_slices, reflected)
+        entries.append((generator, width, reflected, size,
+                        b''.join(struct.pack('<256' + ('I' if size == 4 else 'Q'), *table) for table in tables)))
+
+    # Tables start after the index, aligned to 8 bytes
+    offset = -(-(_header.size + len(entries) * _entry.size) // 8) * 8
+    index, data = [_header.pack(_magic, _version, len(entries))], []
+    for generator, width, reflected, size, blob in entries:
+        index.append(_entry.pack(generator ^ (1 << width), width, reflected, _stored_slices, size, offset))
+        data.append(blob)
+        offset += len(blob)
+    head = b''.join(index)
+    with open(path, 'wb') as file:
+        file.write(head + bytes(-len(head) % 8) + b''.join(data))
+    return len(entries)
+
@@ -0,0 +1,179 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides incremental cyclic redundancy check tooling under
+the `crc_otr` package, with an interface similar to the `hashlib` module.
+A message can be fed in chunks of any size, and only the CRC register is
+kept between the chunks - so the memory used does not depend on the size
+of the message.
+
+Classes:
+--------
+    Crc(int, bytes, str)
+        Incremental CRC of a byte stream using the provided generator polynomial.
+"""
+
+# Import libraries
+from .bitseq import BitSeq
+from .buffer import crc_bytes, crc_bytes_update
+from .combine import crc_combine
+from .crc_otr import engines, generator_engines, get_engine
+from .dispatch import last_engine, select_engine, _record
+from . import instrument
+from .spec import CrcSpec
+
+# Chunks shorter than this (in bytes) are processed inline by `update_async`, longer ones in an executor
+async_inline_limit = 1 << 16
+
+
+# Class to calculate CRC incrementally
+class Crc:
+    """Incremental cyclic redundancy check (CRC) of a byte stream using the
+    provided generator polynomial (`generator`). Chunks of the stream are
+    fed with `update`, and the CRC check sequence of all the data fed so far
+    is returned by `digest`, `hexdigest` or the `crc` attribute. If generator
+    is not passed as an argument, CRC32 is used by default.
+
+    A standard CRC algorithm (`CrcSpec`, see the `spec` module) can be passed
+    instead of the generator polynomial, in which case its initial value,
+    bit order and final XOR value are applied as well.
+
+    Parameters:
+    -----------
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC,
+            or the parameters of a standard CRC algorithm (CrcSpec)
+        data : bytes
+            first chunk of the stream (optional)
+        engine : str
+            name of the engine used to perform CRC (optional)
+
+    Examples:
+    ---------
+        >>> crc = Crc(0b10101)
+        >>> crc.update(b'\\x6d')
+        >>> crc.crc
+        0b1011
+        >>> crc.hexdigest()
+        '0b'
+        >>> Crc(get_spec('CRC-32/ISO-HDLC'), b'123456789').hexdigest()
+        'cbf43926'
+    """
+    __slots__ = ('generator', 'engine', 'digest_size', 'spec', 'register')
+
+    def __init__(self, generator=0b100000100110000010001110110110111, data=None, engine=None):
+        self.spec = None
+        if isinstance(generator, CrcSpec):
+            self.spec = generator
+            generator = generator.generator
+        self.generator = generator
+        self.engine = engine
+        self.digest_size = (generator.bit_length() + 6) // 8  # bytes needed to store the CRC
+        self.register = 0 if self.spec is None else self.spec.register()  # CRC register
+        if data is not None:
+            self.update(data)
+
+    @property
+    def crc(self):
+        """CRC check sequence of the data consumed so far."""
+        if self.spec is None:
+            return self.register
+        return self.spec.finalize(self.register)
+
+    def __repr__(self):
+        return "Crc(generator={:#b}, crc={:#x})".format(self.generator, self.crc)
+
+    # Method to feed a chunk of the stream
+    def update(self, data):
+        """Feeds a chunk of the stream (`data`) - any object supporting the
+        buffer protocol (bytes, bytearray, memoryview...), or a bit sequence
+        (`BitSeq`) of any length - into the CRC. Standard CRC algorithms
+        only accept whole bytes."""
+        start_time = instrument.clock() if instrument.enabled else None
+        if self.spec is None:
+            self.register = crc_bytes_update(self.register, data, self.generator, self.engine)
+        else:
+            if isinstance(data, BitSeq):
+                if len(data) % 8:
+                    raise ValueError('Invalid bit sequence.')
+                data = data.to_bytes()
+            view = memoryview(data).cast('B')
+            engine = self.engine
+            if engine is None and self.generator not in generator_engines:
+                engine = select_engine(self.generator, 8 * len(view), 'bytes')
+            engine = get_engine(self.generator, engine)
+            # The bit-serial, bulk and Barrett engines only work MSB-first, so slicing-by-8 is used instead
+            if engines[engine] < 1:
+                engine = 'slicing8'
+            self.register = self.spec.update(self.register, view, engines[engine])
+            _record(engine)
+        if start_time is not None:
+            size = (len(data) + 7) // 8 if isinstance(data, BitSeq) else memoryview(data).nbytes
+            instrument._count(self.generator, last_engine(), size, instrument.clock() - start_time)
+
+    # Method to feed a chunk of the stream without blocking the event loop
+    async def update_async(self, data, executor=None):
+        """Feeds a chunk of the stream (`data`) into the CRC, like `update`,
+        from a coroutine. Short chunks (below `async_inline_limit` bytes)
+        are processed inline; longer ones are handed to the executor
+        (`executor`, the default thread pool of the event loop if None), so
+        the event loop keeps serving other tasks meanwhile. With a process
+        pool, the CRC of the chunk is calculated in a worker process and
+        combined with the CRC of the data fed so far (see `crc_combine`) -
+        except for standard CRC algorithms (`CrcSpec`), which use the
+        default thread pool instead.
+        Calls must not overlap - each one has to be awaited before the next."""
+        # Import libraries (only needed for asynchronous updates)
+        from concurrent.futures import ProcessPoolExecutor
+        import asyncio
+
+        if isinstance(data, BitSeq):
+            if data._data is None or len(data) % 8:
+                self.update(data)  # bits not held in whole bytes are fed inline
+                return
+            data = data._data
+        view = memoryview(data).cast('B')
+        if len(view) < async_inline_limit:
+            self.update(view)
+            return
+        loop = asyncio.get_running_loop()
+        if isinstance(executor, ProcessPoolExecutor):
+            if self.spec is None:
+                crc = await loop.run_in_executor(executor, crc_bytes, view.tobytes(), self.generator, self.engine)
+                self.register = crc_combine(self.register, crc, len(view), self.generator)
+                return
+            # Standard CRC algorithms (initial value, reflection) are not combined: default thread pool
+            executor = None
+        await loop.run_in_executor(executor, self.update, view)
+
+    # Method to return the CRC as bytes
+    def digest(self):
+        """Returns the CRC check sequence of the data fed so far as bytes
+        (big-endian, `digest_size` bytes long)."""
+        return self.crc.to_bytes(self.digest_size, 'big')
+
+    # Method to return the CRC as a string of hexadecimal digits
+    def hexdigest(self):
+        """Returns the CRC check sequence of the data fed so far as a string
+        of hexadecimal digits (two digits per byte of `digest`)."""
+        return self.digest().hex()
+
+    # Method to return a copy of the CRC object
+    def copy(self):
+        """Returns a copy of the CRC object, which can be updated
+        independently - useful to calculate the CRC of several messages
+        sharing the same prefix."""
+        other = Crc.__new__(Crc)
+        other.generator = self.generator
+        other.engine = self.engine
+        other.digest_size = self.digest_size
+        other.spec = self.spec
+        other.register = self.register
+        return other
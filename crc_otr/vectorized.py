@@ -0,0 +1,201 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+__author__ = "Uros Bojanic"
+__version__ = "1.0.1"
+
+"""This module provides a NumPy backend of the cyclic redundancy check tool
+(`crc_otr`) for fixed-length frames stored in a 2-D array with one frame
+per row. The CRCs of all the frames are calculated together, one byte
+column at a time, using the lookup table with fancy indexing - so the
+Python-level loop runs over the length of the frames, not their number.
+
+NumPy is optional: when it is not installed (or the generator polynomial
+is wider than 64 bits), the functions fall back to a Python loop over the
+frames and return lists instead of arrays.
+
+Functions:
+----------
+    crc_frames(ndarray, int) : ndarray
+        Calculates the CRC check sequence of each frame (row) of the given array.
+    crc_frames_check(ndarray, int) : ndarray
+        Performs a cyclic redundancy check (CRC) on each frame (row) of the given array.
+    crc_frames_decode(ndarray, int) : ndarray
+        Decodes each frame (row) of the given array using the provided generator polynomial.
+"""
+
+# Import libraries
+from .buffer import crc_bytes, crc_bytes_check
+from .engine import crc_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Function to feed byte columns into the CRC registers of all frames (columns are widened one at a time)
+def _registers(columns, generator):
+    table = np.array(crc_table(generator), dtype=np.uint64)
+    width = generator.bit_length() - 1
+    registers = np.zeros(columns.shape[0], dtype=np.uint64)
+    if width >= 8:
+        shift = np.uint64(width - 8)
+        mask = np.uint64((1 << width) - 1)
+        for column in columns.T:
+            # Bits shifted out of the 64-bit registers are cleared by the mask anyway
+            registers = table[(registers >> shift) ^ column.astype(np.uint64)] ^ ((registers << np.uint64(8)) & mask)
+    else:
+        shift = np.uint64(8 - width)
+        for column in columns.T:
+            registers = table[(registers << shift) ^ column.astype(np.uint64)]
+    return registers
+
+
+# Function to return the frames as a 2-D array of bytes, not copied if already one (or None if NumPy cannot be used)
+def _columns(frames, generator):
+    if np is None or not 1 <= generator.bit_length() - 1 <= 64:
+        return None
+    if isinstance(frames, (list, tuple)):
+        try:
+            views = [memoryview(frame).cast('B') for frame in frames]
+        except TypeError:
+            views = None  # nested lists of numbers
+        if views is not None:
+            # Byte sequences of the same length: joined into a single array, one frame per row
+            frame_bytes = len(views[0]) if views else 0
+            if any(len(view) != frame_bytes for view in views):
+                raise ValueError('Frames must have the same length.')
+            frames = np.frombuffer(b''.join(views), dtype=np.uint8).reshape(len(views), frame_bytes)
+    frames = np.asarray(frames)
+    if frames.ndim != 2 or frames.dtype != np.uint8:
+        raise ValueError('Frames must be a 2-D array of bytes (uint8).')
+    return frames
+
+
+# Function to calculate the CRC check sequences of many frames
+def crc_frames(frames, generator=0b100000100110000010001110110110111):
+    """Calculates the CRC check sequence of each frame of the given array
+    (`frames`, shape (n_frames, frame_bytes), dtype uint8) using the
+    provided generator polynomial (`generator`) - the same results as
+    calling `crc_bytes` on each row. If generator is not passed as an
+    argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        frames : ndarray
+            2-D array of bytes with one frame per row (or a list of byte sequences of the same length)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_frames(ndarray, int) : ndarray
+            array of CRC check sequences (uint64), one per frame
+
+    Raises:
+    -------
+        ValueError : if `frames` is not a 2-D array of bytes, or the frames have different lengths
+
+    Examples:
+    ---------
+        >>> crc_frames(np.array([[0x6d], [0x00]], dtype=np.uint8), 0b10101)
+        array([11,  0], dtype=uint64)
+    """
+    columns = _columns(frames, generator)
+    if columns is None:
+        return [crc_bytes(frame, generator) for frame in frames]
+    return _registers(columns, generator)
+
+
+# Function to perform cyclic redundancy check (CRC) on many frames
+def crc_frames_check(frames, generator):
+    """Performs a cyclic redundancy check (CRC) on each frame of the given
+    array (`frames`, shape (n_frames, frame_bytes), dtype uint8) using
+    polynomial long division with the generator polynomial (`generator`),
+    and returns the terminal remainders - the same results as calling
+    `crc_bytes_check` on each row.
+
+    Parameters:
+    -----------
+        frames : ndarray
+            2-D array of bytes with one frame per row (or a list of byte sequences of the same length)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_frames_check(ndarray, int) : ndarray
+            array of terminal remainders (uint64), one per frame
+
+    Raises:
+    -------
+        ValueError : if `frames` is not a 2-D array of bytes, or the frames have different lengths
+
+    Examples:
+    ---------
+        >>> crc_frames_check(np.array([[0x06, 0xd0], [0x06, 0xdb]], dtype=np.uint8), 0b10101)
+        array([11,  0], dtype=uint64)
+    """
+    columns = _columns(frames, generator)
+    if columns is None:
+        return [crc_bytes_check(frame, generator) for frame in frames]
+    width = generator.bit_length() - 1
+    mask = np.uint64((1 << width) - 1)
+    # Split the frames into a head and a tail of at least `width` bits (see `crc_bytes_check`)
+    tail_bytes = min((width + 7) // 8, columns.shape[1])
+    head, tail = columns[:, :columns.shape[1] - tail_bytes], columns[:, columns.shape[1] - tail_bytes:]
+    registers = _registers(head, generator)
+    # Tail of the frames as numbers (at most 64 bits)
+    tails = np.zeros(columns.shape[0], dtype=np.uint64)
+    for column in tail.T:
+        tails = (tails << np.uint64(8)) | column.astype(np.uint64)
+    # Remainder of H(x) * x^8k + T(x), using the lookup table for the top bits of
+    # both terms (fewer than 8 bits each, since width < 8k <= width + 7 <= 64)
+    if 8 * tail_bytes > width:
+        table = np.array(crc_table(generator), dtype=np.uint64)
+        top = np.uint64(width)
+        registers = registers << np.uint64(8 * tail_bytes - width)
+        registers = table[registers >> top] ^ (registers & mask)
+        tails = table[tails >> top] ^ (tails & mask)
+    return registers ^ tails
+
+
+# Function to decode many frames
+def crc_frames_decode(frames, generator=0b100000100110000010001110110110111):
+    """Decodes each frame of the given array (`frames`, shape (n_frames,
+    frame_bytes), dtype uint8) using the provided generator polynomial
+    (`generator`), and returns boolean values indicating whether there are
+    errors in each frame or not - the same results as calling
+    `crc_bytes_decode` on each row. If generator is not passed as an
+    argument, CRC32 is used by default.
+
+    Parameters:
+    -----------
+        frames : ndarray
+            2-D array of bytes with one frame per row (or a list of byte sequences of the same length)
+        generator : int
+            generator polynomial (binary representation) used as the divisor in CRC
+
+    Returns:
+    --------
+        crc_frames_decode(ndarray, int) : ndarray
+            array of boolean values, True for each frame in which no errors are detected
+
+    Raises:
+    -------
+        ValueError : if `frames` is not a 2-D array of bytes, or the frames have different lengths
+
+    Examples:
+    ---------
+        >>> crc_frames_decode(np.array([[0x06, 0xd0], [0x06, 0xdb]], dtype=np.uint8), 0b10101)
+        array([False,  True])
+    """
+    remainders = crc_frames_check(frames, generator)
+    if np is None or isinstance(remainders, list):
+        return [remainder == 0 for remainder in remainders]
+    return remainders == 0
@@ -6,54 +6,190 @@
 # ---------------------------------------------------------------------------
 
 # Python program to create a simple GUI using Tkinter
-from crc_otr import crc_decode, crc_encode
+from crc_otr import BitSeq, Crc, crc_decode, crc_encode
+from crc_otr.generators import generators_hex, get_generator
 from tkinter import *
+from tkinter import filedialog, ttk
 import logging
-
-
-# Function to decode information sequence using CRC
-def keyboard_function_decode(label, sequence, generator):
+import os
+import queue
+import threading
+
+# Input modes of the information sequence: typed binary digits, typed hexadecimal digits, or a file
+input_modes = ('Binary', 'Hex', 'File')
+# Digits accepted in each typed input mode, and the number of bits per digit
+input_digits = {'Binary': (frozenset('01'), 1), 'Hex': (frozenset('0123456789abcdefABCDEF'), 4)}
+# Number of bytes of a file fed to the CRC between progress updates (and checks for cancellation)
+chunk_size = 1 << 20
+# Interval between checks for messages of the worker thread [ms]
+poll_interval = 50
+# Maximum number of digits shown in the result label (longer results are shortened)
+display_digits = 48
+# Names of the commonly used generator polynomials (lowercase), accepted in the generator textbox
+generator_names = frozenset(name.lower() for name in generators_hex.values())
+
+
+# Function to convert typed digits into a bit sequence (leading zeros preserved)
+def parse_digits(text, mode):
+    digits, bits = input_digits['Hex' if mode == 'Hex' else 'Binary']
+    # Set comparison and int() run in C, so multi-MB inputs are validated and converted quickly
+    if len(text) <= 0:
+        raise ValueError('Textbox empty.')
+    if not digits.issuperset(text):
+        raise ValueError('Textbox can only contain {} digits.'.format('hexadecimal' if bits == 4 else 'binary'))
+    return BitSeq(int(text, 16 if bits == 4 else 2), bits * len(text))
+
+
+# Function to convert the typed generator polynomial (a name such as CRC-32, a number with a 0b/0x prefix,
+# or digits of the input mode)
+def parse_generator(text, mode):
+    if text.lower() in generator_names or text[:2].lower() in ('0b', '0x'):
+        return get_generator(text)
+    return int(parse_digits(text, mode))
+
+
+# Function to format a bit sequence as digits of the input mode (shortened if too long to display)
+def format_digits(seq, mode):
+    if mode == 'Hex':
+        text = "0x" + format(int(seq), 'x').zfill((len(seq) + 3) // 4)
+    else:
+        text = "0b" + format(int(seq), 'b').zfill(len(seq))
+    if len(text) > display_digits:
+        text = "{}...{}\n({} digits)".format(text[:display_digits // 2], text[-display_digits // 2:], len(text) - 2)
+    return text
+
+
+# Function to calculate the CRC of a file in chunks, reporting progress (runs in the worker thread)
+def crc_file_progress(path, generator, cancel, messages):
+    crc = Crc(generator)
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        done = 0
+        buffer = bytearray(chunk_size)
+        with memoryview(buffer) as view:
+            count = file.readinto(buffer)
+            while count:
+                if cancel.is_set():
+                    return None
+                crc.update(view[:count])
+                done += count
+                if size > 0:
+                    messages.put(('progress', min(done / size, 1.0)))
+                count = file.readinto(buffer)
+    return crc
+
+
+# Function to encode or decode the input (runs in the worker thread, results are sent to the GUI thread)
+def compute(action, mode, sequence_text, generator_text, cancel, messages):
     try:
-        # Extract text from labels (textboxes)
-        sequence_text = sequence.get()
-        generator_text = generator.get()
-        # Check for errors
-        for text in [sequence_text, generator_text]:
-            if len(text) <= 0:
-                raise ValueError('Textbox empty.')
-            if not all(character in "01" for character in text):
-                raise ValueError('Textbox can only contain binary digits (0 or 1).')
-        # Convert text to binary number
-        seq = int("0b" + sequence_text, 2)
-        gen = int("0b" + generator_text, 2)
-        # Decode using cyclic redundancy check
-        decoded = crc_decode(seq, gen)
-        label.set("DECODED!\n" + str(decoded))
+        generator = parse_generator(generator_text, mode)
+        if mode == 'File':
+            if action == 'decode' and not generator & 1:
+                raise ValueError('Invalid generator polynomial.')
+            crc = crc_file_progress(sequence_text, generator, cancel, messages)
+            if crc is None:
+                return
+            if action == 'decode':
+                # A file ending with its CRC (see `crc_bytes_encode`) leaves no remainder
+                result = "DECODED!\n" + str(crc.crc == 0)
+            else:
+                result = "CHECKSUM!\n" + crc.hexdigest()
+        else:
+            seq = parse_digits(sequence_text, mode)
+            # One-off generators: no lookup tables
+            if action == 'decode':
+                result = "DECODED!\n" + str(crc_decode(seq, generator, engine='bulk'))
+            else:
+                encoded = crc_encode(seq, generator, engine='bulk')
+                result = "ENCODED!\n" + format_digits(encoded, mode)
+        messages.put(('result', result))
+    except OSError as e:
+        messages.put(('result', "ERROR!\nCannot read file."))
+        # logging.exception(e)
     except Exception as e:
-        label.set("ERROR!\nInvalid input.")
+        messages.put(('result', "ERROR!\nInvalid input."))
         # logging.exception(e)
 
 
+# Class to run CRC computations in a worker thread, keeping the GUI responsive
+class CrcWorker:
+    """Runs one CRC computation at a time in a background thread, and shows
+    its progress and result in the GUI (Tkinter is only used from the GUI
+    thread: the worker sends messages through a queue, polled with
+    `after`). Starting a new computation cancels the running one; files are
+    cancelled between chunks, while the result of a typed input that is
+    being computed is discarded."""
+
+    def __init__(self, gui, label, progress):
+        self.gui = gui
+        self.label = label
+        self.progress = progress
+        self.cancel_event = None
+        self.messages = None
+
+    # Method to start a computation
+    def start(self, action, mode, sequence_text, generator_text):
+        self.cancel()
+        self.cancel_event = threading.Event()
+        self.messages = queue.Queue()
+        if mode == 'File':
+            self.progress.configure(mode='determinate', value=0)
+        else:
+            self.progress.configure(mode='indeterminate')
+            self.progress.start()
+        self.label.set("WORKING...\nPress Cancel to stop.")
+        threading.Thread(target=compute, daemon=True,
+                         args=(action, mode, sequence_text, generator_text, self.cancel_event, self.messages)).start()
+        self.gui.after(poll_interval, self.poll, self.messages)
+
+    # Method to cancel the running computation
+    def cancel(self):
+        if self.cancel_event is None:
+            return
+        self.cancel_event.set()
+        self.cancel_event = self.messages = None
+        self.progress.stop()
+        self.progress.configure(mode='determinate', value=0)
+        self.label.set("CANCELLED!\nPlease press Decode/Encode.")
+
+    # Method to show the messages of the worker thread
+    def poll(self, messages):
+        if messages is not self.messages:
+            return  # cancelled, or replaced by a newer computation
+        try:
+            while True:
+                kind, value = messages.get_nowait()
+                if kind == 'progress':
+                    self.progress.configure(value=100 * value)
+                    continue
+                self.progress.stop()
+                self.progress.configure(mode='determinate', value=100)
+                self.label.set(value)
+                self.cancel_event = self.messages = None
+                return
+        except queue.Empty:
+            self.gui.after(poll_interval, self.poll, messages)
+
+
+# Function to decode information sequence using CRC
+def keyboard_function_decode(worker, sequence, generator, mode):
+    worker.start('decode', mode.get(), sequence.get(), generator.get())
+
+
 # Function to encode information sequence using CRC
-def keyboard_function_encode(label, sequence, generator):
+def keyboard_function_encode(worker, sequence, generator, mode):
+    worker.start('encode', mode.get(), sequence.get(), generator.get())
+
+
+# Function to select a file as the input (switches to the file input mode, errors are shown in the result label)
+def keyboard_function_open(textbox, mode, result):
     try:
-        # Extract text from labels (textboxes)
-        sequence_text = sequence.get()
-        generator_text = generator.get()
-        # Check for errors
-        for text in [sequence_text, generator_text]:
-            if len(text) <= 0:
-                raise ValueError('Textbox empty.')
-            if not all(character in "01" for character in text):
-                raise ValueError('Textbox can only contain binary digits (0 or 1).')
-        # Convert text to binary number
-        seq = int("0b" + sequence_text, 2)
-        gen = int("0b" + generator_text, 2)
-        # Encode using cyclic redundancy check
-        encoded = crc_encode(seq, gen)
-        label.set("ENCODED!\n" + str(bin(encoded)))
+        path = filedialog.askopenfilename(title="Open file")
+        if path:
+            textbox.set(path)
+            mode.set('File')
     except Exception as e:
-        label.set("ERROR!\nInvalid input.")
+        result.set("ERROR!\nCannot open file.")
         # logging.exception(e)
 
 
@@ -180,34 +316,57 @@ if __name__ == "__main__":
                    height=button_height, width=button_width)
     clear.grid(row=4, column=3)
 
-    # Padding between input section and action buttons (decode/encode)
-    Label(gui, textvariable="", bg=bg_color).grid(row=5, column=0, columnspan=4)
+    # Create input mode selection (typed binary or hexadecimal digits, or a file)
+    input_mode = StringVar()
+    for column, name in enumerate(input_modes):
+        Radiobutton(gui, text=name, value=name, variable=input_mode,
+                    bg=bg_color, activebackground=bg_color).grid(row=5, column=column)
+    input_mode.set('Binary')  # initial value
+
+    # Button to select a file as the information sequence (first input text-field, textbox_seq)
+    button_open = Button(gui, text='Open file', fg='black',
+                         command=lambda: keyboard_function_open(textbox_seq, input_mode, text_result),
+                         height=button_height, width=button_width)
+    button_open.grid(row=5, column=3)
 
     # Button to decode given information sequence & generator polynomial
     button_decode = Button(gui, text='Decode', fg='black',
-                           command=lambda: keyboard_function_decode(text_result, textbox_seq, textbox_gen),
+                           command=lambda: keyboard_function_decode(worker, textbox_seq, textbox_gen, input_mode),
                            height=button_height, width=button_width)
     button_decode.grid(row=6, column=0, columnspan=2)
 
     # Button to encode given information sequence & generator polynomial
     button_encode = Button(gui, text='Encode', fg='black',
-                           command=lambda: keyboard_function_encode(text_result, textbox_seq, textbox_gen),
+                           command=lambda: keyboard_function_encode(worker, textbox_seq, textbox_gen, input_mode),
                            height=button_height, width=button_width)
     button_encode.grid(row=6, column=2, columnspan=2)
 
+    # Create progress bar of the running computation
+    progress = ttk.Progressbar(gui, orient=HORIZONTAL, mode='determinate', maximum=100)
+    progress.grid(row=7, column=0, columnspan=3, sticky="ew", padx=10)
+
+    # Button to cancel the running computation
+    button_cancel = Button(gui, text='Cancel', fg='black',
+                           command=lambda: worker.cancel(),
+                           height=button_height, width=button_width)
+    button_cancel.grid(row=7, column=3)
+
     # Create result label
     text_result = StringVar()
     label_result = Label(gui, textvariable=text_result, font=('Helvetica bold', 14),
-                         anchor="center", bg=bg_color).grid(row=7, column=0, columnspan=4, ipady=10)
+                         anchor="center", bg=bg_color).grid(row=8, column=0, columnspan=4, ipady=10)
     text_result.set("WELCOME!\nPlease press Decode/Encode.")
 
+    # Create worker running the computations in the background
+    worker = CrcWorker(gui, text_result, progress)
+
     # Create instructions label
     text_instructions = StringVar()
     label_instructions = Label(gui, textvariable=text_instructions, font=('Helvetica bold', 8),
-                               anchor="sw", bg=bg_color).grid(row=8, column=0, columnspan=4)
-    text_instructions.set("To use the CRC program, please input the binary representation of your\n"
-                          "information sequence and generator polynomial into labeled text-fields above,\n"
-                          "and click a button to either Decode or Encode the data block.")
+                               anchor="sw", bg=bg_color).grid(row=9, column=0, columnspan=4)
+    text_instructions.set("To use the CRC program, please input the binary (or hexadecimal) representation of\n"
+                          "your information sequence and generator polynomial into labeled text-fields above,\n"
+                          "or open a file, and click a button to either Decode or Encode the data block.")
 
     # start the GUI
     gui.mainloop()
@@ -6,12 +6,32 @@
 # ---------------------------------------------------------------------------
 
 # Python program to setup `crc_otr` package using PIP
+from setuptools.command.build_py import build_py
+import os
 import setuptools
+import sys
 
 # Read description from github repository
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+
+
+# Command to build the package, with the store of precomputed lookup tables (crc_otr.store) written at build time
+class BuildPy(build_py):
+    def run(self):
+        build_py.run(self)
+        if self.dry_run:
+            return
+        # The store is written by the package being built
+        sys.path.insert(0, self.build_lib)
+        try:
+            from crc_otr.store import build_store, stored_generators
+            build_store(os.path.join(self.build_lib, 'crc_otr', 'tables.bin'), stored_generators())
+        finally:
+            sys.path.remove(self.build_lib)
+
+
 # Setup
 setuptools.setup(
     name='crc_otr',
@@ -25,5 +45,11 @@ setuptools.setup(
         "Bug Tracker": "https://github.com/urkeboy/cyclic-redundancy-check/issues"
     },
     packages=['crc_otr'],
-    install_requires=[]
+    cmdclass={
+        'build_py': BuildPy  # writes the precomputed lookup tables (crc_otr/tables.bin)
+    },
+    install_requires=[],
+    extras_require={
+        'numpy': ['numpy']  # optional NumPy backend (crc_otr.vectorized)
+    }
 )
@@ -5,8 +5,8 @@
 # Created Date: 2022/03/14
 # ---------------------------------------------------------------------------
 
-# Python program to manually test CRC on 3 sets of data blocks
-from crc_otr import crc_decode, crc_encode
+# Python program to manually test CRC on 4 sets of data blocks
+from crc_otr import crc_decode, crc_encode, crc_bytes_decode, crc_bytes_encode
 
 
 # Driver code
@@ -51,3 +51,22 @@ if __name__ == "__main__":
         decoded = crc_decode(test_res, test_gen)
         # print result
         print("[{:12b}] % [{:5b}] -> {:b}\t# {}".format(test_seq, test_gen, test_res, decoded))
+
+    # CRC_BYTES_ENCODE - Manual Tests (leading zero bits are preserved)
+    print("Encode bytes (tests):")
+    encode_bytes_tests = [
+        (b'\x6d', 0b10101),         # >>> 6d 0d
+        (b'\x00\x67', 0b11001)      # >>> 00 67 0b
+    ]
+    # Run tests
+    for e in encode_bytes_tests:
+        # information sequence
+        test_seq = e[0]
+        # generator polynomial
+        test_gen = e[1]
+        # call CRC to generate suffix for the given information sequence
+        test_res = crc_bytes_encode(data=test_seq, generator=test_gen)
+        # call CRC to check for errors in the generated code (verify)
+        decoded = crc_bytes_decode(test_res, test_gen)
+        # print result
+        print("[{:>12}] % [{:5b}] -> {}\t# {}".format(test_seq.hex(' '), test_gen, test_res.hex(' '), decoded))
@@ -0,0 +1,53 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the asyncio-friendly CRC functions
+from crc_otr import Crc, crc_bytes, get_spec
+from crc_otr.aio import crc_stream
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import os
+import unittest
+
+
+# Function to return a stream reader holding the given data
+def stream_reader(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+# Tests of the asyncio-friendly CRC functions
+class TestAio(unittest.TestCase):
+    def test_stream(self):
+        data = os.urandom(300001)
+
+        async def run():
+            for chunk_size in (1000, 1 << 16, 1 << 20):
+                self.assertEqual(await crc_stream(stream_reader(data), chunk_size=chunk_size), crc_bytes(data))
+            self.assertEqual(await crc_stream(stream_reader(b'')), 0)
+            spec = get_spec('CRC-32/ISO-HDLC')
+            self.assertEqual(await crc_stream(stream_reader(b'123456789'), spec), spec.check)
+
+        asyncio.run(run())
+
+    # Long chunks are processed in a process pool, and combined with the CRC of the data fed so far
+    def test_process_pool(self):
+        data = os.urandom(1 << 18)
+
+        async def run():
+            crc = Crc(data=b'\x01')
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                await crc.update_async(data, executor)
+            self.assertEqual(crc.crc, crc_bytes(b'\x01' + data))
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the error detection analysis
+from crc_otr.analysis import hamming_distance, hamming_distance_table, hamming_weights
+from crc_otr.crc_otr import crc_encode
+import unittest
+
+
+# Function to count the codewords of each weight by encoding every information sequence
+def codeword_weights(generator, length, max_weight):
+    weights = dict.fromkeys(range(2, max_weight + 1), 0)
+    for data in range(1, 1 << (length - generator.bit_length() + 1)):
+        weight = bin(crc_encode(data, generator)).count('1')
+        if weight in weights:
+            weights[weight] += 1
+    return weights
+
+
+# Tests of the error detection analysis
+class TestAnalysis(unittest.TestCase):
+    def test_hamming_distance(self):
+        self.assertEqual(hamming_distance(0b1011, 7, workers=1), 3)
+        self.assertEqual(hamming_distance(0b1011, 8, workers=1), 2)
+        self.assertEqual(hamming_distance_table(0b1011, 20, workers=1), [(3, 7), (2, 20)])
+
+    def test_hamming_weights(self):
+        for generator, length in ((0b1011, 7), (0b10011, 15), (0b111010001, 15), (0b110101, 14)):
+            weights = codeword_weights(generator, length, 6)
+            self.assertEqual(hamming_weights(generator, length, 6, workers=1), weights)
+            distance = min([weight for weight, count in weights.items() if count] + [7])
+            self.assertEqual(hamming_distance(generator, length, workers=1), distance)
+
+    def test_workers(self):
+        self.assertEqual(hamming_weights(0b10011, 15, 4, workers=2), hamming_weights(0b10011, 15, 4, workers=1))
+        with self.assertRaises(ValueError):
+            hamming_distance(0b1011, 7, max_weight=7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the batch API
+from crc_otr import crc_bitwise, crc_bytes_check, crc_check_many, crc_decode_many
+from tests.test_engine import test_generators
+import os
+import random
+import unittest
+
+
+# Tests of the batch API
+class TestBatch(unittest.TestCase):
+    def test_check_many(self):
+        for generator in test_generators:
+            sequences = [random.getrandbits(random.randint(0, 300)) for _ in range(50)]
+            with self.subTest(generator=generator):
+                self.assertEqual(crc_check_many(sequences, generator),
+                                 [crc_bitwise(sequence, generator) for sequence in sequences])
+
+    # Binary numbers and byte sequences can be mixed
+    def test_mixed(self):
+        messages = [0b11011010000, 0b11011011011, os.urandom(10), b'\x06\xdb']
+        expected = [crc_bitwise(0b11011010000, 0b10101), 0, crc_bytes_check(messages[2], 0b10101), 0]
+        self.assertEqual(crc_check_many(messages, 0b10101), expected)
+        self.assertEqual(crc_decode_many(messages, 0b10101), [remainder == 0 for remainder in expected])
+
+
+if __name__ == "__main__":
+    unittest.main()
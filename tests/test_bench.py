@@ -0,0 +1,64 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the benchmark harness
+from crc_otr.bench import compare, main, measure, run_suite
+from contextlib import redirect_stderr, redirect_stdout
+import io
+import json
+import os
+import tempfile
+import unittest
+
+
+# Function to return a benchmark run with a single result
+def benchmark_run(median, p95, throughput):
+    return {'host': {'node': 'host'},
+            'results': [{'engine': 'table', 'generator': 'CRC-32', 'size': 64, 'kind': 'bytes',
+                         'median': median, 'p95': p95, 'throughput': throughput}]}
+
+
+# Tests of the benchmark harness
+class TestBench(unittest.TestCase):
+    def test_measure(self):
+        stats = measure(lambda: sum(range(100)), 0.01, 3)
+        self.assertGreaterEqual(stats['samples'], 3)
+        self.assertLessEqual(stats['min'], stats['median'])
+        self.assertLessEqual(stats['median'], stats['p95'])
+        self.assertLessEqual(stats['p95'], stats['p99'])
+        with self.assertRaises(ValueError):
+            measure(lambda: None, min_samples=0)
+
+    def test_run_suite(self):
+        results = run_suite(['table', 'bitwise'], ['CRC-8', 'CRC-32'], [64], ['int', 'bytes'], 0.001)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result['throughput'] > 0 for result in results))
+        with self.assertRaises(ValueError):
+            run_suite(['unknown'], min_time=0.001)
+
+    def test_compare(self):
+        baseline = benchmark_run(1000.0, 1100.0, 64.0)
+        self.assertEqual(compare(baseline, baseline)[0][-2:], (1.0, False))
+        # Slower beyond the threshold and the noise of the baseline
+        self.assertTrue(compare(baseline, benchmark_run(2000.0, 2100.0, 32.0))[0][-1])
+        # Slower, but within the noise of the baseline
+        self.assertFalse(compare(baseline, benchmark_run(1090.0, 1200.0, 32.0))[0][-1])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, name) for name in ('baseline.json', 'current.json')]
+            for path, run in zip(paths, (benchmark_run(1000.0, 1100.0, 64.0), benchmark_run(2000.0, 2100.0, 32.0))):
+                with open(path, 'w', encoding='utf-8') as file:
+                    json.dump(run, file)
+            with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                self.assertEqual(main(['compare', paths[0], paths[0]]), 0)
+                self.assertEqual(main(['compare', paths[0], paths[1]]), 1)
+                self.assertEqual(main(['compare', paths[0], os.path.join(directory, 'missing.json')]), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the bit sequences
+from crc_otr import BitSeq, Crc, crc_bytes, crc_check, crc_decode, crc_encode, get_spec
+from crc_otr.crc_otr import engines
+import os
+import unittest
+
+
+# Tests of the bit sequences
+class TestBitSeq(unittest.TestCase):
+    def test_sequence(self):
+        seq = BitSeq(0b0110, 4)
+        self.assertEqual(seq, BitSeq('0110'))
+        self.assertEqual((len(seq), int(seq), seq[0], seq[1], seq[-1]), (4, 6, 0, 1, 0))
+        self.assertEqual(seq[1:], BitSeq('110'))
+        self.assertEqual(seq + BitSeq('01'), BitSeq('011001'))
+        self.assertEqual(repr(BitSeq('')), "BitSeq('')")
+        for value, length in ((-1, None), (0b111, 2)):
+            with self.assertRaises(ValueError):
+                BitSeq(value, length)
+
+    def test_from_bytes(self):
+        data = bytearray(b'\x0f\xf0\xaa')
+        seq = BitSeq.from_bytes(data, 20)
+        self.assertEqual(seq, BitSeq(0x0ff0a, 20))
+        self.assertEqual(seq[8:], BitSeq(0xf0a, 12))
+        self.assertEqual(seq.to_bytes(), b'\x0f\xf0\xa0')
+        # The bytes are not copied
+        data[0] = 0xff
+        self.assertEqual(seq[0], 1)
+        whole = b'\x01\x02'
+        self.assertIs(BitSeq.from_bytes(whole).to_bytes(), whole)
+
+    # Leading zeros are kept through encoding, and do not change the remainder
+    def test_crc(self):
+        for engine in engines:
+            for bits in ('0001101101', '0', '1' * 70, '0' * 9 + '1' * 61):
+                seq = BitSeq(bits)
+                encoded = crc_encode(seq, 0b10101, engine)
+                self.assertEqual(len(encoded), len(seq) + 4)
+                self.assertEqual(int(encoded), crc_encode(int(seq), 0b10101, engine))
+                self.assertEqual(crc_check(seq, 0b10101, engine), crc_check(int(seq), 0b10101, engine))
+                self.assertTrue(crc_decode(encoded, 0b10101, engine))
+        data = b'\x00\x12\x34'
+        crc32 = 0b100000100110000010001110110110111
+        self.assertEqual(crc_check(BitSeq.from_bytes(data) + BitSeq(0, 32), crc32), crc_bytes(data, crc32))
+
+    # Byte sequence functions and incremental CRCs accept bit sequences of any length
+    def test_bytes(self):
+        data = os.urandom(100)
+        for generator in (0b10011, 0b100000111, 0b100000100110000010001110110110111):
+            width = generator.bit_length() - 1
+            for length in (0, 4, 8, 13, 800, 797):
+                for seq in (BitSeq.from_bytes(data, length), BitSeq(int(BitSeq.from_bytes(data, length)), length)):
+                    expected = crc_check(int(seq) << width, generator)
+                    for engine in (None, 'bitwise', 'bulk', 'table', 'slicing8'):
+                        with self.subTest(generator=generator, length=length, engine=engine):
+                            self.assertEqual(crc_bytes(seq, generator, engine), expected)
+                            crc = Crc(generator, seq[:length // 2], engine)
+                            crc.update(seq[length // 2:])
+                            self.assertEqual(crc.crc, expected)
+        self.assertEqual(crc_bytes(BitSeq('1011'), 0b10011), crc_check(0b10110000, 0b10011))
+        spec = get_spec('CRC-32/ISO-HDLC')
+        self.assertEqual(Crc(spec, BitSeq.from_bytes(b'123456789')).crc, spec.check)
+        with self.assertRaises(ValueError):
+            Crc(spec, BitSeq('1011'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the CRC functions working with byte sequences
+from crc_otr import crc_bitwise, crc_check, crc_bytes, crc_bytes_check, crc_bytes_decode, crc_bytes_encode
+from crc_otr.buffer import iov_chunk_size
+from crc_otr.crc_otr import engines
+from tests.test_engine import test_generators
+import os
+import tracemalloc
+import unittest
+
+
+# Tests of the byte sequence functions
+class TestBytes(unittest.TestCase):
+    # Every engine (and the dispatcher) gives the remainder of the bit-serial engine on the data as a number
+    def test_engines(self):
+        for generator in test_generators:
+            width = generator.bit_length() - 1
+            for size in list(range(18)) + [100, 3001]:
+                data = os.urandom(size)
+                expected = crc_bitwise(int.from_bytes(data, 'big') << width, generator)
+                for engine in [None] + list(engines):
+                    with self.subTest(generator=generator, size=size, engine=engine):
+                        self.assertEqual(crc_bytes(data, generator, engine), expected)
+                        self.assertEqual(crc_bytes_check(data, generator, engine),
+                                         crc_bitwise(int.from_bytes(data, 'big'), generator))
+
+    # Buffers of any type, and leading zero bytes, are preserved
+    def test_buffers(self):
+        data = b'\x00\x00' + os.urandom(100)
+        for buffer in (data, bytearray(data), memoryview(data)):
+            encoded = crc_bytes_encode(buffer)
+            self.assertEqual(encoded[:len(data)], data)
+            self.assertTrue(crc_bytes_decode(encoded))
+            self.assertFalse(crc_bytes_decode(b'\x01' + encoded[1:]))
+
+    # Degenerate generators (degree 0) fall back to the bit-serial engine, as in `crc_check`
+    def test_degree_zero(self):
+        for engine in [None] + list(engines):
+            self.assertEqual(crc_bytes(b'\x12\x34', 0b1, engine), crc_check(0x1234, 0b1, engine))
+            self.assertEqual(crc_bytes_check(b'\x12\x34', 0b1, engine), 0)
+            self.assertTrue(crc_bytes_decode(b'\x12', 0b1, engine))
+
+    # The engines working with ints (the default for long buffers) convert them in chunks, not at once
+    def test_bounded_allocation(self):
+        data = os.urandom(16 * iov_chunk_size + 3)
+        expected = crc_bytes(data, engine='slicing8')
+        for engine in (None, 'bulk', 'barrett'):
+            with self.subTest(engine=engine):
+                self.assertEqual(crc_bytes(data, engine=engine), expected)
+                tracemalloc.start()
+                try:
+                    crc_bytes(data, engine=engine)
+                    peak = tracemalloc.get_traced_memory()[1]
+                finally:
+                    tracemalloc.stop()
+                self.assertLess(peak, 4 * iov_chunk_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the precomputation cache
+from crc_otr import crc_bytes, cache_clear, cache_info, cache_resize
+from crc_otr.cache import LruCache, precomputed
+import unittest
+
+
+# Tests of the bounded LRU cache
+class TestLruCache(unittest.TestCase):
+    def test_eviction(self):
+        cache = LruCache(2)
+        self.assertEqual(cache.get('a', lambda: 1), 1)
+        self.assertEqual(cache.get('b', lambda: 2), 2)
+        self.assertEqual(cache.get('a', lambda: None), 1)  # hit: 'b' is now the least recently used
+        self.assertEqual(cache.get('c', lambda: 3), 3)
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.evictions, info.maxsize, info.currsize), (1, 3, 1, 2, 2))
+        cache.resize(1)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(cache.info().currsize, 0)
+        with self.assertRaises(ValueError):
+            LruCache(0)
+
+    # Lookup tables of the CRC engines are kept in the shared cache, within its maximum size
+    def test_precomputed(self):
+        maxsize = precomputed.maxsize
+        try:
+            cache_clear()
+            cache_resize(2)
+            for generator in (0b10011, 0b10101, 0b11001, 0b11111):
+                crc_bytes(b'\x12\x34', generator, 'table')
+            info = cache_info()
+            self.assertEqual((info.currsize, info.maxsize), (2, 2))
+            self.assertGreaterEqual(info.evictions, 2)
+            self.assertEqual(crc_bytes(b'\x6d', 0b10101, 'table'), 0b1011)
+        finally:
+            cache_resize(maxsize)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test combined CRCs
+from crc_otr import combine, crc_bytes, crc_combine, crc_parallel, crc_patch
+from concurrent.futures import ThreadPoolExecutor
+from tests.test_engine import test_generators
+import os
+import tempfile
+import unittest
+
+
+# Tests of combined CRCs
+class TestCombine(unittest.TestCase):
+    # The CRC of two blocks combined equals the CRC of their concatenation
+    def test_combine(self):
+        for generator in test_generators:
+            data = os.urandom(3000)
+            for split in (0, 1, 8, 1500, 2999, 3000):
+                with self.subTest(generator=generator, split=split):
+                    crc_a = crc_bytes(data[:split], generator)
+                    crc_b = crc_bytes(data[split:], generator)
+                    self.assertEqual(crc_combine(crc_a, crc_b, len(data) - split, generator),
+                                     crc_bytes(data, generator))
+
+    def test_parallel(self):
+        data = os.urandom(100001)
+        for workers in (1, 2, 3):
+            self.assertEqual(crc_parallel(data, workers=workers), crc_bytes(data))
+            self.assertEqual(crc_parallel(bytearray(data), 0b10101, workers), crc_bytes(data, 0b10101))
+        self.assertEqual(crc_parallel(b'', workers=2), 0)
+        with self.assertRaises(ValueError):
+            crc_parallel(data, workers=0)
+
+    # Files are mapped by the worker processes
+    def test_parallel_file(self):
+        data = os.urandom(100001)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.bin')
+            with open(path, 'wb') as file:
+                file.write(data)
+            self.assertEqual(crc_parallel(path, workers=3), crc_bytes(data))
+
+    # Concurrent calls asking for different numbers of workers share the pool, which is never replaced
+    def test_parallel_threads(self):
+        data = os.urandom(50001)
+        expected = crc_bytes(data)
+        with ThreadPoolExecutor(max_workers=4) as threads:
+            futures = [threads.submit(crc_parallel, data, workers=workers) for workers in (2, 3, 5, 8) * 3]
+            self.assertEqual([future.result() for future in futures], [expected] * 12)
+        executor = combine._executor
+        self.assertEqual(crc_parallel(data, workers=16), expected)
+        self.assertIs(combine._executor, executor)
+
+    # Patching a block changes the CRC as if the whole data were read again
+    def test_patch(self):
+        for generator in test_generators:
+            data = bytearray(os.urandom(2000))
+            crc = crc_bytes(data, generator)
+            for offset, size in ((0, 1), (3, 7), (1000, 500), (1990, 10), (2000, 0)):
+                with self.subTest(generator=generator, offset=offset, size=size):
+                    old_bytes, new_bytes = bytes(data[offset:offset + size]), os.urandom(size)
+                    data[offset:offset + size] = new_bytes
+                    crc = crc_patch(crc, offset, old_bytes, new_bytes, len(data), generator)
+                    self.assertEqual(crc, crc_bytes(data, generator))
+        for offset, old_bytes, new_bytes in ((0, b'ab', b'a'), (8, b'ab', b'xy'), (-1, b'a', b'x')):
+            with self.assertRaises(ValueError):
+                crc_patch(0, offset, old_bytes, new_bytes, 9)
+
+
+if __name__ == "__main__":
+    unittest.main()
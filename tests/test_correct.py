@@ -0,0 +1,54 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the error correction
+from crc_otr import BitSeq, crc_correct, crc_encode
+from crc_otr.correct import crc_syndromes
+import unittest
+
+
+# Tests of the error correction
+class TestCorrect(unittest.TestCase):
+    def test_single_errors(self):
+        for data in range(1 << 7):
+            frame = crc_encode(data, 0b10011)
+            self.assertEqual(crc_correct(frame, 0b10011, length=11), frame)
+            for i in range(11):
+                self.assertEqual(crc_correct(frame ^ (1 << i), 0b10011, length=11), frame)
+
+    # Error in the top bit of a frame (a leading zero of the received binary number)
+    def test_top_bit(self):
+        frame = crc_encode(0b1101101, 0b10011)
+        self.assertEqual(crc_correct(frame ^ (1 << 10), 0b10011, length=11), frame)
+        self.assertEqual(crc_correct(BitSeq(frame ^ (1 << 10), 11), 0b10011), BitSeq(frame, 11))
+
+    # BCH code with a minimum distance of 5 (every double error in a 15-bit frame is correctable)
+    def test_double_errors(self):
+        generator = 0b111010001
+        frame = crc_encode(0b1011001, generator)
+        for i in range(15):
+            for j in range(i):
+                self.assertEqual(crc_correct(frame ^ (1 << i) ^ (1 << j), generator, 2, 15), frame)
+        self.assertNotIn(None, crc_syndromes(generator, 15, 2).values())
+
+    def test_uncorrectable(self):
+        self.assertIsNone(crc_correct(0b11010011000, 0b10011, length=11))
+        with self.assertRaises(ValueError):
+            crc_correct(0b11010011001, 0b10011, 3, 11)
+
+    # Without a length, the frame is as long as the binary number (a top-bit error is then out of reach)
+    def test_default_length(self):
+        frame = crc_encode(0b1101101, 0b10011)
+        for i in range(10):
+            self.assertEqual(crc_correct(frame ^ (1 << i), 0b10011), frame)
+        self.assertNotEqual(crc_correct(frame ^ (1 << 10), 0b10011), frame)
+        with self.assertRaises(ValueError):
+            crc_correct(frame, 0b10011, length=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the engine dispatcher
+from crc_otr import crc_bytes, crc_check, last_engine, set_engine
+from crc_otr import dispatch
+import json
+import os
+import tempfile
+import unittest
+
+# CRC-32 generator polynomial
+crc32 = 0b100000100110000010001110110110111
+
+
+# Tests of the engine dispatcher
+class TestDispatch(unittest.TestCase):
+    def tearDown(self):
+        dispatch.load_config()
+        set_engine(crc32, None)
+
+    def test_config(self):
+        config = {'int': [[None, [[0, 'bulk'], [100, 'slicing4']]]], 'bytes': [[None, [[0, 'slicing16']]]]}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dispatch.json')
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(config, file)
+            self.assertEqual(dispatch.load_config(path), config)
+        self.assertEqual(dispatch.select_engine(crc32, 99), 'bulk')
+        self.assertEqual(dispatch.select_engine(crc32, 100), 'slicing4')
+        self.assertEqual(dispatch.select_engine(crc32, 8, 'bytes'), 'slicing16')
+        crc_check(1 << 200, crc32)
+        self.assertEqual(last_engine(), 'slicing4')
+        crc_bytes(b'\x12', crc32)
+        self.assertEqual(last_engine(), 'slicing16')
+
+    # Invalid config files are ignored
+    def test_invalid_config(self):
+        self.assertIs(dispatch.load_config(os.path.join(tempfile.gettempdir(), 'nonexistent.json')),
+                      dispatch.default_config)
+        with self.assertRaises(ValueError):
+            dispatch.select_engine(crc32, 8, 'float')
+
+    # Engines passed or selected with `set_engine` take precedence over the dispatcher
+    def test_precedence(self):
+        dispatch.load_config(os.path.join(tempfile.gettempdir(), 'nonexistent.json'))
+        crc_check(1 << 20000, crc32)
+        self.assertEqual(last_engine(), 'barrett')
+        crc_check(1 << 20000, crc32, 'table')
+        self.assertEqual(last_engine(), 'table')
+        set_engine(crc32, 'bulk')
+        crc_check(1 << 20000, crc32)
+        self.assertEqual(last_engine(), 'bulk')
+        self.assertEqual(dispatch.select_engine(0b1, 8), 'bitwise')
+
+
+if __name__ == "__main__":
+    unittest.main()
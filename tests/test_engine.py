@@ -0,0 +1,73 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the CRC engines against the bit-serial engine
+from crc_otr import crc_bitwise, crc_check
+import random
+import unittest
+
+# Generator polynomials of the tests (degrees 1 to 128)
+test_generators = [
+    0b11,                                       # x + 1
+    0b10101,                                    # degree 4
+    0b100000111,                                # CRC-8
+    0b11000000000000101,                        # CRC-16
+    0b100000100110000010001110110110111,        # CRC-32
+    (1 << 64) | 0x42F0E1EBA9EA3693,             # CRC-64
+    (1 << 128) | random.getrandbits(128) | 1    # random, degree 128
+]
+# Lengths of the random sequences of the tests (in bits)
+test_lengths = [0, 1, 7, 64, 1000, 5000]
+
+
+# Function to check that an engine gives the same remainders as the bit-serial engine
+def assert_engine(test, engine):
+    for generator in test_generators:
+        for length in test_lengths:
+            sequence = random.getrandbits(length)
+            with test.subTest(generator=generator, length=length, engine=engine):
+                test.assertEqual(crc_check(sequence, generator, engine), crc_bitwise(sequence, generator))
+
+
+# Tests of the table-driven engine
+class TestTable(unittest.TestCase):
+    def test_random(self):
+        assert_engine(self, 'table')
+
+    def test_examples(self):
+        self.assertEqual(crc_check(0b11011010000, 0b10101, 'table'), 0b1011)
+        self.assertEqual(crc_check(0b11011011011, 0b10101, 'table'), 0)
+
+
+# Tests of the slicing-by-N engines
+class TestSlicing(unittest.TestCase):
+    def test_random(self):
+        for engine in ('slicing4', 'slicing8', 'slicing16'):
+            assert_engine(self, engine)
+
+
+# Tests of the table-free bulk engine
+class TestBulk(unittest.TestCase):
+    def test_random(self):
+        assert_engine(self, 'bulk')
+
+
+# Tests of the Barrett reduction engine
+class TestBarrett(unittest.TestCase):
+    def test_random(self):
+        assert_engine(self, 'barrett')
+
+    # Sequences much longer than the generator (several levels of Karatsuba multiplication)
+    def test_long(self):
+        for generator in test_generators:
+            sequence = random.getrandbits(100000)
+            with self.subTest(generator=generator):
+                self.assertEqual(crc_check(sequence, generator, 'barrett'), crc_check(sequence, generator, 'bulk'))
+
+
+if __name__ == "__main__":
+    unittest.main()
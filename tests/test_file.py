@@ -0,0 +1,86 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the CRC of files and the command line program
+from crc_otr import crc_bytes, crc_file, crc_spec, get_spec
+from crc_otr.__main__ import main, resolve_generator
+from crc_otr.spec import catalogue
+from unittest import mock
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import zlib
+
+
+# Tests of the CRC of files
+class TestFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.data = os.urandom(300000)
+        self.path = os.path.join(self.directory.name, 'data.bin')
+        with open(self.path, 'wb') as file:
+            file.write(self.data)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_path(self):
+        for chunk_size in (1000, 4096, 1 << 20):
+            self.assertEqual(crc_file(self.path, chunk_size=chunk_size), crc_bytes(self.data))
+        self.assertEqual(crc_file(self.path, 0b10101), crc_bytes(self.data, 0b10101))
+
+    def test_file_object(self):
+        with open(self.path, 'rb') as file:
+            file.seek(1000)
+            self.assertEqual(crc_file(file), crc_bytes(self.data[1000:]))
+
+    def test_empty(self):
+        path = os.path.join(self.directory.name, 'empty.bin')
+        open(path, 'wb').close()
+        self.assertEqual(crc_file(path), 0)
+
+    def test_chunk_size(self):
+        with self.assertRaises(ValueError):
+            crc_file(self.path, chunk_size=0)
+
+    # Checksums printed by the command line program are verified by `--check`
+    def test_command_line(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(main([self.path]), 0)
+        line = output.getvalue()
+        self.assertTrue(line.endswith('  {}\n'.format(self.path)))
+        checksums = os.path.join(self.directory.name, 'data.crc')
+        with open(checksums, 'w', encoding='utf-8') as file:
+            file.write(line)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(main(['--check', checksums]), 0)
+        with open(self.path, 'r+b') as file:
+            file.write(b'\x00' if self.data[0] else b'\x01')
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(['--check', checksums]), 1)
+
+    # Names of generator polynomials keep the plain polynomial division, catalogue names select an algorithm
+    def test_generator_names(self):
+        for name, expected in ((None, zlib.crc32(self.data)), ('CRC-32/ISO-HDLC', zlib.crc32(self.data)),
+                               ('PKZIP', zlib.crc32(self.data)), ('CRC-32', crc_bytes(self.data)),
+                               ('CRC-8', crc_bytes(self.data, 0x1D5)), ('0b10101', crc_bytes(self.data, 0b10101)),
+                               ('crc-32/iscsi', crc_spec(self.data, 'CRC-32/ISCSI'))):
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                self.assertEqual(main([self.path] if name is None else ['-g', name, self.path]), 0)
+            self.assertEqual(int(output.getvalue().split()[0], 16), expected)
+        self.assertEqual(resolve_generator('CRC-8'), 0x1D5)
+        with mock.patch.dict(catalogue, {'CRC-8': get_spec('CRC-8/SMBUS')}):
+            with self.assertRaises(ValueError):
+                resolve_generator('CRC-8')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the persistent verification cache
+from crc_otr import FileCrcCache, crc_bytes, crc_file, get_spec
+import os
+import tempfile
+import time
+import unittest
+
+
+# Function to write a file, dated an hour back (so that it is settled and can be cached)
+def write_file(path, data, age=3600):
+    with open(path, 'wb') as file:
+        file.write(data)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+# Tests of the persistent verification cache
+class TestFileCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.directory.name, 'cache', 'files.sqlite3')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_hits(self):
+        data = os.urandom(5000)
+        write_file(self.path('a.bin'), data)
+        with FileCrcCache(self.cache_path) as cache:
+            self.assertEqual(crc_file(self.path('a.bin'), cache=cache), crc_bytes(data))
+            self.assertEqual(crc_file(self.path('a.bin'), cache=cache), crc_bytes(data))
+            # Entries are kept for each generator polynomial (or standard CRC algorithm)
+            spec = get_spec('CRC-32/ISO-HDLC')
+            self.assertEqual(crc_file(self.path('a.bin'), spec, cache=cache), crc_file(self.path('a.bin'), spec))
+            self.assertEqual(cache.info()[:2], (1, 2))
+        # Entries persist across instances
+        with FileCrcCache(self.cache_path) as cache:
+            self.assertEqual(crc_file(self.path('a.bin'), cache=cache), crc_bytes(data))
+            self.assertEqual(cache.info(), (1, 0, 0, 1000000, 2))
+
+    def test_changes(self):
+        write_file(self.path('a.bin'), b'first')
+        with FileCrcCache(self.cache_path) as cache:
+            crc_file(self.path('a.bin'), cache=cache)
+            write_file(self.path('a.bin'), b'second', 1800)
+            self.assertEqual(crc_file(self.path('a.bin'), cache=cache), crc_bytes(b'second'))
+            # Recently modified files are read, but not stored
+            write_file(self.path('b.bin'), b'recent', 0)
+            crc_file(self.path('b.bin'), cache=cache)
+            self.assertEqual(crc_file(self.path('b.bin'), cache=cache), crc_bytes(b'recent'))
+            self.assertEqual(cache.info()[:2], (0, 4))
+        with FileCrcCache(self.cache_path, rebuild=True) as cache:
+            crc_file(self.path('a.bin'), cache=cache)
+            self.assertEqual(cache.info()[:2], (0, 1))
+
+    def test_eviction(self):
+        with FileCrcCache(self.cache_path, max_entries=10) as cache:
+            for i in range(15):
+                write_file(self.path('{}.bin'.format(i)), bytes([i]))
+                crc_file(self.path('{}.bin'.format(i)), cache=cache)
+            self.assertGreater(cache.info().evictions, 0)
+            self.assertLessEqual(cache.info().currsize, 10)
+            # The most recent entry is kept
+            crc_file(self.path('14.bin'), cache=cache)
+            self.assertEqual(cache.info().hits, 1)
+        with self.assertRaises(ValueError):
+            FileCrcCache(self.cache_path, max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the computations of the GUI (no display is needed)
+from crc_otr import BitSeq, crc_bytes
+from crc_otr.generators import get_generator
+from unittest import mock
+import os
+import queue
+import tempfile
+import threading
+import unittest
+
+try:
+    import gui
+except ImportError:  # Tkinter is not available
+    gui = None
+
+
+# Variable holding a value (in place of the Tkinter variables, which need a window)
+class Variable:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+# Function to run a computation of the GUI, and return its messages
+def compute(action, mode, sequence_text, generator_text):
+    messages = queue.Queue()
+    gui.compute(action, mode, sequence_text, generator_text, threading.Event(), messages)
+    return [messages.get() for _ in range(messages.qsize())]
+
+
+# Tests of the computations of the GUI
+@unittest.skipIf(gui is None, 'Tkinter is not available')
+class TestGui(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(gui.parse_digits('0011', 'Binary'), BitSeq('0011'))
+        self.assertEqual(gui.parse_digits('0a', 'Hex'), BitSeq(0xa, 8))
+        for text, mode in (('', 'Binary'), ('012', 'Binary'), ('0x1', 'Hex')):
+            with self.assertRaises(ValueError):
+                gui.parse_digits(text, mode)
+        self.assertEqual(gui.parse_generator('10101', 'Binary'), 0b10101)
+        self.assertEqual(gui.parse_generator('15', 'Hex'), 0x15)
+        self.assertEqual(gui.parse_generator('CRC-32', 'Binary'), get_generator('CRC-32'))
+        # Names are resolved before digits, and other bases need a prefix
+        self.assertEqual(gui.parse_generator('crc-8', 'Hex'), get_generator('CRC-8'))
+        self.assertEqual(gui.parse_generator('0x1D5', 'Binary'), 0x1D5)
+        self.assertEqual(gui.parse_generator('0b10101', 'Hex'), 0b10101)
+        for text, mode in (('123', 'Binary'), ('CRC-99', 'Hex')):
+            with self.assertRaises(ValueError):
+                gui.parse_generator(text, mode)
+        self.assertEqual(gui.format_digits(BitSeq('0011'), 'Binary'), '0b0011')
+        self.assertEqual(gui.format_digits(BitSeq(0xa, 8), 'Hex'), '0x0a')
+
+    def test_compute(self):
+        self.assertEqual(compute('encode', 'Binary', '1101101', '10101'), [('result', "ENCODED!\n0b11011011011")])
+        self.assertEqual(compute('decode', 'Binary', '11011011011', '10101'), [('result', "DECODED!\nTrue")])
+        self.assertEqual(compute('encode', 'Binary', '1102', '10101'), [('result', "ERROR!\nInvalid input.")])
+
+    def test_compute_file(self):
+        data = os.urandom(3 * gui.chunk_size // 2)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.bin')
+            with open(path, 'wb') as file:
+                file.write(data)
+            messages = compute('encode', 'File', path, 'CRC-32')
+            self.assertEqual([message[0] for message in messages], ['progress', 'progress', 'result'])
+            self.assertEqual(messages[-1][1], "CHECKSUM!\n{:08x}".format(crc_bytes(data)))
+            self.assertEqual(compute('encode', 'File', os.path.join(directory, 'missing.bin'), 'CRC-32'),
+                             [('result', "ERROR!\nCannot read file.")])
+
+    # Errors of the file dialog are shown in the result label, not in the information sequence
+    def test_open_error(self):
+        textbox, mode, result = Variable('10101'), Variable('Binary'), Variable('')
+        with mock.patch.object(gui.filedialog, 'askopenfilename', side_effect=RuntimeError):
+            gui.keyboard_function_open(textbox, mode, result)
+        self.assertEqual((textbox.get(), mode.get(), result.get()), ('10101', 'Binary', "ERROR!\nCannot open file."))
+        with mock.patch.object(gui.filedialog, 'askopenfilename', return_value='data.bin'):
+            gui.keyboard_function_open(textbox, mode, result)
+        self.assertEqual((textbox.get(), mode.get()), ('data.bin', 'File'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the instrumentation of CRC functions
+from crc_otr import Crc, crc_check, stats_disable, stats_enable, stats_reset, stats_snapshot
+import unittest
+
+
+# Tests of the instrumentation of CRC functions
+class TestInstrument(unittest.TestCase):
+    def setUp(self):
+        stats_reset()
+
+    def tearDown(self):
+        stats_disable()
+        stats_reset()
+
+    def test_counts(self):
+        stats_enable()
+        for _ in range(3):
+            crc_check(0b11011010000, 0b10101, 'table')
+        Crc(0b10101, bytes(1000))
+        stats = stats_snapshot()[0b10101]
+        self.assertEqual(stats['table']['calls'], 3)
+        self.assertEqual(sum(stats['table']['histogram']), 3)
+        self.assertEqual(sum(entry['calls'] for entry in stats.values()), 4)
+        self.assertEqual(sum(entry['bytes'] for entry in stats.values()) - stats['table']['bytes'], 1000)
+
+    def test_callback(self):
+        calls = []
+        stats_enable(lambda *measurement: calls.append(measurement))
+        crc_check(0b11011010000, 0b10101, 'bitwise')
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][:2], (0b10101, 'bitwise'))
+        with self.assertRaises(ValueError):
+            stats_enable(1)
+
+    def test_disable(self):
+        stats_enable()
+        crc_check(0b11011010000, 0b10101)
+        stats_disable()
+        crc_check(0b11011010000, 0b10101)
+        snapshot = stats_snapshot()
+        self.assertEqual(sum(entry['calls'] for entry in snapshot[0b10101].values()), 1)
+        # Snapshots are copies
+        snapshot.clear()
+        self.assertIn(0b10101, stats_snapshot())
+        stats_reset()
+        self.assertEqual(stats_snapshot(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
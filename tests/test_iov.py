@@ -0,0 +1,57 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the CRC of messages held in several buffers
+from crc_otr import BitSeq, crc_bytes, crc_check, crc_iov
+from crc_otr.buffer import iov_chunk_size
+from crc_otr.crc_otr import engines
+from tests.test_engine import test_generators
+import os
+import tracemalloc
+import unittest
+
+
+# Tests of the CRC of messages held in several buffers
+class TestIov(unittest.TestCase):
+    def test_buffers(self):
+        buffers = [b'header', bytearray(os.urandom(1000)), memoryview(os.urandom(333)), b'', b'trailer']
+        message = b''.join(buffers)
+        for generator in test_generators:
+            self.assertEqual(crc_iov(buffers, generator), crc_bytes(message, generator))
+            for engine in engines:
+                self.assertEqual(crc_iov(iter(buffers), generator, engine), crc_bytes(message, generator, engine))
+        self.assertEqual(crc_iov([]), 0)
+
+    # Fragments of any number of bits, aligned or not
+    def test_bit_sequences(self):
+        bits = BitSeq.from_bytes(os.urandom(40), 317)
+        for generator in test_generators:
+            width = generator.bit_length() - 1
+            expected = crc_check(int(bits) << width, generator)
+            for cuts in ((0, 317), (3, 11, 64, 200), (8, 16, 317)):
+                edges = (0,) + cuts + (317,)
+                fragments = [bits[start:stop] for start, stop in zip(edges, edges[1:])]
+                self.assertEqual(crc_iov(fragments, generator), expected)
+            self.assertEqual(crc_iov([BitSeq.from_bytes(b'\x6d'), b'\x6d'], generator),
+                             crc_bytes(b'\x6d\x6d', generator))
+
+    # Long buffers are fed to the engines working with ints in chunks, not converted at once
+    def test_bounded_allocation(self):
+        payload = os.urandom(8 * iov_chunk_size)
+        for engine in (None, 'bulk', 'barrett'):
+            crc_iov([b'header', payload], engine=engine)
+            tracemalloc.start()
+            try:
+                crc_iov([b'header', payload], engine=engine)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak, 4 * iov_chunk_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the rolling CRC
+from crc_otr import RollingCrc, crc_boundaries, crc_bytes
+import os
+import unittest
+
+
+# Function to return the chunk boundaries by calculating the CRC of every window
+def window_boundaries(data, window, mask, generator, min_size=0, max_size=None):
+    boundaries, start = [], 0
+    for end in range(1, len(data) + 1):
+        size = end - start
+        if crc_bytes(data[max(0, end - window):end], generator) & mask == mask and size >= min_size \
+                or size == max_size:
+            boundaries.append(end)
+            start = end
+    if start < len(data):
+        boundaries.append(len(data))
+    return boundaries
+
+
+# Tests of the rolling CRC
+class TestRolling(unittest.TestCase):
+    def test_roll(self):
+        data = os.urandom(300)
+        for generator in (0b10101, 0b100000111, 0b11000000000000101, 0b100000100110000010001110110110111):
+            for window in (1, 4, 48):
+                rolling = RollingCrc(window, generator, data[:window])
+                self.assertEqual(rolling.crc, crc_bytes(data[:window], generator))
+                for i in range(window, len(data)):
+                    rolling.roll(data[i - window], data[i])
+                    self.assertEqual(rolling.crc, crc_bytes(data[i - window + 1:i + 1], generator))
+        with self.assertRaises(ValueError):
+            RollingCrc(4, data=b'abc')
+
+    def test_boundaries(self):
+        data = bytes(range(256)) * 4
+        self.assertEqual(list(crc_boundaries(data, 16, 0x3f)),
+                         [63, 251, 264, 319, 507, 520, 575, 763, 776, 831, 1019, 1024])
+        data = os.urandom(3000)
+        generator = 0b11000000000000101
+        for min_size, max_size in ((0, None), (50, None), (0, 40), (20, 100)):
+            self.assertEqual(list(crc_boundaries(data, 16, 0x1f, generator, min_size, max_size)),
+                             window_boundaries(data, 16, 0x1f, generator, min_size, max_size))
+        self.assertEqual(list(crc_boundaries(b'')), [])
+        for window, mask, generator in ((0, 1, 0b100000111), (16, 0x100, 0b100000111), (16, 1, 0b10101)):
+            with self.assertRaises(ValueError):
+                crc_boundaries(data, window, mask, generator)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the standard CRC algorithms
+from crc_otr import Crc, crc_spec, get_spec, last_engine
+from crc_otr.spec import aliases, catalogue
+import unittest
+
+
+# Tests of the standard CRC algorithms
+class TestSpecs(unittest.TestCase):
+    # Every algorithm of the catalogue reproduces its published check value (CRC of b'123456789')
+    def test_check_values(self):
+        for spec in catalogue.values():
+            for engine in (None, 'table', 'slicing4', 'slicing8', 'slicing16'):
+                with self.subTest(spec=spec.name, engine=engine):
+                    self.assertEqual(crc_spec(b'123456789', spec, engine), spec.check)
+            crc = Crc(spec, b'1234')
+            crc.update(b'56789')
+            self.assertEqual(crc.crc, spec.check)
+
+    def test_names(self):
+        for alias, name in aliases.items():
+            self.assertIs(get_spec(alias), catalogue[name])
+        self.assertEqual(crc_spec(b'123456789', 'CRC-32/ISO-HDLC'), 0xCBF43926)
+        with self.assertRaises(ValueError):
+            get_spec('CRC-0/NONE')
+
+    # Engines working MSB-first with ints are replaced by the reflected slicing-by-8 engine
+    def test_int_engines(self):
+        spec = get_spec('CRC-32/ISO-HDLC')
+        for engine in ('bitwise', 'bulk', 'barrett'):
+            self.assertEqual(crc_spec(b'123456789', spec, engine), spec.check)
+            self.assertEqual(last_engine(), 'slicing8')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the store of precomputed lookup tables
+from crc_otr import store
+from crc_otr.engine import _crc_table, _extend_tables
+from crc_otr.spec import catalogue
+import os
+import tempfile
+import unittest
+
+
+# Function to compute the slicing-by-8 tables stored for a generator polynomial
+def computed_tables(generator, reflected):
+    return _extend_tables([_crc_table(generator, reflected)], generator, 8, reflected)
+
+
+# Tests of the store of precomputed lookup tables
+class TestStore(unittest.TestCase):
+    # A store written by `build_store` returns the computed tables
+    def test_build(self):
+        generators = [(0b100000100110000010001110110110111, False), (0b100000100110000010001110110110111, True),
+                      ((1 << 64) | 0x42F0E1EBA9EA3693, False), (0b10101, False)]
+        path, index = store.store_path, store._index
+        with tempfile.TemporaryDirectory() as directory:
+            try:
+                store.store_path, store._index = os.path.join(directory, 'tables.bin'), None
+                self.assertEqual(store.build_store(store.store_path, generators), 3)
+                for generator, reflected in generators[:3]:
+                    tables = computed_tables(generator, reflected)
+                    self.assertEqual(store.load_tables(generator, reflected), tables)
+                    self.assertEqual(store.load_tables(generator, reflected, 1), tables[:1])
+                self.assertIsNone(store.load_tables(0b10101))
+            finally:
+                store.store_path, store._index = path, index
+
+    # The tables shipped with the package are the computed ones
+    def test_shipped(self):
+        if store.load_tables(0b100000100110000010001110110110111) is None:
+            self.skipTest('No store of precomputed lookup tables')
+        for generator, reflected in store._index:
+            with self.subTest(generator=generator, reflected=reflected):
+                self.assertEqual(store.load_tables(generator, reflected), computed_tables(generator, reflected))
+
+    # Standard CRC algorithms are stored in their own bit order
+    def test_stored_generators(self):
+        generators = store.stored_generators()
+        self.assertEqual(len(generators), len(set(generators)))
+        for spec in catalogue.values():
+            self.assertIn((spec.generator, spec.refin), generators)
+        self.assertIn((0b111010101, False), generators)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the incremental CRC object
+from crc_otr import Crc, crc_bytes
+from crc_otr.crc_otr import engines
+from tests.test_engine import test_generators
+import os
+import random
+import unittest
+
+
+# Tests of the incremental CRC object
+class TestCrc(unittest.TestCase):
+    # Streams fed in chunks of any size give the CRC of the whole message
+    def test_chunks(self):
+        for generator in test_generators:
+            data = os.urandom(5000)
+            for engine in [None] + list(engines):
+                crc = Crc(generator, engine=engine)
+                offset = 0
+                while offset < len(data):
+                    size = random.randint(0, 700)
+                    crc.update(data[offset:offset + size])
+                    offset += size
+                with self.subTest(generator=generator, engine=engine):
+                    self.assertEqual(crc.crc, crc_bytes(data, generator))
+
+    def test_digest(self):
+        crc = Crc(0b10101, b'\x6d')
+        self.assertEqual((crc.crc, crc.digest(), crc.hexdigest()), (0b1011, b'\x0b', '0b'))
+        copy = crc.copy()
+        copy.update(b'\x00')
+        self.assertEqual((crc.crc, copy.crc), (0b1011, crc_bytes(b'\x6d\x00', 0b10101)))
+
+
+if __name__ == "__main__":
+    unittest.main()
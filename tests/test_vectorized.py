@@ -0,0 +1,57 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Created By  : Uros Bojanic
+# Created Date: 2022/03/14
+# ---------------------------------------------------------------------------
+
+# Python program to test the NumPy backend
+from crc_otr import crc_bytes, crc_bytes_check
+from crc_otr import vectorized
+from tests.test_engine import test_generators
+import os
+import tracemalloc
+import unittest
+
+
+# Tests of the NumPy backend (the same results as the byte sequence functions)
+@unittest.skipIf(vectorized.np is None, 'NumPy is not installed')
+class TestFrames(unittest.TestCase):
+    def test_array(self):
+        np = vectorized.np
+        for frame_bytes in (1, 3, 12):
+            frames = np.frombuffer(os.urandom(20 * frame_bytes), dtype=np.uint8).reshape(20, frame_bytes)
+            for generator in test_generators[:6]:
+                with self.subTest(frame_bytes=frame_bytes, generator=generator):
+                    self.assertEqual(list(vectorized.crc_frames(frames, generator)),
+                                     [crc_bytes(frame, generator) for frame in frames])
+                    self.assertEqual(list(vectorized.crc_frames_check(frames, generator)),
+                                     [crc_bytes_check(frame, generator) for frame in frames])
+                    self.assertEqual(list(vectorized.crc_frames_decode(frames, generator)),
+                                     [crc_bytes_check(frame, generator) == 0 for frame in frames])
+
+    def test_list_of_bytes(self):
+        frames = [os.urandom(12) for _ in range(20)]
+        self.assertEqual(list(vectorized.crc_frames(frames)), [crc_bytes(frame) for frame in frames])
+        self.assertEqual(list(vectorized.crc_frames_check([bytearray(frame) for frame in frames], 0b10101)),
+                         [crc_bytes_check(frame, 0b10101) for frame in frames])
+        with self.assertRaises(ValueError):
+            vectorized.crc_frames([b'\x00\x01', b'\x02'])
+
+    # Frames stay bytes: only one column at a time is widened to 64 bits
+    def test_bounded_allocation(self):
+        np = vectorized.np
+        frames = np.frombuffer(os.urandom(4096 * 512), dtype=np.uint8).reshape(4096, 512)
+        for function in (vectorized.crc_frames, vectorized.crc_frames_check):
+            function(frames[:1], 0b100000100110000010001110110110111)
+            tracemalloc.start()
+            try:
+                function(frames, 0b100000100110000010001110110110111)
+                peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            self.assertLess(peak, frames.nbytes)
+
+
+if __name__ == "__main__":
+    unittest.main()